@@ -0,0 +1,187 @@
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from scoring import MISSING_LEVEL, category_index, question_layout, score_levels, score_table
+from whatif import score_bands
+
+# Person-days per level for recommendations without an estimate in the question bank
+DEFAULT_EFFORT = 5
+
+
+def effort_vector(questions: Dict, recommendation_effort: Optional[Dict[int, int]] = None) -> np.ndarray:
+    """Effort per one-level raise of every question, in questionnaire order."""
+    recommendation_effort = recommendation_effort or {}
+    n_questions = len(question_layout(questions))
+    efforts = np.array([recommendation_effort.get(i + 1, DEFAULT_EFFORT) for i in range(n_questions)], dtype=np.int64)
+    if (efforts <= 0).any():
+        raise ValueError("Recommendation effort must be a positive whole number of person-days")
+    return efforts
+
+
+def question_weights(questions: Dict) -> np.ndarray:
+    """
+    Weight of every question's score in the overall score.
+
+    The overall score is the mean of category means, so it is linear in the question
+    scores and the gains of changes to different questions simply add up.
+    """
+    cat_idx = category_index(questions)
+    return 1.0 / (len(questions) * np.bincount(cat_idx)[cat_idx])
+
+
+def optimize_plans(
+    levels: np.ndarray,
+    questions: Dict,
+    response_options: Dict,
+    efforts: np.ndarray,
+    budget: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Best answer raises under an effort budget for a batch of audits.
+
+    This is a multiple-choice knapsack: every question is a group whose options are
+    raising it by 1..L-1 scale steps at that many times its effort, and at most one
+    option per group is taken. The dynamic program runs over questions with one
+    (audits, budget + 1) table, vectorized across audits, so the cost is
+    O(questions x levels x budget) array operations whatever the batch size. The
+    decision table takes questions x audits x (budget + 1) bytes, so very large
+    batches should be passed in chunks.
+
+    Args:
+        levels: Fully answered audits, shape (audits, questions) or (questions,)
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        efforts: Person-days per one-level raise of each question (see effort_vector)
+        budget: Person-days available per audit
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Target levels with the same shape as levels,
+        and the projected overall score gain per audit
+    """
+    levels = np.asarray(levels, dtype=np.uint8)
+    single = levels.ndim == 1
+    levels = np.atleast_2d(levels)
+    if (levels == MISSING_LEVEL).any():
+        raise ValueError("Action plans need fully answered audits")
+    budget = max(int(budget), 0)
+    n_audits, n_questions = levels.shape
+    table = score_table(questions, response_options)
+    n_levels = table.shape[1]
+    weights = question_weights(questions)
+    # Scale steps follow score order, so raising one step always means the next better answer
+    order = np.argsort(table, axis=1, kind="stable")
+    rank = np.argsort(order, axis=1)
+    rows = np.arange(n_audits)
+
+    best = np.zeros((n_audits, budget + 1))
+    choices = np.zeros((n_questions, n_audits, budget + 1), dtype=np.uint8)
+    for q in range(n_questions):
+        current_rank = rank[q, levels[:, q]]
+        current_score = table[q, levels[:, q]]
+        updated = best.copy()
+        for steps in range(1, n_levels):
+            cost = steps * int(efforts[q])
+            if cost > budget:
+                break
+            target_rank = current_rank + steps
+            valid = target_rank < n_levels
+            gain = np.full(n_audits, -np.inf)
+            gain[valid] = weights[q] * (table[q, order[q, target_rank[valid]]] - current_score[valid])
+            candidate = best[:, :budget + 1 - cost] + gain[:, None]
+            better = candidate > updated[:, cost:]
+            updated[:, cost:] = np.where(better, candidate, updated[:, cost:])
+            choices[q, :, cost:] = np.where(better, steps, choices[q, :, cost:])
+        best = updated
+
+    # Walk the decisions back from the full budget
+    targets = levels.copy()
+    remaining = np.full(n_audits, budget)
+    for q in range(n_questions - 1, -1, -1):
+        steps = choices[q, rows, remaining].astype(np.int64)
+        raised = steps > 0
+        targets[raised, q] = order[q, rank[q, levels[raised, q]] + steps[raised]]
+        remaining -= steps * int(efforts[q])
+    gains = best[:, budget]
+    return (targets[0], gains[0]) if single else (targets, gains)
+
+
+def plan_actions(
+    levels: Sequence[int],
+    questions: Dict,
+    response_options: Dict,
+    thresholds: Dict,
+    budget: int,
+    recommendation_effort: Optional[Dict[int, int]] = None
+) -> pd.DataFrame:
+    """
+    Action plan for one audit: the recommendations to implement within the budget.
+
+    Returns:
+        pd.DataFrame: One row per chosen question with "question" (position in
+        questionnaire order), "category", "from_level", "to_level", "effort", "gain"
+        and "overall" (projected overall score once this and all earlier rows are
+        done), ordered by gain per person-day; attrs hold "base_overall",
+        "projected_overall", "grade_up", "total_effort" and "budget"
+    """
+    base = np.asarray(levels, dtype=np.uint8)
+    efforts = effort_vector(questions, recommendation_effort)
+    targets, _ = optimize_plans(base, questions, response_options, efforts, budget)
+    table = score_table(questions, response_options)
+    weights = question_weights(questions)
+    layout = question_layout(questions)
+    chosen = np.flatnonzero(targets != base)
+    rank = np.argsort(np.argsort(table, axis=1, kind="stable"), axis=1)
+    plan = pd.DataFrame({
+        "question": chosen,
+        "category": [layout[q][0] for q in chosen],
+        "from_level": base[chosen],
+        "to_level": targets[chosen],
+        "effort": [int(efforts[q]) * int(rank[q, targets[q]] - rank[q, base[q]]) for q in chosen],
+        "gain": [weights[q] * (table[q, targets[q]] - table[q, base[q]]) for q in chosen],
+    })
+    _, base_overall = score_levels(base[None, :], questions, response_options)
+    _, projected = score_levels(targets[None, :], questions, response_options)
+    if not plan.empty:
+        plan = plan.assign(efficiency=plan["gain"] / plan["effort"])
+        plan = plan.sort_values(["efficiency", "question"], ascending=[False, True]).drop(columns="efficiency")
+        plan["overall"] = base_overall[0] + plan["gain"].cumsum()
+    else:
+        plan["overall"] = pd.Series(dtype=float)
+    plan = plan.reset_index(drop=True)
+    plan.attrs.update({
+        "base_overall": float(base_overall[0]),
+        "projected_overall": float(projected[0]),
+        "grade_up": bool(score_bands(projected, thresholds)[0] > score_bands(base_overall, thresholds)[0]),
+        "total_effort": int(plan["effort"].sum()) if not plan.empty else 0,
+        "budget": int(budget),
+    })
+    return plan
+
+
+def action_plan_frame(
+    plan: pd.DataFrame,
+    questions: Dict,
+    response_options: Dict,
+    language: str,
+    labels: Dict,
+    category_mapping: Dict
+) -> pd.DataFrame:
+    """Localized view of plan_actions with the recommendation text and answer descriptions."""
+    layout = question_layout(questions)
+    display_names = {v: k for k, v in category_mapping[language].items()}
+    rows = []
+    for item in plan.itertuples(index=False):
+        cat, q_idx, q_type = layout[item.question]
+        descriptions = response_options[q_type][language]["descriptions"]
+        rows.append({
+            labels["suggestion"]: questions[cat][language][q_idx][2],
+            labels["category"]: display_names[cat],
+            labels["question"]: item.question + 1,
+            labels["improvement_change"]: f"{descriptions[item.from_level]} → {descriptions[item.to_level]}",
+            labels["effort_days"]: item.effort,
+            labels["improvement_gain"]: round(float(item.gain), 1),
+            labels["overall_score"]: round(float(item.overall), 1),
+        })
+    return pd.DataFrame(rows)
@@ -0,0 +1,566 @@
+import abc
+import argparse
+import itertools
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from audit_archive import AuditArchive
+from audit_data import load_static_data
+from screening import (
+    SCREENED_OUT, FingerprintIndex, add_moments, answer_fingerprints, moments_reference, organization_moments, screen_levels
+)
+from scoring import MISSING_LEVEL, category_index, decode_answer_matrix, question_layout, score_levels, score_table
+from whatif import score_bands
+
+logger = logging.getLogger(__name__)
+
+OVERALL_LABEL = "Overall"
+
+
+def question_labels(questions: Dict) -> List[str]:
+    """Short labels "Q1", "Q2", ... in questionnaire order."""
+    return [f"Q{i + 1}" for i in range(len(question_layout(questions)))]
+
+
+class StreamingCovariance:
+    """
+    One-pass mean and covariance of fixed-length vectors.
+
+    Batches are folded in with the pairwise (Chan et al.) form of Welford's update,
+    so memory stays O(dim^2) however many rows are consumed and the result matches a
+    two-pass computation without the cancellation of naive sums of squares.
+
+    Args:
+        dim: Vector length
+    """
+
+    def __init__(self, dim: int):
+        self.n = 0
+        self.mean = np.zeros(dim)
+        self.comoment = np.zeros((dim, dim))
+
+    def update(self, batch: np.ndarray) -> None:
+        """Add the rows of a (rows, dim) array without missing values."""
+        batch = np.asarray(batch, dtype=np.float64)
+        m = batch.shape[0]
+        if m == 0:
+            return
+        batch_mean = batch.mean(axis=0)
+        centered = batch - batch_mean
+        delta = batch_mean - self.mean
+        total = self.n + m
+        self.comoment += centered.T @ centered + np.outer(delta, delta) * (self.n * m / total)
+        self.mean += delta * (m / total)
+        self.n = total
+
+    def merge(self, other: "StreamingCovariance") -> None:
+        """Combine with another accumulator, e.g. from a parallel worker."""
+        if other.n == 0:
+            return
+        delta = other.mean - self.mean
+        total = self.n + other.n
+        self.comoment += other.comoment + np.outer(delta, delta) * (self.n * other.n / total)
+        self.mean += delta * (other.n / total)
+        self.n = total
+
+    def covariance(self) -> np.ndarray:
+        if self.n < 2:
+            return np.full_like(self.comoment, np.nan)
+        return self.comoment / (self.n - 1)
+
+    def correlation(self) -> np.ndarray:
+        cov = self.covariance()
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = cov / np.outer(std, std)
+        # Constant variables (e.g. every respondent gave the same answer) have no correlation
+        corr[~np.isfinite(corr)] = np.nan
+        return np.clip(corr, -1, 1)
+
+
+class ArchiveAggregate(abc.ABC):
+    """
+    Base for aggregates that are kept up to date from the audit archive.
+
+    refresh() reads only audits archived since the previous call and hands them to
+    update_levels() as a (audits, questions) level array, with the values of the
+    aggregate's dimensions for every audit. Audits flagged as invalid,
+    straight-lined or duplicate by screening are left out. Counted audits cannot
+    be taken back out, so when the archive's revision moves (an audit was
+    replaced or its quality flags changed) the aggregate is cleared and rebuilt.
+
+    Args:
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+    """
+
+    exclude_flags = SCREENED_OUT
+    # Archive columns whose values update_levels() receives per audit
+    dimensions: Tuple[str, ...] = ()
+
+    def __init__(self, questions: Dict, response_options: Dict):
+        self.questions = questions
+        self.response_options = response_options
+        self.n_questions = len(question_layout(questions))
+        self.last_rowid = 0
+        # Archive revision the aggregate was built at; None until the first refresh
+        self.revision: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Reset the aggregated state to that of an empty archive."""
+
+    @abc.abstractmethod
+    def update_levels(self, levels: np.ndarray, keys: Sequence[tuple]) -> None:
+        """Add audits given as a (audits, questions) level array and one tuple of dimension values per audit."""
+
+    def refresh(
+        self,
+        archive: AuditArchive,
+        organization: Optional[str] = None,
+        chunk_size: int = 50000,
+        campaign: Optional[str] = None
+    ) -> int:
+        """
+        Consume audits archived since the last refresh.
+
+        Returns:
+            int: Number of audits read
+        """
+        read = 0
+        with self._lock:
+            revision = archive.revision()
+            if revision != self.revision:
+                if self.last_rowid:
+                    logger.info("%s rebuilding: archived audits changed (revision %s -> %d)", type(self).__name__, self.revision, revision)
+                self.clear()
+                self.last_rowid = 0
+                self.revision = revision
+            chunks = archive.iter_dimensions(self.dimensions, self.last_rowid, chunk_size, self.exclude_flags, organization, campaign)
+            for last_rowid, answers, keys in chunks:
+                # decode_answer_matrix drops other questionnaire versions; keep keys aligned
+                keys = [key for key, a in zip(keys, answers) if len(a) == self.n_questions]
+                self.update_levels(decode_answer_matrix(answers, self.n_questions), keys)
+                self.last_rowid = last_rowid
+                read += len(answers)
+        if read:
+            logger.info("%s consumed %d audits", type(self).__name__, read)
+        return read
+
+
+class QuestionCorrelation(ArchiveAggregate):
+    """
+    Streaming question-to-question and question-to-category correlation of archived audits.
+
+    Each audit contributes one vector of question scores, category scores and the
+    overall score. Only fully answered audits are used, so every pair of variables
+    is computed over the same respondents.
+
+    Args:
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+    """
+
+    def __init__(self, questions: Dict, response_options: Dict):
+        super().__init__(questions, response_options)
+        self.labels = question_labels(questions) + list(questions) + [OVERALL_LABEL]
+        self._table = score_table(questions, response_options)
+        self.clear()
+
+    def clear(self) -> None:
+        self.moments = StreamingCovariance(len(self.labels))
+        self.incomplete = 0
+
+    def update_levels(self, levels: np.ndarray, keys: Sequence[tuple] = ()) -> None:
+        """Add audits given as a (audits, questions) level array."""
+        complete = ~(levels == MISSING_LEVEL).any(axis=1)
+        levels = levels[complete]
+        self.incomplete += int((~complete).sum())
+        if not len(levels):
+            return
+        question_scores = self._table[np.arange(self.n_questions), levels]
+        cat_scores, overall = score_levels(levels, self.questions, self.response_options)
+        self.moments.update(np.column_stack([question_scores, cat_scores, overall]))
+
+    @property
+    def count(self) -> int:
+        return self.moments.n
+
+    def covariance(self) -> pd.DataFrame:
+        return pd.DataFrame(self.moments.covariance(), index=self.labels, columns=self.labels)
+
+    def correlation(self) -> pd.DataFrame:
+        return pd.DataFrame(self.moments.correlation(), index=self.labels, columns=self.labels)
+
+    def drivers(self) -> pd.DataFrame:
+        """
+        Per question: mean score, correlation with the rest of its own category and
+        correlation with the overall score, sorted by the latter.
+
+        The own-category correlation leaves the question itself out of the category
+        score (corrected item-total correlation); otherwise every question would
+        correlate with its category just by being part of it.
+        """
+        cov = self.moments.covariance()
+        q_labels = self.labels[:self.n_questions]
+        cat_idx = category_index(self.questions)
+        sizes = np.bincount(cat_idx)
+        overall = len(self.labels) - 1
+        rows = []
+        for q, c in enumerate(cat_idx):
+            k = sizes[c]
+            cat = self.n_questions + c
+            var_q = cov[q, q]
+            corr_overall = cov[q, overall] / np.sqrt(var_q * cov[overall, overall]) if var_q > 0 else np.nan
+            if k > 1:
+                # Category score = mean of its k questions; "rest" = sum of the other k - 1
+                cov_rest = k * cov[q, cat] - var_q
+                var_rest = k * k * cov[cat, cat] - 2 * k * cov[q, cat] + var_q
+                corr_rest = cov_rest / np.sqrt(var_q * var_rest) if var_q > 0 and var_rest > 0 else np.nan
+            else:
+                corr_rest = np.nan
+            rows.append({
+                "question": q_labels[q],
+                "category": self.labels[cat],
+                "mean_score": self.moments.mean[q],
+                "category_correlation": corr_rest,
+                "overall_correlation": corr_overall,
+            })
+        return pd.DataFrame(rows).sort_values("overall_correlation", ascending=False, na_position="last").reset_index(drop=True)
+
+
+class ScoreDistribution(ArchiveAggregate):
+    """
+    Streaming distribution of category and overall scores of archived audits.
+
+    Scores are counted in fine fixed-width bins over 0-100, so memory does not grow
+    with the number of respondents. Coarser histograms are sums of fine bins, and
+    quantiles are read off the cumulative counts to within one fine bin. Each
+    category counts every audit that answered all of its questions.
+
+    Args:
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        resolution: Width of the fine bins in score points
+    """
+
+    def __init__(self, questions: Dict, response_options: Dict, resolution: float = 0.25):
+        super().__init__(questions, response_options)
+        self.labels = list(questions) + [OVERALL_LABEL]
+        self.n_fine = int(round(100 / resolution))
+        self.resolution = 100 / self.n_fine
+        self.clear()
+
+    def clear(self) -> None:
+        self.counts = np.zeros((len(self.labels), self.n_fine), dtype=np.int64)
+        self.sums = np.zeros(len(self.labels))
+
+    def update_levels(self, levels: np.ndarray, keys: Sequence[tuple] = ()) -> None:
+        if not len(levels):
+            return
+        cat_scores, overall = score_levels(levels, self.questions, self.response_options)
+        scores = np.column_stack([cat_scores, overall])
+        valid = ~np.isnan(scores)
+        fine = np.minimum((np.where(valid, scores, 0) / self.resolution).astype(np.int64), self.n_fine - 1)
+        # One bincount over (variable, bin) pairs updates every histogram at once
+        flat = (np.arange(len(self.labels)) * self.n_fine + fine)[valid]
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+        self.sums += np.where(valid, scores, 0).sum(axis=0)
+
+    @property
+    def totals(self) -> np.ndarray:
+        return self.counts.sum(axis=1)
+
+    def means(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.sums / self.totals
+
+    def histogram(self, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Counts in `bins` equal-width bins over 0-100.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Bin edges (bins + 1,) and counts (variables, bins)
+        """
+        edges = np.linspace(0, 100, bins + 1)
+        # Assign every fine bin to the coarse bin holding its left edge
+        coarse = np.minimum((np.arange(self.n_fine) * self.resolution * bins / 100).astype(np.int64), bins - 1)
+        counts = np.zeros((len(self.labels), bins), dtype=np.int64)
+        np.add.at(counts, (slice(None), coarse), self.counts)
+        return edges, counts
+
+    def quantiles(self, probabilities: Sequence[float]) -> np.ndarray:
+        """Approximate quantiles per variable, shape (variables, len(probabilities)); NaN without data."""
+        cumulative = np.cumsum(self.counts, axis=1)
+        result = np.full((len(self.labels), len(probabilities)), np.nan)
+        for v, total in enumerate(self.totals):
+            if total:
+                fine = np.searchsorted(cumulative[v], np.asarray(probabilities) * total, side="left")
+                result[v] = (np.minimum(fine, self.n_fine - 1) + 0.5) * self.resolution
+        return result
+
+    def box_stats(self) -> pd.DataFrame:
+        """Quartiles, Tukey fences clipped to the observed range, mean and count per variable."""
+        q1, median, q3 = self.quantiles([0.25, 0.5, 0.75]).T
+        observed = self.counts > 0
+        low = np.where(observed.any(axis=1), observed.argmax(axis=1) * self.resolution, np.nan)
+        high = np.where(observed.any(axis=1), (self.n_fine - observed[:, ::-1].argmax(axis=1)) * self.resolution, np.nan)
+        iqr = q3 - q1
+        return pd.DataFrame({
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "lower_fence": np.maximum(q1 - 1.5 * iqr, low),
+            "upper_fence": np.minimum(q3 + 1.5 * iqr, high),
+            "mean": self.means(),
+            "count": self.totals,
+        }, index=self.labels)
+
+
+# Drill-down hierarchy of archive columns, coarsest first
+DRILL_DIMENSIONS = ("organization", "site", "department", "role")
+
+
+class DrillDownCube(ArchiveAggregate):
+    """
+    Precomputed count, sum and sum of squares of category and overall scores for
+    every combination of drill-down dimension values, including "all" (None).
+
+    Each batch of audits is grouped once by its finest cell (one value per
+    dimension), and every group is then rolled up into the cells that leave any
+    subset of dimensions open, so any slice is a dictionary lookup. A child index
+    maps every cell and open dimension to the values present below it, so
+    breakdowns and value lists only touch the cells they return. A category
+    counts every audit that answered all of its questions.
+
+    Args:
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        dimensions: Archive columns to slice by
+    """
+
+    def __init__(self, questions: Dict, response_options: Dict, dimensions: Sequence[str] = DRILL_DIMENSIONS):
+        super().__init__(questions, response_options)
+        self.dimensions = tuple(dimensions)
+        self.labels = list(questions) + [OVERALL_LABEL]
+        self._masks = list(itertools.product((False, True), repeat=len(self.dimensions)))
+        self.clear()
+
+    def clear(self) -> None:
+        # cell -> (3, variables) array of count, sum and sum of squares
+        self.cells: Dict[Tuple, np.ndarray] = {}
+        # (dimension position, cell with that dimension open) -> values of the dimension within the cell
+        self.children: Dict[Tuple[int, Tuple], set] = {}
+
+    def update_levels(self, levels: np.ndarray, keys: Sequence[tuple]) -> None:
+        """Add audits given as a (audits, questions) level array and their dimension values."""
+        if not len(levels):
+            return
+        cat_scores, overall = score_levels(levels, self.questions, self.response_options)
+        scores = np.column_stack([cat_scores, overall])
+        valid = ~np.isnan(scores)
+        scores = np.where(valid, scores, 0)
+        codes, uniques = pd.factorize(pd.Series(list(keys), dtype=object))
+        n_cells = len(uniques)
+        stats = np.zeros((n_cells, 3, len(self.labels)))
+        for v in range(len(self.labels)):
+            stats[:, 0, v] = np.bincount(codes, weights=valid[:, v], minlength=n_cells)
+            stats[:, 1, v] = np.bincount(codes, weights=scores[:, v], minlength=n_cells)
+            stats[:, 2, v] = np.bincount(codes, weights=scores[:, v] ** 2, minlength=n_cells)
+        for key, cell_stats in zip(uniques, stats):
+            for mask in self._masks:
+                cell = tuple(value if keep else None for value, keep in zip(key, mask))
+                if cell in self.cells:
+                    self.cells[cell] += cell_stats
+                else:
+                    self.cells[cell] = cell_stats.copy()
+                    for position, value in enumerate(cell):
+                        if value is not None:
+                            parent = cell[:position] + (None,) + cell[position + 1:]
+                            self.children.setdefault((position, parent), set()).add(value)
+
+    def _cell(self, filters: Dict[str, Optional[str]]) -> tuple:
+        unknown = set(filters) - set(self.dimensions)
+        if unknown:
+            raise ValueError(f"Unknown drill-down dimensions: {sorted(unknown)}")
+        return tuple(filters.get(dim) for dim in self.dimensions)
+
+    @staticmethod
+    def _summary(stats: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        count, total, squares = stats
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+            std = np.sqrt(np.maximum(squares - total * mean, 0) / (count - 1))
+        return count, mean, np.where(count > 1, std, np.nan)
+
+    def slice(self, **filters: Optional[str]) -> pd.DataFrame:
+        """
+        Statistics of one slice, e.g. slice(organization="Acme", department="Operations");
+        dimensions left out or None cover all values.
+
+        Returns:
+            pd.DataFrame: "count", "mean" and "std" per category and overall
+        """
+        stats = self.cells.get(self._cell(filters))
+        count, mean, std = self._summary(stats if stats is not None else np.zeros((3, len(self.labels))))
+        return pd.DataFrame({"count": count.astype(np.int64), "mean": mean, "std": std}, index=self.labels)
+
+    def breakdown(self, dimension: str, **filters: Optional[str]) -> pd.DataFrame:
+        """
+        Mean scores of every value of one dimension within a slice.
+
+        Returns:
+            pd.DataFrame: One row per dimension value with "count" (audits) and the
+            mean of every category and overall, sorted by value
+        """
+        target = self._cell({**filters, dimension: None})
+        position = self.dimensions.index(dimension)
+        rows = {}
+        for value in self.children.get((position, target), ()):
+            count, mean, _ = self._summary(self.cells[target[:position] + (value,) + target[position + 1:]])
+            rows[value] = [int(count.max())] + list(mean)
+        frame = pd.DataFrame.from_dict(rows, orient="index", columns=["count"] + self.labels)
+        return frame.sort_index()
+
+    def values(self, dimension: str, **filters: Optional[str]) -> List[str]:
+        """Values of a dimension present within a slice, sorted."""
+        position = self.dimensions.index(dimension)
+        return sorted(self.children.get((position, self._cell({**filters, dimension: None})), ()))
+
+
+class CampaignRollup(ArchiveAggregate):
+    """
+    Running response count and category score sums of one survey campaign.
+
+    Every refresh reads only the campaign's audits archived since the previous
+    one (through the archive's campaign index), so keeping the rollup current
+    costs in proportion to the new submissions, not to the campaign's size,
+    however many respondents are submitting at once. A category counts every
+    audit that answered all of its questions.
+
+    Args:
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        campaign_id: Campaign whose audits are rolled up
+    """
+
+    def __init__(self, questions: Dict, response_options: Dict, campaign_id: str):
+        super().__init__(questions, response_options)
+        self.campaign_id = campaign_id
+        self.labels = list(questions) + [OVERALL_LABEL]
+        self.clear()
+
+    def clear(self) -> None:
+        self.responses = 0
+        self.counts = np.zeros(len(self.labels), dtype=np.int64)
+        self.sums = np.zeros(len(self.labels))
+
+    def refresh(
+        self,
+        archive: AuditArchive,
+        organization: Optional[str] = None,
+        chunk_size: int = 50000,
+        campaign: Optional[str] = None
+    ) -> int:
+        return super().refresh(archive, organization, chunk_size, self.campaign_id)
+
+    def update_levels(self, levels: np.ndarray, keys: Sequence[tuple] = ()) -> None:
+        if not len(levels):
+            return
+        cat_scores, overall = score_levels(levels, self.questions, self.response_options)
+        scores = np.column_stack([cat_scores, overall])
+        valid = ~np.isnan(scores)
+        self.responses += len(levels)
+        self.counts += valid.sum(axis=0)
+        self.sums += np.where(valid, scores, 0).sum(axis=0)
+
+    def summary(self, thresholds: Dict) -> pd.DataFrame:
+        """
+        Rollup per category and overall.
+
+        Returns:
+            pd.DataFrame: "count", "mean" and "band" (whatif.score_bands of the mean,
+            -1 without data) per category in questions order plus OVERALL_LABEL
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = self.sums / self.counts
+        bands = np.where(self.counts > 0, score_bands(means, thresholds), -1)
+        return pd.DataFrame({"count": self.counts, "mean": means, "band": bands}, index=self.labels)
+
+
+class ArchiveScreening(ArchiveAggregate):
+    """
+    Duplicate fingerprints and per-organization overall score distribution of the
+    archive, for screening new audits against everything already archived.
+
+    Every archived audit of this questionnaire is fingerprinted; the score
+    distribution of each organization only counts audits that are not
+    SCREENED_OUT, as screening.screen_archive does. Like the other aggregates it
+    folds in only audits archived since the last refresh, so audits archived by
+    other worker processes are seen too.
+
+    Args:
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        min_group: Organizations with fewer clean archived audits get no archived reference
+    """
+
+    exclude_flags = 0
+    dimensions = ("organization", "quality_flags")
+
+    def __init__(self, questions: Dict, response_options: Dict, min_group: int = 20):
+        super().__init__(questions, response_options)
+        self.min_group = min_group
+        self.clear()
+
+    def clear(self) -> None:
+        self.index = FingerprintIndex()
+        # organization -> count, sum and sum of squares of clean overall scores
+        self.sums: Dict[str, np.ndarray] = {}
+
+    def update_levels(self, levels: np.ndarray, keys: Sequence[tuple]) -> None:
+        if not len(levels):
+            return
+        organizations = np.array([key[0] for key in keys], dtype=object)
+        clean = (np.array([key[1] for key in keys], dtype=np.int64) & SCREENED_OUT) == 0
+        self.index.add(answer_fingerprints(levels, organizations))
+        add_moments(self.sums, organization_moments(levels[clean], organizations[clean], self.questions, self.response_options))
+
+    def reference(self) -> Dict[str, Tuple[float, float]]:
+        """Overall score (mean, std) per organization, as screening.screen_levels takes it."""
+        return moments_reference(self.sums, self.min_group)
+
+    def screen(self, levels: np.ndarray, organizations: Sequence[str]) -> np.ndarray:
+        """
+        Quality flags of new audits: duplicates of archived audits (or of each
+        other) and outliers against their organization's archived distribution.
+        Their fingerprints are added, so a repeat before the next refresh is caught too.
+        """
+        with self._lock:
+            return screen_levels(levels, self.questions, self.response_options, organizations, self.index, self.reference(), min_group=self.min_group)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Question correlation and driver analysis of archived audits.")
+    parser.add_argument("--archive", default=os.getenv("AUDIT_ARCHIVE_PATH", "data/audits.db"))
+    parser.add_argument("--organization", default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format='%(asctime)s - %(levelname)s - %(message)s')
+
+    questions, response_options = load_static_data()
+    analysis = QuestionCorrelation(questions, response_options)
+    analysis.refresh(AuditArchive(args.archive), args.organization)
+    print(f"{analysis.count} complete audits ({analysis.incomplete} incomplete skipped)")
+    print(analysis.drivers().head(args.top).to_string(float_format=lambda x: f"{x:.3f}"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,361 @@
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Columns of an archived audit, in table order
+ARCHIVE_COLUMNS = (
+    "report_id",
+    "submitted_at",
+    "source",
+    "language",
+    "organization",
+    "site",
+    "department",
+    "role",
+    "answers",
+    "overall_score",
+    "quality_flags",
+    "campaign",
+)
+
+# Columns of a survey campaign
+CAMPAIGN_COLUMNS = ("campaign_id", "name", "organization", "created_at")
+
+
+class AuditArchive:
+    """
+    SQLite archive of submitted audits shared by the app and the batch tools.
+
+    Each record is a dict keyed by ARCHIVE_COLUMNS; "answers" holds the answer
+    levels in questionnaire order as produced by scoring.encode_answers.
+
+    Args:
+        path: SQLite database file, created on first use
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS audits (
+                    report_id TEXT PRIMARY KEY,
+                    submitted_at TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    organization TEXT NOT NULL DEFAULT '',
+                    site TEXT NOT NULL DEFAULT '',
+                    department TEXT NOT NULL DEFAULT '',
+                    role TEXT NOT NULL DEFAULT '',
+                    answers TEXT NOT NULL,
+                    overall_score REAL,
+                    quality_flags INTEGER NOT NULL DEFAULT 0,
+                    campaign TEXT NOT NULL DEFAULT ''
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS campaigns (
+                    campaign_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    organization TEXT NOT NULL DEFAULT '',
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+            # Counters shared by every process using the archive, e.g. its revision
+            self._conn.execute("CREATE TABLE IF NOT EXISTS archive_state (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            # Archives created before these columns existed
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(audits)")}
+            for column, definition in (("site", "TEXT NOT NULL DEFAULT ''"), ("role", "TEXT NOT NULL DEFAULT ''"), ("quality_flags", "INTEGER NOT NULL DEFAULT 0"), ("campaign", "TEXT NOT NULL DEFAULT ''")):
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE audits ADD COLUMN {column} {definition}")
+            # Campaign rollups read only their own audits past a rowid
+            self._conn.execute("CREATE INDEX IF NOT EXISTS audits_campaign ON audits (campaign)")
+        self._insert_columns = ", ".join(ARCHIVE_COLUMNS)
+
+    def _row(self, record: Dict) -> tuple:
+        if "submitted_at" not in record:
+            record = {**record, "submitted_at": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+        record = {
+            "source": "web",
+            "organization": "",
+            "site": "",
+            "department": "",
+            "role": "",
+            "overall_score": None,
+            "quality_flags": 0,
+            "campaign": "",
+            **record,
+        }
+        return tuple(record[column] for column in ARCHIVE_COLUMNS)
+
+    def _bump_revision(self) -> None:
+        """Record a change to already archived audits; call inside the transaction making it."""
+        self._conn.execute(
+            "INSERT INTO archive_state (name, value) VALUES ('revision', 1) ON CONFLICT (name) DO UPDATE SET value = value + 1"
+        )
+
+    def revision(self) -> int:
+        """
+        Number of changes to already archived audits: replaced answers and changed quality flags.
+
+        Appending audits leaves it unchanged, so incremental consumers that read by
+        rowid only need to start over when it moves.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM archive_state WHERE name = 'revision'").fetchone()
+        return row[0] if row else 0
+
+    def add(self, record: Dict) -> None:
+        """Archive one audit; resubmitting a report_id replaces the earlier answers and bumps the revision."""
+        placeholders = ", ".join("?" * len(ARCHIVE_COLUMNS))
+        row = self._row(record)
+        with self._lock, self._conn:
+            replaced = self._conn.execute("DELETE FROM audits WHERE report_id = ?", (row[0],)).rowcount
+            self._conn.execute(f"INSERT INTO audits ({self._insert_columns}) VALUES ({placeholders})", row)
+            if replaced:
+                self._bump_revision()
+
+    def add_many(self, records: Iterable[Dict], batch_size: int = 5000) -> int:
+        """
+        Bulk-load audits in batched transactions, skipping report_ids already archived.
+
+        Args:
+            records: Iterable of audit records
+            batch_size: Rows per transaction
+
+        Returns:
+            int: Number of new audits stored
+        """
+        placeholders = ", ".join("?" * len(ARCHIVE_COLUMNS))
+        sql = f"INSERT OR IGNORE INTO audits ({self._insert_columns}) VALUES ({placeholders})"
+        inserted = 0
+        batch: List[tuple] = []
+
+        def flush():
+            nonlocal inserted
+            with self._lock, self._conn:
+                before = self._conn.total_changes
+                self._conn.executemany(sql, batch)
+                inserted += self._conn.total_changes - before
+            batch.clear()
+
+        for record in records:
+            batch.append(self._row(record))
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+        logger.info("Archived %d new audits in %s", inserted, self.path)
+        return inserted
+
+    @staticmethod
+    def _filters(organization: Optional[str], campaign: Optional[str]) -> Tuple[str, tuple]:
+        """SQL conditions (each prefixed with AND) and parameters restricting audits to an organization and campaign."""
+        conditions = [(column, value) for column, value in (("organization", organization), ("campaign", campaign)) if value is not None]
+        return "".join(f" AND {column} = ?" for column, _ in conditions), tuple(value for _, value in conditions)
+
+    def count(self, organization: Optional[str] = None, campaign: Optional[str] = None) -> int:
+        conditions, params = self._filters(organization, campaign)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM audits WHERE 1{conditions}", params).fetchone()[0]
+
+    def iter_records(
+        self,
+        chunk_size: int = 10000,
+        organization: Optional[str] = None,
+        campaign: Optional[str] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Stream archived audits in insertion order, one chunk of records at a time.
+
+        Args:
+            chunk_size: Records per yielded chunk
+            organization: Restrict to one organization
+            campaign: Restrict to one campaign
+
+        Yields:
+            List[Dict]: Up to chunk_size audit records
+        """
+        conditions, filter_params = self._filters(organization, campaign)
+        where = "WHERE rowid > ?" + conditions
+        last_rowid = 0
+        while True:
+            params = (last_rowid, *filter_params)
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT rowid, {', '.join(ARCHIVE_COLUMNS)} FROM audits {where} ORDER BY rowid LIMIT {int(chunk_size)}",
+                    params
+                ).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            yield [dict(zip(ARCHIVE_COLUMNS, row[1:])) for row in rows]
+
+    def iter_answers(
+        self,
+        after_rowid: int = 0,
+        chunk_size: int = 50000,
+        organization: Optional[str] = None,
+        exclude_flags: int = 0,
+        campaign: Optional[str] = None
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Stream encoded answers of audits archived after a given rowid.
+
+        Incremental consumers keep the returned rowid and pass it back next time,
+        so each audit is read once however large the archive grows. Audits with any
+        of the exclude_flags quality flags (see screening.QUALITY_FLAGS) are skipped.
+
+        Yields:
+            Tuple[int, List[str]]: Last rowid of the chunk and its encoded answers
+        """
+        conditions, filter_params = self._filters(organization, campaign)
+        where = "WHERE rowid > ?" + conditions
+        where += f" AND quality_flags & {int(exclude_flags)} = 0" if exclude_flags else ""
+        last_rowid = after_rowid
+        while True:
+            params = (last_rowid, *filter_params)
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT rowid, answers FROM audits {where} ORDER BY rowid LIMIT {int(chunk_size)}",
+                    params
+                ).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            yield last_rowid, [row[1] for row in rows]
+
+    def iter_dimensions(
+        self,
+        dimensions: Sequence[str],
+        after_rowid: int = 0,
+        chunk_size: int = 50000,
+        exclude_flags: int = 0,
+        organization: Optional[str] = None,
+        campaign: Optional[str] = None
+    ) -> Iterator[Tuple[int, List[str], List[tuple]]]:
+        """
+        Like iter_answers, with the values of the given columns for every audit.
+
+        Yields:
+            Tuple[int, List[str], List[tuple]]: Last rowid of the chunk, its encoded
+            answers and one tuple of dimension values per audit
+        """
+        unknown = set(dimensions) - set(ARCHIVE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown archive columns: {sorted(unknown)}")
+        selected = ", ".join(["rowid", "answers", *dimensions])
+        conditions, filter_params = self._filters(organization, campaign)
+        where = "WHERE rowid > ?" + conditions
+        where += f" AND quality_flags & {int(exclude_flags)} = 0" if exclude_flags else ""
+        last_rowid = after_rowid
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {selected} FROM audits {where} ORDER BY rowid LIMIT {int(chunk_size)}",
+                    (last_rowid, *filter_params)
+                ).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            yield last_rowid, [row[1] for row in rows], [row[2:] for row in rows]
+
+    def set_quality_flags(self, flags: Iterable[Tuple[str, int]], batch_size: int = 5000) -> int:
+        """
+        Store (report_id, quality_flags) pairs in batched transactions.
+
+        Every batch that changes a stored value bumps the revision.
+
+        Returns:
+            int: Number of audits whose flags changed
+        """
+        batch: List[Tuple[int, str, int]] = []
+        changed = 0
+
+        def flush():
+            nonlocal changed
+            with self._lock, self._conn:
+                before = self._conn.total_changes
+                self._conn.executemany("UPDATE audits SET quality_flags = ? WHERE report_id = ? AND quality_flags != ?", batch)
+                updated = self._conn.total_changes - before
+                if updated:
+                    self._bump_revision()
+            changed += updated
+            batch.clear()
+
+        for report_id, value in flags:
+            batch.append((int(value), report_id, int(value)))
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+        return changed
+
+    def quality_counts(self, organization: Optional[str] = None) -> Dict[int, int]:
+        """Number of flagged audits per quality_flags value."""
+        where = "WHERE quality_flags != 0" + (" AND organization = ?" if organization is not None else "")
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT quality_flags, COUNT(*) FROM audits {where} GROUP BY quality_flags",
+                (organization,) if organization is not None else ()
+            ).fetchall()
+        return dict(rows)
+
+    def organizations(self) -> List[str]:
+        """Distinct non-empty organizations, sorted."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT organization FROM audits WHERE organization != '' ORDER BY organization").fetchall()
+        return [row[0] for row in rows]
+
+    def create_campaign(self, name: str, organization: str = "") -> str:
+        """
+        Register a survey campaign; respondents submit under the returned campaign_id.
+
+        Campaign IDs are random and URL-safe, so a respondent link cannot be guessed
+        from another campaign's.
+        """
+        campaign_id = secrets.token_urlsafe(9)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO campaigns (campaign_id, name, organization, created_at) VALUES (?, ?, ?, ?)",
+                (campaign_id, name, organization, datetime.now(timezone.utc).isoformat(timespec="seconds"))
+            )
+        logger.info("Created campaign %s (%s) for %r", campaign_id, name, organization)
+        return campaign_id
+
+    def campaign(self, campaign_id: str) -> Optional[Dict]:
+        """The campaign's "campaign_id", "name", "organization" and "created_at"; None when unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(CAMPAIGN_COLUMNS)} FROM campaigns WHERE campaign_id = ?", (campaign_id,)
+            ).fetchone()
+        return dict(zip(CAMPAIGN_COLUMNS, row)) if row else None
+
+    def campaigns(self, organization: Optional[str] = None) -> List[Dict]:
+        """Campaigns, newest first, optionally of one organization."""
+        where = "WHERE organization = ?" if organization is not None else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(CAMPAIGN_COLUMNS)} FROM campaigns {where} ORDER BY created_at DESC, rowid DESC",
+                (organization,) if organization is not None else ()
+            ).fetchall()
+        return [dict(zip(CAMPAIGN_COLUMNS, row)) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
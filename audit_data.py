@@ -0,0 +1,216 @@
+from typing import Dict, Tuple
+
+
+def load_static_data() -> Tuple[Dict, Dict]:
+    questions = {
+        "Empoderamiento de Empleados": {
+            "Español": [
+                ("¿Qué porcentaje de sugerencias de empleados presentadas en los últimos 12 meses fueron implementadas con resultados documentados?", "percentage", "Establece un sistema formal para rastrear e implementar sugerencias de empleados con métricas claras."),
+                ("¿Cuántos empleados recibieron capacitación en habilidades profesionales en el último año?", "count", "Aumenta las oportunidades de capacitación profesional para todos los empleados."),
+                ("En los últimos 12 meses, ¿cuántos empleados lideraron proyectos o iniciativas con presupuesto asignado?", "count", "Asigna presupuestos a más iniciativas lideradas por empleados para fomentar la innovación."),
+                ("¿Con qué frecuencia se realizan foros formales para que los empleados compartan retroalimentación con la gerencia?", "frequency", "Programa foros mensuales para retroalimentación directa entre empleados y gerencia.")
+            ],
+            "English": [
+                ("What percentage of employee suggestions submitted in the past 12 months were implemented with documented outcomes?", "percentage", "Establish a formal system to track and implement employee suggestions with clear metrics."),
+                ("How many employees received professional skills training in the past year?", "count", "Increase professional training opportunities for all employees."),
+                ("In the past 12 months, how many employees led projects or initiatives with allocated budgets?", "count", "Allocate budgets to more employee-led initiatives to foster innovation."),
+                ("How frequently are formal forums or meetings held for employees to share feedback with management?", "frequency", "Schedule monthly forums for direct employee-management feedback.")
+            ]
+        },
+        "Liderazgo Ético": {
+            "Español": [
+                ("¿Con qué frecuencia los líderes compartieron actualizaciones escritas sobre decisiones que afectan a los empleados en los últimos 12 meses?", "frequency", "Implementa boletines mensuales para comunicar decisiones de liderazgo de manera transparente."),
+                ("¿Qué porcentaje de políticas laborales nuevas o revisadas en el último año incluyó consulta formal con empleados?", "percentage", "Incluye a representantes de empleados en la revisión de todas las políticas laborales nuevas."),
+                ("¿Cuántos casos de comportamiento ético destacado fueron reconocidos formalmente en los últimos 12 meses?", "count", "Crea un programa formal de reconocimiento para comportamientos éticos, con incentivos claros.")
+            ],
+            "English": [
+                ("How frequently did leaders share written updates on decisions affecting employees in the past 12 months?", "frequency", "Implement monthly newsletters to transparently communicate leadership decisions."),
+                ("What percentage of new or revised workplace policies in the past year included formal employee consultation?", "percentage", "Include employee representatives in reviewing all new workplace policies."),
+                ("How many instances of exemplary ethical behavior were formally recognized in the past 12 months?", "count", "Create a formal recognition program for ethical behavior with clear incentives.")
+            ]
+        },
+        "Operaciones Centradas en las Personas": {
+            "Español": [
+                ("¿Qué porcentaje de procesos lean revisados en los últimos 12 meses incorporó retroalimentación de empleados para reducir tareas redundantes?", "percentage", "Integra retroalimentación de empleados en cada revisión de procesos lean para eliminar redundancias."),
+                ("¿Con qué frecuencia se auditan las prácticas operativas para evaluar su impacto en el bienestar de los empleados?", "frequency", "Realiza auditorías trimestrales de prácticas operativas con enfoque en el bienestar."),
+                ("¿Cuántos empleados recibieron capacitación en herramientas lean con énfasis en colaboración en el último año?", "count", "Capacita a todos los empleados en herramientas lean, priorizando la colaboración.")
+            ],
+            "English": [
+                ("What percentage of lean processes revised in the past 12 months incorporated employee feedback to reduce redundant tasks?", "percentage", "Integrate employee feedback into every lean process review to eliminate redundancies."),
+                ("How frequently are operational practices audited to assess their impact on employee well-being?", "frequency", "Conduct quarterly audits of operational practices focusing on well-being."),
+                ("How many employees received training on lean tools emphasizing collaboration in the past year?", "count", "Train all employees on lean tools, prioritizing collaboration.")
+            ]
+        },
+        "Prácticas Sostenibles y Éticas": {
+            "Español": [
+                ("¿Qué porcentaje de iniciativas lean implementadas en los últimos 12 meses redujo el consumo de recursos?", "percentage", "Lanza iniciativas lean específicas para reducir el consumo de recursos, con metas medibles."),
+                ("¿Qué porcentaje de proveedores principales fueron auditados en el último año para verificar estándares laborales y ambientales?", "percentage", "Audita anualmente a todos los proveedores principales para garantizar estándares éticos."),
+                ("¿Cuántos empleados participaron en proyectos de sostenibilidad con impacto comunitario o laboral en los últimos 12 meses?", "count", "Involucra a más empleados en proyectos de sostenibilidad con impacto comunitario.")
+            ],
+            "English": [
+                ("What percentage of lean initiatives implemented in the past 12 months reduced resource consumption?", "percentage", "Launch specific lean initiatives to reduce resource consumption with measurable goals."),
+                ("What percentage of primary suppliers were audited in the past year to verify labor and environmental standards?", "percentage", "Audit all primary suppliers annually to ensure ethical standards."),
+                ("How many employees participated in sustainability projects with community or workplace impact in the past 12 months?", "count", "Engage more employees in sustainability projects with community impact.")
+            ]
+        },
+        "Bienestar y Equilibrio": {
+            "Español": [
+                ("¿Qué porcentaje de empleados accedió a recursos de bienestar en los últimos 12 meses?", "percentage", "Amplía el acceso a recursos de bienestar, como asesoramiento y horarios flexibles."),
+                ("¿Con qué frecuencia se realizan encuestas o revisiones para evaluar el agotamiento o la fatiga de los empleados?", "frequency", "Implementa encuestas mensuales para monitorear el agotamiento y actuar rápidamente."),
+                ("¿Cuántos casos de desafíos personales o profesionales reportados por empleados fueron abordados con planes de acción documentados en el último año?", "count", "Establece procesos formales para abordar desafíos reportados por empleados con planes de acción documentados.")
+            ],
+            "English": [
+                ("What percentage of employees accessed well-being resources in the past 12 months?", "percentage", "Expand access to well-being resources, such as counseling and flexible schedules."),
+                ("How frequently are surveys or check-ins conducted to assess employee burnout or fatigue?", "frequency", "Implement monthly surveys to monitor burnout and act swiftly."),
+                ("How many reported employee personal or professional challenges were addressed with documented action plans in the past year?", "count", "Establish formal processes to address reported challenges with action plans.")
+            ]
+        },
+        "Iniciativas Organizacionales Centradas en las Personas": {
+            "Español": [
+                ("En nuestra organización se han implementado o se están explorando tecnologías como Industria 4.0, Inteligencia Artificial, robótica o automatización digital con el propósito de mejorar tanto la eficiencia operativa como las condiciones laborales del personal.", "frequency", "Desarrolla un plan estratégico para integrar tecnologías como IA y robótica, priorizando el impacto positivo en las condiciones laborales."),
+                ("Contamos con metodologías de excelencia operacional (Lean, Six Sigma, TPM, etc.) que no solo buscan eficiencia y calidad, sino que también integran activamente el bienestar del personal en su diseño e implementación.", "frequency", "Rediseña las metodologías de excelencia operacional para incluir métricas de bienestar del personal en cada fase."),
+                ("Antes de implementar nuevas tecnologías o iniciativas (sociales, ambientales u operativas), se consulta al personal para asegurar que los cambios beneficien su experiencia y condiciones laborales.", "frequency", "Establece un proceso formal de consulta con los empleados antes de implementar cualquier nueva tecnología o iniciativa."),
+                ("Las iniciativas actuales (tecnológicas, sociales y operativas) han contribuido de forma tangible a un ambiente laboral más saludable, inclusivo y respetuoso para todos los colaboradores.", "frequency", "Evalúa regularmente el impacto de las iniciativas en el ambiente laboral y ajusta según retroalimentación de los empleados.")
+            ],
+            "English": [
+                ("Our organization has implemented or is exploring technologies such as Industry 4.0, AI, robotics, or digital automation to enhance both operational efficiency and employee working conditions.", "frequency", "Develop a strategic plan to integrate technologies like AI and robotics, prioritizing positive impacts on working conditions."),
+                ("We have operational excellence methodologies (Lean, Six Sigma, TPM, etc.) that not only pursue efficiency and quality but also actively integrate employee well-being into their design and implementation.", "frequency", "Redesign operational excellence methodologies to include employee well-being metrics in every phase."),
+                ("Before implementing new technologies or initiatives (social, environmental, or operational), employees are consulted to ensure changes benefit their experience and working conditions.", "frequency", "Establish a formal employee consultation process before implementing any new technology or initiative."),
+                ("Current initiatives (technological, social, and operational) have tangibly contributed to a healthier, more inclusive, and respectful workplace for all employees.", "frequency", "Regularly evaluate the impact of initiatives on the workplace environment and adjust based on employee feedback.")
+            ]
+        },
+        "Impacto Humano de Procesos Lean": {
+            "Español": [
+                ("¿Qué porcentaje de sugerencias de mejora de empleados fue implementado con impacto positivo en la carga mental o emocional del trabajo?", "percentage", "Implementa un sistema para priorizar y rastrear sugerencias que reduzcan la carga mental o emocional."),
+                ("¿Con qué frecuencia la alta dirección comunica cómo las decisiones lean impactan en el bienestar, seguridad y desarrollo del personal?", "frequency", "Establece comunicaciones regulares de la alta dirección sobre el impacto de decisiones lean en el personal."),
+                ("¿Con qué frecuencia se evalúan los efectos de los cambios lean sobre la fatiga, carga cognitiva o sentido de propósito de los empleados?", "frequency", "Realiza evaluaciones trimestrales del impacto de cambios lean en fatiga, carga cognitiva y propósito."),
+                ("¿Qué porcentaje de procesos rediseñados eliminó tareas percibidas como sin sentido, humillantes o redundantes por los trabajadores?", "percentage", "Incluye retroalimentación de empleados en el rediseño de procesos para eliminar tareas sin valor."),
+                ("¿Qué porcentaje de proyectos lean en los últimos 12 meses incluyó objetivos explícitos de equidad, inclusión o sostenibilidad humana?", "percentage", "Define objetivos de equidad e inclusión en todos los proyectos lean con métricas claras.")
+            ],
+            "English": [
+                ("What percentage of employee improvement suggestions were implemented with a positive impact on mental or emotional workload?", "percentage", "Implement a system to prioritize and track suggestions that reduce mental or emotional workload."),
+                ("How frequently does senior management communicate how lean decisions impact employee well-being, safety, and development?", "frequency", "Establish regular communications from senior management on the impact of lean decisions on employees."),
+                ("How frequently are the effects of lean changes evaluated on employee fatigue, cognitive load, or sense of purpose?", "frequency", "Conduct quarterly evaluations of lean changes’ impact on fatigue, cognitive load, and purpose."),
+                ("What percentage of redesigned processes eliminated tasks perceived as meaningless, humiliating, or redundant by workers?", "percentage", "Include employee feedback in process redesigns to eliminate valueless tasks."),
+                ("What percentage of lean projects in the past 12 months included explicit goals for equity, inclusion, or human sustainability?", "percentage", "Define equity and inclusion goals in all lean projects with clear metrics.")
+            ]
+        }
+    }
+
+    response_options = {
+        "percentage": {
+            "Español": {
+                "descriptions": [
+                    "Ninguna sugerencia/proceso fue implementado.",
+                    "Aproximadamente una cuarta parte fue implementada.",
+                    "La mitad fue implementada.",
+                    "Tres cuartas partes fueron implementadas.",
+                    "Todas las sugerencias/procesos fueron implementados."
+                ],
+                "scores": [0, 25, 50, 75, 100],
+                "tooltip": "Selecciona la descripción que mejor refleje la proporción de casos aplicados."
+            },
+            "English": {
+                "descriptions": [
+                    "No suggestions/processes were implemented.",
+                    "About one-quarter were implemented.",
+                    "Half were implemented.",
+                    "Three-quarters were implemented.",
+                    "All suggestions/processes were implemented."
+                ],
+                "scores": [0, 25, 50, 75, 100],
+                "tooltip": "Select the description that best reflects the proportion of cases applied."
+            }
+        },
+        "frequency": {
+            "Español": {
+                "descriptions": [
+                    "Esto nunca ocurre.",
+                    "Ocurre muy pocas veces al año.",
+                    "Ocurre varias veces al año.",
+                    "Ocurre regularmente, casi siempre.",
+                    "Ocurre en cada oportunidad."
+                ],
+                "scores": [0, 25, 50, 75, 100],
+                "tooltip": "Selecciona la descripción que mejor refleje la frecuencia de la práctica."
+            },
+            "English": {
+                "descriptions": [
+                    "This never occurs.",
+                    "Occurs very few times a year.",
+                    "Occurs several times a year.",
+                    "Occurs regularly, almost always.",
+                    "Occurs every time."
+                ],
+                "scores": [0, 25, 50, 75, 100],
+                "tooltip": "Select the description that best reflects the frequency of the practice."
+            }
+        },
+        "count": {
+            "Español": {
+                "descriptions": [
+                    "Ningún empleado o caso (0%).",
+                    "Menos de un cuarto de los empleados (1-25%).",
+                    "Entre un cuarto y la mitad (25-50%).",
+                    "Más de la mitad pero no la mayoría (50-75%).",
+                    "Más del 75% de los empleados o casos."
+                ],
+                "scores": [0, 25, 50, 75, 100],
+                "tooltip": "Selecciona la descripción que mejor refleje la cantidad de empleados o casos afectados."
+            },
+            "English": {
+                "descriptions": [
+                    "No employees or cases (0%).",
+                    "Less than a quarter of employees (1-25%).",
+                    "Between a quarter and half (25-50%).",
+                    "More than half but not most (50-75%).",
+                    "Over 75% of employees or cases."
+                ],
+                "scores": [0, 25, 50, 75, 100],
+                "tooltip": "Select the description that best reflects the number of employees or cases affected."
+            }
+        }
+    }
+
+    valid_q_types = set(response_options.keys())
+    for cat in questions:
+        for lang in questions[cat]:
+            for _, q_type, _ in questions[cat][lang]:
+                if q_type not in valid_q_types:
+                    raise ValueError(f"Invalid question type '{q_type}' in category {cat}, language {lang}")
+
+    return questions, response_options
+
+
+# Category mapping
+category_mapping = {
+    "Español": {
+        "Empoderamiento de Empleados": "Empoderamiento de Empleados",
+        "Liderazgo Ético": "Liderazgo Ético",
+        "Operaciones Centradas en las Personas": "Operaciones Centradas en las Personas",
+        "Prácticas Sostenibles y Éticas": "Prácticas Sostenibles y Éticas",
+        "Bienestar y Equilibrio": "Bienestar y Equilibrio",
+        "Iniciativas Organizacionales Centradas en las Personas": "Iniciativas Organizacionales Centradas en las Personas",
+        "Impacto Humano de Procesos Lean": "Impacto Humano de Procesos Lean"
+    },
+    "English": {
+        "Employee Empowerment": "Empoderamiento de Empleados",
+        "Ethical Leadership": "Liderazgo Ético",
+        "Human-Centered Operations": "Operaciones Centradas en las Personas",
+        "Sustainable and Ethical Practices": "Prácticas Sostenibles y Éticas",
+        "Well-Being and Balance": "Bienestar y Equilibrio",
+        "Human-Centered Organizational Initiatives": "Iniciativas Organizacionales Centradas en las Personas",
+        "Human Impact of Lean Processes": "Impacto Humano de Procesos Lean"
+    }
+}
+
+
+# Estimated effort, in person-days, to raise the answer of each question by one level
+# through its recommendation; keyed by question number
+recommendation_effort = {
+    1: 5, 2: 10, 3: 8, 4: 2, 5: 2,
+    6: 4, 7: 5, 8: 6, 9: 4, 10: 12,
+    11: 10, 12: 8, 13: 6, 14: 8, 15: 3,
+    16: 5, 17: 15, 18: 12, 19: 4, 20: 4,
+    21: 6, 22: 2, 23: 4, 24: 6, 25: 8,
+}
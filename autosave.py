@@ -0,0 +1,149 @@
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AutosaveStore:
+    """
+    SQLite store of in-progress audits keyed by report_id.
+
+    Args:
+        path: SQLite database file, created on first use
+        retention_days: Drafts untouched for longer than this are purged on open
+    """
+
+    def __init__(self, path: str, retention_days: float = 30):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS drafts (report_id TEXT PRIMARY KEY, updated_at REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM drafts WHERE updated_at < ?", (time.time() - retention_days * 86400,))
+
+    def save_many(self, drafts: Iterable[Tuple[str, Dict]]) -> None:
+        """Upsert several drafts in one transaction."""
+        now = time.time()
+        rows = [(report_id, now, json.dumps(payload, ensure_ascii=False)) for report_id, payload in drafts]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO drafts VALUES (?, ?, ?)", rows)
+
+    def load(self, report_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM drafts WHERE report_id = ?", (report_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, report_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM drafts WHERE report_id = ?", (report_id,))
+
+
+class CoalescingWriter:
+    """
+    Debounced background writer in front of an AutosaveStore.
+
+    schedule() only replaces the pending payload for a report, so a burst of
+    answer clicks collapses into a single write. A report is written once it has
+    been quiet for `delay` seconds, or at the latest `max_delay` seconds after its
+    first unsaved change; all reports due together share one transaction.
+
+    Args:
+        store: Destination store
+        delay: Quiet period before a pending draft is written
+        max_delay: Upper bound on how long a draft may stay unsaved
+    """
+
+    def __init__(self, store: AutosaveStore, delay: float = 2.0, max_delay: float = 10.0):
+        self.store = store
+        self.delay = delay
+        self.max_delay = max_delay
+        self.writes = 0
+        self._pending: Dict[str, Tuple[Dict, float, float]] = {}
+        # Reports taken off _pending whose write has not finished yet
+        self._in_flight: Set[str] = set()
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="autosave-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def schedule(self, report_id: str, payload: Dict) -> None:
+        now = time.monotonic()
+        with self._cond:
+            first = self._pending[report_id][1] if report_id in self._pending else now
+            self._pending[report_id] = (payload, first, now)
+            # discard() may be waiting on the same condition
+            self._cond.notify_all()
+
+    def discard(self, report_id: str) -> None:
+        """
+        Drop any pending write and the stored draft, e.g. after submission.
+
+        A write of the draft already in progress is waited for, so it cannot
+        bring the draft back after the delete.
+        """
+        with self._cond:
+            self._pending.pop(report_id, None)
+            while report_id in self._in_flight:
+                self._cond.wait()
+        self.store.delete(report_id)
+
+    def load(self, report_id: str) -> Optional[Dict]:
+        """Latest draft for a report, including changes not yet written."""
+        with self._cond:
+            if report_id in self._pending:
+                return self._pending[report_id][0]
+        return self.store.load(report_id)
+
+    def flush(self) -> None:
+        """Write every pending draft now."""
+        with self._cond:
+            due = list(self._pending.items())
+            self._pending.clear()
+            self._in_flight.update(report_id for report_id, _ in due)
+        self._write(due)
+
+    def _write(self, due) -> None:
+        """Save drafts taken off _pending (and marked in flight) under the condition lock."""
+        if not due:
+            return
+        try:
+            self.store.save_many((report_id, payload) for report_id, (payload, _, _) in due)
+            self.writes += 1
+        except sqlite3.Error:
+            logger.exception("Autosave write of %d drafts failed", len(due))
+        finally:
+            with self._cond:
+                self._in_flight.difference_update(report_id for report_id, _ in due)
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                now = time.monotonic()
+                due, next_deadline = [], None
+                for report_id, (payload, first, last) in self._pending.items():
+                    deadline = min(last + self.delay, first + self.max_delay)
+                    if deadline <= now:
+                        due.append((report_id, (payload, first, last)))
+                    else:
+                        next_deadline = deadline if next_deadline is None else min(next_deadline, deadline)
+                for report_id, _ in due:
+                    del self._pending[report_id]
+                    self._in_flight.add(report_id)
+                if not due:
+                    self._cond.wait(timeout=next_deadline - now)
+                    continue
+            self._write(due)
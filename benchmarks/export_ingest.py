@@ -0,0 +1,62 @@
+"""
+Measure streaming ingestion throughput and memory for growing response exports.
+
+Synthetic exports (report_id, submitted_at, language, organization, department,
+q1..qN) of every size are written to a temporary directory, then each is loaded
+into a fresh archive by response_ingest.ingest_export in its own process. For
+every size the script reports rows per second and the peak resident memory of
+the ingesting process, which should stay flat as the file grows.
+
+Usage:
+    python benchmarks/export_ingest.py [--rows 200000 1000000 3000000] [--format csv|jsonl] [--chunk-size N]
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from audit_archive import AuditArchive  # noqa: E402
+from audit_data import load_static_data  # noqa: E402
+from response_ingest import ingest_export  # noqa: E402
+from synthetic import generate_audits, write_outputs  # noqa: E402
+
+
+def ingest(path: str, archive_path: str, chunk_size: int):
+    questions, response_options = load_static_data()
+    summary = ingest_export(path, AuditArchive(archive_path), questions, response_options, chunk_size=chunk_size)
+    return summary, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[200000, 1000000, 3000000], help="Rows per export")
+    parser.add_argument("--format", default="csv", choices=["csv", "jsonl"])
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    args = parser.parse_args()
+
+    questions, response_options = load_static_data()
+    workdir = tempfile.mkdtemp(prefix="audit-bench-")
+    print(f"{'rows':>10} {'file MB':>8} {'loaded':>10} {'seconds':>8} {'rows/s':>10} {'peak RSS MB':>12}")
+    for rows in args.rows:
+        path = os.path.join(workdir, f"export_{rows}.{args.format}")
+        write_outputs(
+            generate_audits(rows, questions, response_options, seed=rows, missing_rate=0.01, chunk_size=100000),
+            questions, response_options, **{f"{args.format}_path": path}
+        )
+        # A fresh process per size, so the peak RSS is that of one ingestion
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            summary, peak = executor.submit(ingest, path, os.path.join(workdir, f"archive_{rows}.db"), args.chunk_size).result()
+        print(
+            f"{rows:>10} {os.path.getsize(path) / 2 ** 20:>8.0f} {summary['loaded']:>10} "
+            f"{summary['seconds']:>8.1f} {summary['rows_per_second']:>10,.0f} {peak:>12.0f}"
+        )
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
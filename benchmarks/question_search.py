@@ -0,0 +1,62 @@
+"""
+Time the sidebar question search for question banks of growing size.
+
+Banks are generated like in questionnaire_size.py by cycling through the
+default questions, so every size has a realistic vocabulary. For every size
+the script reports the index build time, its number of distinct prefixes and
+the median latency of a set of single- and multi-word queries in both languages.
+
+Usage:
+    python benchmarks/question_search.py [--sizes 25 250 1000]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from audit_data import load_static_data  # noqa: E402
+from search_index import build_indexes, search_any  # noqa: E402
+
+QUERIES = ("feedback", "retroalimentacion", "capacitación", "training", "empleados cap", "bienestar", "lean", "zz")
+
+
+def generate_bank(n_questions: int) -> dict:
+    questions, _ = load_static_data()
+    categories = list(questions)
+    bank = {cat: {lang: [] for lang in questions[cat]} for cat in categories}
+    for i in range(n_questions):
+        cat = categories[i % len(categories)]
+        for lang, items in questions[cat].items():
+            text, q_type, rec = items[len(bank[cat][lang]) % len(items)]
+            bank[cat][lang].append((f"{text} ({i + 1})", q_type, rec))
+    return bank
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 250, 1000], help="Questions per bank")
+    parser.add_argument("--repeat", type=int, default=2000, help="Runs per query")
+    args = parser.parse_args()
+
+    print(f"{'questions':>9} {'build ms':>9} {'prefixes':>9} {'median µs':>10} {'max µs':>8}")
+    for size in args.sizes:
+        bank = generate_bank(size)
+        start = time.perf_counter()
+        indexes = build_indexes(bank, ["Español", "English"])
+        build = time.perf_counter() - start
+        latencies = []
+        for query in QUERIES:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                search_any(indexes, query)
+            latencies.append((time.perf_counter() - start) / args.repeat)
+        prefixes = sum(len(index.postings) for index in indexes)
+        print(f"{size:>9} {build * 1000:>9.1f} {prefixes:>9} {statistics.median(latencies) * 1e6:>10.1f} {max(latencies) * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compare server work per completed audit in the "live" and "form" questionnaire modes.
+
+A simulated respondent answers every question and submits. In live mode each
+answer is a widget change and therefore a full script rerun; in form mode the
+browser keeps the answers until the single form submission. Reruns are counted
+with the app's own audit_reruns_total metric.
+
+Usage:
+    python benchmarks/questionnaire_modes.py [--audits N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import metrics  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "ethical_lean_audit_app.py")
+SUBMIT_LABELS = ("Enviar Respuestas", "Submit Answers")
+
+
+def total_reruns() -> float:
+    return sum(metrics.RERUNS.value(language=language) for language in ("Español", "English"))
+
+
+def run_audit(mode: str) -> None:
+    os.environ["QUESTIONNAIRE_MODE"] = mode
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.run()
+    for i, radio in enumerate(at.radio):
+        radio.set_value(radio.options[(i * 3) % len(radio.options)])
+        if mode == "live":
+            # Every click in the browser triggers a rerun
+            at.run()
+    # Form submit buttons cannot carry a widget key, so find the button by its label
+    next(button for button in at.button if button.label in SUBMIT_LABELS).click()
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    if not at.session_state.submit_clicked:
+        raise RuntimeError("Audit was not submitted")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--audits", type=int, default=3, help="Completed audits per mode")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="audit-bench-")
+    os.environ.update({
+        "METRICS_PORT": "0",
+        "PEER_INDEX_PATH": os.path.join(workdir, "peers.jsonl"),
+        "AUDIT_ARCHIVE_PATH": os.path.join(workdir, "audits.db"),
+        "AUTOSAVE_PATH": os.path.join(workdir, "autosave.db"),
+    })
+    os.chdir(ROOT)
+
+    results = {}
+    for mode in ("live", "form"):
+        reruns_before = total_reruns()
+        start = time.perf_counter()
+        for _ in range(args.audits):
+            run_audit(mode)
+        seconds = time.perf_counter() - start
+        results[mode] = ((total_reruns() - reruns_before) / args.audits, seconds / args.audits)
+
+    print(f"{'mode':<6} {'reruns/audit':>13} {'server s/audit':>15}")
+    for mode, (reruns, seconds) in results.items():
+        print(f"{mode:<6} {reruns:>13.1f} {seconds:>15.3f}")
+    print(f"form mode cuts reruns per completed audit by {results['live'][0] / results['form'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measure how rerun cost grows with the size of the question bank.
+
+Question banks of 25, 250 and 1000 questions are generated from the default
+bank's categories and served to a simulated respondent through per-size tenants.
+Large banks are paged by category (QUESTIONNAIRE_PAGE_THRESHOLD), so a rerun
+after one answer change only builds the widgets of the visible category. For
+every size the script reports the median rerun time after a single answer
+change and the peak memory allocated during that rerun.
+
+Usage:
+    python benchmarks/questionnaire_size.py [--sizes 25 250 1000] [--changes N]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from audit_data import load_static_data  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "ethical_lean_audit_app.py")
+
+
+def write_question_bank(path: str, n_questions: int) -> None:
+    """Question bank with the default categories, cycling through their questions."""
+    questions, _ = load_static_data()
+    categories = list(questions)
+    bank = {cat: {lang: [] for lang in questions[cat]} for cat in categories}
+    for i in range(n_questions):
+        cat = categories[i % len(categories)]
+        for lang, items in questions[cat].items():
+            text, q_type, rec = items[len(bank[cat][lang]) % len(items)]
+            bank[cat][lang].append((f"{text} ({i + 1})", q_type, rec))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"questions": bank}, f, ensure_ascii=False)
+
+
+def measure(tenant_id: str, changes: int):
+    at = AppTest.from_file(APP_PATH, default_timeout=300)
+    at.query_params["tenant"] = tenant_id
+    at.run()
+    timings, peaks = [], []
+    for i in range(changes):
+        radio = at.radio[i % len(at.radio)]
+        radio.set_value(radio.options[(i + 1) % len(radio.options)])
+        tracemalloc.start()
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+    return len(at.radio), statistics.median(timings), max(peaks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 250, 1000], help="Questions per bank")
+    parser.add_argument("--changes", type=int, default=5, help="Answer changes timed per size")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="audit-bench-")
+    tenants = {}
+    for size in args.sizes:
+        questions_file = os.path.join(workdir, f"questions_{size}.json")
+        write_question_bank(questions_file, size)
+        tenants[f"bench{size}"] = {"questionnaire_version": f"bench-{size}", "questions_file": questions_file}
+    tenants_file = os.path.join(workdir, "tenants.json")
+    with open(tenants_file, "w", encoding="utf-8") as f:
+        json.dump(tenants, f)
+    os.environ.update({
+        "METRICS_PORT": "0",
+        "TENANTS_FILE": tenants_file,
+        "PEER_INDEX_PATH": os.path.join(workdir, "peers.jsonl"),
+        "AUDIT_ARCHIVE_PATH": os.path.join(workdir, "audits.db"),
+        "AUTOSAVE_PATH": os.path.join(workdir, "autosave.db"),
+        "REPORT_CACHE_PATH": os.path.join(workdir, "report_cache.db"),
+    })
+    os.chdir(ROOT)
+
+    print(f"{'questions':>9} {'widgets':>8} {'rerun ms':>9} {'peak MiB':>9}")
+    baseline = None
+    for size in args.sizes:
+        widgets, seconds, peak = measure(f"bench{size}", args.changes)
+        baseline = baseline or (size, seconds)
+        print(f"{size:>9} {widgets:>8} {seconds * 1000:>9.1f} {peak / 2 ** 20:>9.1f}")
+    last = args.sizes[-1]
+    print(f"{last / baseline[0]:.0f}x the questions costs {seconds / baseline[1]:.1f}x the rerun time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import logging
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from analytics import OVERALL_LABEL
+from audit_archive import AuditArchive
+from audit_data import category_mapping, load_static_data
+from excel_report_generator import generate_digest_report
+from scheduler import JobQueue
+from scoring import decode_answer_matrix, question_layout, score_levels
+from screening import SCREENED_OUT
+
+logger = logging.getLogger(__name__)
+
+DIGEST_INTERVAL_SECONDS = 7 * 86400
+WEEKLY_DIGESTS_JOB = "weekly_organization_digests"
+
+
+def digest_summary(
+    archive: AuditArchive,
+    questions: Dict,
+    response_options: Dict,
+    organization: str,
+    period_start: str,
+    period_end: str,
+    exclude_flags: int = SCREENED_OUT,
+    chunk_size: int = 50000
+) -> pd.DataFrame:
+    """
+    Category scores of an organization before and within a digest period.
+
+    Audits are streamed from the archive; those of other questionnaire versions or
+    with any of the exclude_flags quality flags are left out.
+
+    Args:
+        period_start: First submitted_at (ISO 8601, UTC) of the period
+        period_end: submitted_at bound (exclusive) of the period
+
+    Returns:
+        pd.DataFrame: "previous_count", "previous_mean", "period_count" and "period_mean"
+        per category in questions order plus OVERALL_LABEL; attrs hold the number of
+        "previous_audits" and "period_audits"
+    """
+    n_questions = len(question_layout(questions))
+    # Count and sum per category and overall, for audits before the period (row 0) and within it (row 1)
+    counts = np.zeros((2, len(questions) + 1))
+    sums = np.zeros((2, len(questions) + 1))
+    audits = np.zeros(2, dtype=np.int64)
+    for records in archive.iter_records(chunk_size, organization):
+        records = [
+            record for record in records
+            if len(record["answers"]) == n_questions and record["submitted_at"] < period_end
+            and not (record["quality_flags"] or 0) & exclude_flags
+        ]
+        if not records:
+            continue
+        cat_scores, overall = score_levels(
+            decode_answer_matrix([record["answers"] for record in records], n_questions), questions, response_options
+        )
+        scores = np.column_stack([cat_scores, overall])
+        in_period = np.array([record["submitted_at"] >= period_start for record in records])
+        for period, mask in enumerate((~in_period, in_period)):
+            answered = ~np.isnan(scores[mask])
+            counts[period] += answered.sum(axis=0)
+            sums[period] += np.where(answered, scores[mask], 0).sum(axis=0)
+            audits[period] += int(mask.sum())
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    summary = pd.DataFrame(
+        {
+            "previous_count": counts[0].astype(np.int64),
+            "previous_mean": means[0],
+            "period_count": counts[1].astype(np.int64),
+            "period_mean": means[1],
+        },
+        index=list(questions) + [OVERALL_LABEL]
+    )
+    summary.attrs.update({"previous_audits": int(audits[0]), "period_audits": int(audits[1])})
+    return summary
+
+
+def digest_path(outbox: str, organization: str, period_end: str) -> str:
+    slug = re.sub(r"[^\w-]+", "_", organization).strip("_") or "organization"
+    return os.path.join(outbox, slug, f"digest_{period_end[:10]}.xlsx")
+
+
+def run_organization_digest(payload: Dict) -> str:
+    """
+    Job handler: write one organization's digest workbook to the outbox.
+
+    Payload keys: "archive_path", "outbox", "organization", "period_start",
+    "period_end", "language" and "thresholds".
+
+    Returns:
+        str: Path of the written workbook
+    """
+    questions, response_options = load_static_data()
+    summary = digest_summary(
+        AuditArchive(payload["archive_path"]),
+        questions,
+        response_options,
+        payload["organization"],
+        payload["period_start"],
+        payload["period_end"]
+    )
+    report = generate_digest_report(
+        summary,
+        payload["organization"],
+        payload["period_start"],
+        payload["period_end"],
+        payload["language"],
+        category_mapping,
+        payload["thresholds"],
+        # Dated by its period rather than by when it ran, so a retried job writes the same bytes
+        payload["period_end"][:10]
+    )
+    path = digest_path(payload["outbox"], payload["organization"], payload["period_end"])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Readers of the outbox never see a partly written workbook
+    with open(f"{path}.tmp", "wb") as f:
+        f.write(report.getvalue())
+    os.replace(f"{path}.tmp", path)
+    logger.info("Digest for %s (%d new audits) written to %s", payload["organization"], summary.attrs["period_audits"], path)
+    return path
+
+
+def run_organization_digests(payload: Dict) -> int:
+    """
+    Job handler: queue one digest job per organization for the week that just ended.
+
+    Job names carry the period, so a retried fan-out does not queue duplicates.
+
+    Returns:
+        int: Number of digest jobs queued
+    """
+    period_end = datetime.now(timezone.utc).replace(microsecond=0)
+    period_start = period_end - timedelta(seconds=DIGEST_INTERVAL_SECONDS)
+    queue = JobQueue(payload["queue_path"])
+    queued = 0
+    for organization in AuditArchive(payload["archive_path"]).organizations():
+        queued += queue.enqueue(
+            "organization_digest",
+            {
+                **{key: payload[key] for key in ("archive_path", "outbox", "language", "thresholds")},
+                "organization": organization,
+                "period_start": period_start.isoformat(),
+                "period_end": period_end.isoformat(),
+            },
+            name=f"organization_digest:{organization}:{period_end.date().isoformat()}"
+        )
+    logger.info("Queued %d organization digests", queued)
+    return queued
+
+
+JOB_HANDLERS = {
+    "organization_digests": run_organization_digests,
+    "organization_digest": run_organization_digest,
+}
+
+
+def schedule_weekly_digests(queue: JobQueue, payload: Dict, first_run: Optional[float] = None) -> bool:
+    """
+    Register the weekly digest fan-out; a no-op when it is already scheduled.
+
+    Args:
+        queue: Queue the scheduler polls
+        payload: "archive_path", "queue_path", "outbox", "language" and "thresholds"
+        first_run: Epoch seconds of the first run, next Monday 06:00 UTC by default
+
+    Returns:
+        bool: Whether the schedule was added
+    """
+    if first_run is None:
+        now = datetime.now(timezone.utc)
+        monday = (now + timedelta(days=7 - now.weekday())).replace(hour=6, minute=0, second=0, microsecond=0)
+        first_run = monday.timestamp()
+    return queue.enqueue(
+        "organization_digests", payload, run_at=first_run, name=WEEKLY_DIGESTS_JOB, interval_seconds=DIGEST_INTERVAL_SECONDS
+    )
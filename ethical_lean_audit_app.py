@@ -1,139 +1,47 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import io
+import json
 import xlsxwriter
 import os
 import uuid
 import re
+import hashlib
+import hmac
+import time
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from action_plan import action_plan_frame, plan_actions
+from analytics import DRILL_DIMENSIONS, OVERALL_LABEL, ArchiveScreening, CampaignRollup, DrillDownCube, QuestionCorrelation, ScoreDistribution, question_labels
+from audit_archive import AuditArchive
+from autosave import AutosaveStore, CoalescingWriter
+from excel_report_generator import generate_organization_workbook, parse_report_date, set_document_properties
+from html_report import render_html_report
+from peer_index import PeerIndex, OVERALL_KEY
+from presentation import (
+    COMPLETION_BADGE, DEFAULT_CSS, build_display_frame, build_overview_chart,
+    build_question_chart, build_results_frame, category_insights, color_percent, grade_banner,
+    build_correlation_heatmap, build_distribution_chart, DISTRIBUTION_KINDS
+)
+import presentation
+from report_cache import ReportCache, cache_key
+from scheduler import JobQueue, JobScheduler
+from search_index import QuestionIndex, build_indexes, search_any
+from session_lifecycle import SessionLifecycle, estimate_size, stale_report_keys
+from screening import QUALITY_FLAGS, SCREENED_OUT
+from scoring import (
+    decode_token, encode_answers, encode_token, levels_to_responses, question_layout, question_offsets, responses_to_levels, score_table
+)
+from tenants import DEFAULT_CONTACT, DEFAULT_QUESTIONNAIRE_VERSION, DEFAULT_SCORE_THRESHOLDS, TenantRegistry, question_bank_key
+from translations import TRANSLATIONS
+from whatif import improvement_frame, rank_improvements
+import digests
+import metrics
 
 # Constants
-SCORE_THRESHOLDS = {
-    "CRITICAL": 50,
-    "NEEDS_IMPROVEMENT": 70,
-    "GOOD": 85,
-}
-TOTAL_QUESTIONS = 25
-CHART_COLORS = ["#D32F2F", "#FFD54F", "#43A047"]
-CHART_HEIGHT = 400
+SCORE_THRESHOLDS = DEFAULT_SCORE_THRESHOLDS
 QUESTION_TRUNCATE_LENGTH = 100
-REPORT_DATE = datetime.now().strftime("%Y-%m-%d")
-
-# Translation dictionary
-TRANSLATIONS = {
-    "Español": {
-        "title": "Auditoría Ética de Lugar de Trabajo Lean",
-        "header": "¡Diagnostica y Optimiza tu Entorno Laboral!",
-        "score": "Puntuación",
-        "percent": "Porcentaje",
-        "priority": "Prioridad",
-        "category": "Categoría",
-        "question": "Pregunta",
-        "high_priority": "Alta",
-        "medium_priority": "Media",
-        "low_priority": "Baja",
-        "report_title": "Tu Informe de Bienestar Laboral",
-        "download_excel": "Descargar Informe Excel",
-        "report_filename_excel": "resultados_auditoria_lugar_trabajo_etico.xlsx",
-        "unanswered_error": "No se pueden mostrar los resultados. Hay {} preguntas sin responder. Por favor, completa todas las preguntas.",
-        "missing_questions": "Preguntas faltantes:",
-        "all_answered": "¡Todas las preguntas han sido respondidas! Revisa los resultados abajo.",
-        "response_guide": "Selecciona la descripción que mejor represente la situación para cada pregunta. Las opciones describen el grado, frecuencia o cantidad aplicable.",
-        "language_change_warning": "Cambiar el idioma reiniciará tus respuestas. ¿Deseas continuar?",
-        "reset_audit": "Reiniciar Auditoría",
-        "reset_warning": "Reiniciar la auditoría eliminará todas las respuestas. ¿Deseas continuar?",
-        "contact_info": "Contáctanos en {} o {} para soporte adicional.",
-        "high_priority_categories": "Categorías con Alta Prioridad",
-        "average_score": "Puntuación Promedio",
-        "chart_title": "Fortalezas y Oportunidades del Lugar de Trabajo",
-        "score_percent": "Puntuación (%)",
-        "question_breakdown": "Análisis Detallado: Perspectivas a Nivel de Pregunta",
-        "select_category": "Seleccionar Categoría para Explorar",
-        "question_scores_for": "Puntuaciones de Preguntas para",
-        "actionable_insights": "Perspectivas Accionables",
-        "all_categories_above_70": "¡Todas las categorías obtuvieron más del 70%! Continúa manteniendo estas fortalezas.",
-        "summary": "Resumen",
-        "results": "Resultados",
-        "findings": "Hallazgos",
-        "overall_score": "Puntuación General",
-        "grade": "Calificación",
-        "findings_summary": "Resumen de Hallazgos",
-        "findings_summary_text": "{} categorías requieren acción urgente (<{}%), {} necesitan mejoras específicas ({}-{}%). La puntuación general es {}%.",
-        "action_required": "Acción {} requerida.",
-        "findings_and_suggestions": "Hallazgos y Sugerencias",
-        "contact": "Contacto",
-        "generating_excel": "Generando Excel...",
-        "excel_error": "No se pudo generar el archivo Excel: {}",
-        "grade_excellent_desc": "Tu lugar de trabajo demuestra prácticas sobresalientes. ¡Continúa fortaleciendo estas áreas!",
-        "grade_good_desc": "Tu lugar de trabajo tiene fortalezas, pero requiere mejoras específicas para alcanzar la excelencia.",
-        "grade_needs_improvement_desc": "Se identificaron debilidades moderadas. Prioriza acciones correctivas en áreas críticas.",
-        "grade_critical_desc": "Existen problemas significativos que requieren intervención urgente. Considera apoyo externo.",
-        "suggestion": "Sugerencia",
-        "actionable_charts": "Gráficos Accionables",
-        "marketing_message": "¡Transforme su lugar de trabajo con LEAN 2.0 Institute! Colaboramos con usted para implementar soluciones sostenibles que aborden los hallazgos de esta auditoría, promoviendo un entorno laboral ético, inclusivo y productivo. Contáctenos para comenzar hoy mismo.",
-        "submit_answers": "Enviar Respuestas",
-        "reference_lines": "**Líneas de Referencia:** Discontinua = 50%, Punteada = 70%, Discontinua-Punteada = 85%",
-        "show_low_scores": "Mostrar solo preguntas que necesitan mejora (<70%)",
-        "actionable": "Accionable"
-    },
-    "English": {
-        "title": "Ethical Lean Workplace Audit",
-        "header": "Assess and Enhance Your Workplace!",
-        "score": "Score",
-        "percent": "Percent",
-        "priority": "Priority",
-        "category": "Category",
-        "question": "Question",
-        "high_priority": "High",
-        "medium_priority": "Medium",
-        "low_priority": "Low",
-        "report_title": "Your Workplace Wellness Report",
-        "download_excel": "Download Excel Report",
-        "report_filename_excel": "ethical_workplace_audit_results.xlsx",
-        "unanswered_error": "Cannot display results. There are {} unanswered questions. Please complete all questions.",
-        "missing_questions": "Missing Questions:",
-        "all_answered": "All questions have been answered! Review results below.",
-        "response_guide": "Select the description that best represents the situation for each question. The options describe the degree, frequency, or quantity applicable.",
-        "language_change_warning": "Changing the language will reset your responses. Do you wish to continue?",
-        "reset_audit": "Reset Audit",
-        "reset_warning": "Resetting the audit will clear all responses. Do you wish to continue?",
-        "contact_info": "Contact us at {} or {} for additional support.",
-        "high_priority_categories": "High Priority Categories",
-        "average_score": "Average Score",
-        "chart_title": "Workplace Strengths and Opportunities",
-        "score_percent": "Score (%)",
-        "question_breakdown": "Drill Down: Question-Level Insights",
-        "select_category": "Select Category to Explore",
-        "question_scores_for": "Question Scores for",
-        "actionable_insights": "Actionable Insights",
-        "all_categories_above_70": "All categories scored above 70%! Continue maintaining these strengths.",
-        "summary": "Summary",
-        "results": "Results",
-        "findings": "Findings",
-        "overall_score": "Overall Score",
-        "grade": "Grade",
-        "findings_summary": "Findings Summary",
-        "findings_summary_text": "{} categories require urgent action (<{}%), {} need specific improvements ({}-{}%). Overall score is {}%.",
-        "action_required": "{} action required.",
-        "findings_and_suggestions": "Findings and Suggestions",
-        "contact": "Contact",
-        "generating_excel": "Generating Excel...",
-        "excel_error": "Failed to generate Excel file: {}",
-        "grade_excellent_desc": "Your workplace demonstrates outstanding practices. Continue strengthening these areas!",
-        "grade_good_desc": "Your workplace has strengths but requires specific improvements to achieve excellence.",
-        "grade_needs_improvement_desc": "Moderate weaknesses identified. Prioritize corrective actions in critical areas.",
-        "grade_critical_desc": "Significant issues exist requiring urgent intervention. Consider external support.",
-        "suggestion": "Suggestion",
-        "actionable_charts": "Actionable Charts",
-        "marketing_message": "Transform your workplace with LEAN 2.0 Institute! We partner with you to implement sustainable solutions that address the findings of this audit, fostering an ethical, inclusive, and productive work environment. Contact us to start today.",
-        "submit_answers": "Submit Answers",
-        "reference_lines": "**Reference Lines:** Dashed = 50%, Dotted = 70%, Dash-Dot = 85%",
-        "show_low_scores": "Show only questions needing improvement (<70%)",
-        "actionable": "Actionable"
-    }
-}
 
 # Set page configuration at the top
 st.set_page_config(
@@ -142,220 +50,106 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Cache static data
-@st.cache_data
-def load_static_data() -> Tuple[Dict, Dict]:
-    questions = {
-        "Empoderamiento de Empleados": {
-            "Español": [
-                ("1. ¿Qué porcentaje de sugerencias de empleados presentadas en los últimos 12 meses fueron implementadas con resultados documentados?", "percentage", "Establece un sistema formal para rastrear e implementar sugerencias de empleados con métricas claras."),
-                ("2. ¿Cuántos empleados recibieron capacitación en habilidades profesionales en el último año?", "count", "Aumenta las oportunidades de capacitación profesional para todos los empleados."),
-                ("3. En los últimos 12 meses, ¿cuántos empleados lideraron proyectos o iniciativas con presupuesto asignado?", "count", "Asigna presupuestos a más iniciativas lideradas por empleados para fomentar la innovación."),
-                ("4. ¿Con qué frecuencia se realizan foros formales para que los empleados compartan retroalimentación con la gerencia?", "frequency", "Programa foros mensuales para retroalimentación directa entre empleados y gerencia.")
-            ],
-            "English": [
-                ("1. What percentage of employee suggestions submitted in the past 12 months were implemented with documented outcomes?", "percentage", "Establish a formal system to track and implement employee suggestions with clear metrics."),
-                ("2. How many employees received professional skills training in the past year?", "count", "Increase professional training opportunities for all employees."),
-                ("3. In the past 12 months, how many employees led projects or initiatives with allocated budgets?", "count", "Allocate budgets to more employee-led initiatives to foster innovation."),
-                ("4. How frequently are formal forums or meetings held for employees to share feedback with management?", "frequency", "Schedule monthly forums for direct employee-management feedback.")
-            ]
-        },
-        "Liderazgo Ético": {
-            "Español": [
-                ("5. ¿Con qué frecuencia los líderes compartieron actualizaciones escritas sobre decisiones que afectan a los empleados en los últimos 12 meses?", "frequency", "Implementa boletines mensuales para comunicar decisiones de liderazgo de manera transparente."),
-                ("6. ¿Qué porcentaje de políticas laborales nuevas o revisadas en el último año incluyó consulta formal con empleados?", "percentage", "Incluye a representantes de empleados en la revisión de todas las políticas laborales nuevas."),
-                ("7. ¿Cuántos casos de comportamiento ético destacado fueron reconocidos formalmente en los últimos 12 meses?", "count", "Crea un programa formal de reconocimiento para comportamientos éticos, con incentivos claros.")
-            ],
-            "English": [
-                ("5. How frequently did leaders share written updates on decisions affecting employees in the past 12 months?", "frequency", "Implement monthly newsletters to transparently communicate leadership decisions."),
-                ("6. What percentage of new or revised workplace policies in the past year included formal employee consultation?", "percentage", "Include employee representatives in reviewing all new workplace policies."),
-                ("7. How many instances of exemplary ethical behavior were formally recognized in the past 12 months?", "count", "Create a formal recognition program for ethical behavior with clear incentives.")
-            ]
-        },
-        "Operaciones Centradas en las Personas": {
-            "Español": [
-                ("8. ¿Qué porcentaje de procesos lean revisados en los últimos 12 meses incorporó retroalimentación de empleados para reducir tareas redundantes?", "percentage", "Integra retroalimentación de empleados en cada revisión de procesos lean para eliminar redundancias."),
-                ("9. ¿Con qué frecuencia se auditan las prácticas operativas para evaluar su impacto en el bienestar de los empleados?", "frequency", "Realiza auditorías trimestrales de prácticas operativas con enfoque en el bienestar."),
-                ("10. ¿Cuántos empleados recibieron capacitación en herramientas lean con énfasis en colaboración en el último año?", "count", "Capacita a todos los empleados en herramientas lean, priorizando la colaboración.")
-            ],
-            "English": [
-                ("8. What percentage of lean processes revised in the past 12 months incorporated employee feedback to reduce redundant tasks?", "percentage", "Integrate employee feedback into every lean process review to eliminate redundancies."),
-                ("9. How frequently are operational practices audited to assess their impact on employee well-being?", "frequency", "Conduct quarterly audits of operational practices focusing on well-being."),
-                ("10. How many employees received training on lean tools emphasizing collaboration in the past year?", "count", "Train all employees on lean tools, prioritizing collaboration.")
-            ]
-        },
-        "Prácticas Sostenibles y Éticas": {
-            "Español": [
-                ("11. ¿Qué porcentaje de iniciativas lean implementadas en los últimos 12 meses redujo el consumo de recursos?", "percentage", "Lanza iniciativas lean específicas para reducir el consumo de recursos, con metas medibles."),
-                ("12. ¿Qué porcentaje de proveedores principales fueron auditados en el último año para verificar estándares laborales y ambientales?", "percentage", "Audita anualmente a todos los proveedores principales para garantizar estándares éticos."),
-                ("13. ¿Cuántos empleados participaron en proyectos de sostenibilidad con impacto comunitario o laboral en los últimos 12 meses?", "count", "Involucra a más empleados en proyectos de sostenibilidad con impacto comunitario.")
-            ],
-            "English": [
-                ("11. What percentage of lean initiatives implemented in the past 12 months reduced resource consumption?", "percentage", "Launch specific lean initiatives to reduce resource consumption with measurable goals."),
-                ("12. What percentage of primary suppliers were audited in the past year to verify labor and environmental standards?", "percentage", "Audit all primary suppliers annually to ensure ethical standards."),
-                ("13. How many employees participated in sustainability projects with community or workplace impact in the past 12 months?", "count", "Engage more employees in sustainability projects with community impact.")
-            ]
-        },
-        "Bienestar y Equilibrio": {
-            "Español": [
-                ("14. ¿Qué porcentaje de empleados accedió a recursos de bienestar en los últimos 12 meses?", "percentage", "Amplía el acceso a recursos de bienestar, como asesoramiento y horarios flexibles."),
-                ("15. ¿Con qué frecuencia se realizan encuestas o revisiones para evaluar el agotamiento o la fatiga de los empleados?", "frequency", "Implementa encuestas mensuales para monitorear el agotamiento y actuar rápidamente."),
-                ("16. ¿Cuántos casos de desafíos personales o profesionales reportados por empleados fueron abordados con planes de acción documentados en el último año?", "count", "Establece procesos formales para abordar desafíos reportados por empleados con planes de acción documentados.")
-            ],
-            "English": [
-                ("14. What percentage of employees accessed well-being resources in the past 12 months?", "percentage", "Expand access to well-being resources, such as counseling and flexible schedules."),
-                ("15. How frequently are surveys or check-ins conducted to assess employee burnout or fatigue?", "frequency", "Implement monthly surveys to monitor burnout and act swiftly."),
-                ("16. How many reported employee personal or professional challenges were addressed with documented action plans in the past year?", "count", "Establish formal processes to address reported challenges with action plans.")
-            ]
-        },
-        "Iniciativas Organizacionales Centradas en las Personas": {
-            "Español": [
-                ("17. En nuestra organización se han implementado o se están explorando tecnologías como Industria 4.0, Inteligencia Artificial, robótica o automatización digital con el propósito de mejorar tanto la eficiencia operativa como las condiciones laborales del personal.", "frequency", "Desarrolla un plan estratégico para integrar tecnologías como IA y robótica, priorizando el impacto positivo en las condiciones laborales."),
-                ("18. Contamos con metodologías de excelencia operacional (Lean, Six Sigma, TPM, etc.) que no solo buscan eficiencia y calidad, sino que también integran activamente el bienestar del personal en su diseño e implementación.", "frequency", "Rediseña las metodologías de excelencia operacional para incluir métricas de bienestar del personal en cada fase."),
-                ("19. Antes de implementar nuevas tecnologías o iniciativas (sociales, ambientales u operativas), se consulta al personal para asegurar que los cambios beneficien su experiencia y condiciones laborales.", "frequency", "Establece un proceso formal de consulta con los empleados antes de implementar cualquier nueva tecnología o iniciativa."),
-                ("20. Las iniciativas actuales (tecnológicas, sociales y operativas) han contribuido de forma tangible a un ambiente laboral más saludable, inclusivo y respetuoso para todos los colaboradores.", "frequency", "Evalúa regularmente el impacto de las iniciativas en el ambiente laboral y ajusta según retroalimentación de los empleados.")
-            ],
-            "English": [
-                ("17. Our organization has implemented or is exploring technologies such as Industry 4.0, AI, robotics, or digital automation to enhance both operational efficiency and employee working conditions.", "frequency", "Develop a strategic plan to integrate technologies like AI and robotics, prioritizing positive impacts on working conditions."),
-                ("18. We have operational excellence methodologies (Lean, Six Sigma, TPM, etc.) that not only pursue efficiency and quality but also actively integrate employee well-being into their design and implementation.", "frequency", "Redesign operational excellence methodologies to include employee well-being metrics in every phase."),
-                ("19. Before implementing new technologies or initiatives (social, environmental, or operational), employees are consulted to ensure changes benefit their experience and working conditions.", "frequency", "Establish a formal employee consultation process before implementing any new technology or initiative."),
-                ("20. Current initiatives (technological, social, and operational) have tangibly contributed to a healthier, more inclusive, and respectful workplace for all employees.", "frequency", "Regularly evaluate the impact of initiatives on the workplace environment and adjust based on employee feedback.")
-            ]
-        },
-        "Impacto Humano de Procesos Lean": {
-            "Español": [
-                ("21. ¿Qué porcentaje de sugerencias de mejora de empleados fue implementado con impacto positivo en la carga mental o emocional del trabajo?", "percentage", "Implementa un sistema para priorizar y rastrear sugerencias que reduzcan la carga mental o emocional."),
-                ("22. ¿Con qué frecuencia la alta dirección comunica cómo las decisiones lean impactan en el bienestar, seguridad y desarrollo del personal?", "frequency", "Establece comunicaciones regulares de la alta dirección sobre el impacto de decisiones lean en el personal."),
-                ("23. ¿Con qué frecuencia se evalúan los efectos de los cambios lean sobre la fatiga, carga cognitiva o sentido de propósito de los empleados?", "frequency", "Realiza evaluaciones trimestrales del impacto de cambios lean en fatiga, carga cognitiva y propósito."),
-                ("24. ¿Qué porcentaje de procesos rediseñados eliminó tareas percibidas como sin sentido, humillantes o redundantes por los trabajadores?", "percentage", "Incluye retroalimentación de empleados en el rediseño de procesos para eliminar tareas sin valor."),
-                ("25. ¿Qué porcentaje de proyectos lean en los últimos 12 meses incluyó objetivos explícitos de equidad, inclusión o sostenibilidad humana?", "percentage", "Define objetivos de equidad e inclusión en todos los proyectos lean con métricas claras.")
-            ],
-            "English": [
-                ("21. What percentage of employee improvement suggestions were implemented with a positive impact on mental or emotional workload?", "percentage", "Implement a system to prioritize and track suggestions that reduce mental or emotional workload."),
-                ("22. How frequently does senior management communicate how lean decisions impact employee well-being, safety, and development?", "frequency", "Establish regular communications from senior management on the impact of lean decisions on employees."),
-                ("23. How frequently are the effects of lean changes evaluated on employee fatigue, cognitive load, or sense of purpose?", "frequency", "Conduct quarterly evaluations of lean changes’ impact on fatigue, cognitive load, and purpose."),
-                ("24. What percentage of redesigned processes eliminated tasks perceived as meaningless, humiliating, or redundant by workers?", "percentage", "Include employee feedback in process redesigns to eliminate valueless tasks."),
-                ("25. What percentage of lean projects in the past 12 months included explicit goals for equity, inclusion, or human sustainability?", "percentage", "Define equity and inclusion goals in all lean projects with clear metrics.")
-            ]
-        }
-    }
-
-    response_options = {
-        "percentage": {
-            "Español": {
-                "descriptions": [
-                    "Ninguna sugerencia/proceso fue implementado.",
-                    "Aproximadamente una cuarta parte fue implementada.",
-                    "La mitad fue implementada.",
-                    "Tres cuartas partes fueron implementadas.",
-                    "Todas las sugerencias/procesos fueron implementados."
-                ],
-                "scores": [0, 25, 50, 75, 100],
-                "tooltip": "Selecciona la descripción que mejor refleje la proporción de casos aplicados."
-            },
-            "English": {
-                "descriptions": [
-                    "No suggestions/processes were implemented.",
-                    "About one-quarter were implemented.",
-                    "Half were implemented.",
-                    "Three-quarters were implemented.",
-                    "All suggestions/processes were implemented."
-                ],
-                "scores": [0, 25, 50, 75, 100],
-                "tooltip": "Select the description that best reflects the proportion of cases applied."
-            }
-        },
-        "frequency": {
-            "Español": {
-                "descriptions": [
-                    "Esto nunca ocurre.",
-                    "Ocurre muy pocas veces al año.",
-                    "Ocurre varias veces al año.",
-                    "Ocurre regularmente, casi siempre.",
-                    "Ocurre en cada oportunidad."
-                ],
-                "scores": [0, 25, 50, 75, 100],
-                "tooltip": "Selecciona la descripción que mejor refleje la frecuencia de la práctica."
-            },
-            "English": {
-                "descriptions": [
-                    "This never occurs.",
-                    "Occurs very few times a year.",
-                    "Occurs several times a year.",
-                    "Occurs regularly, almost always.",
-                    "Occurs every time."
-                ],
-                "scores": [0, 25, 50, 75, 100],
-                "tooltip": "Select the description that best reflects the frequency of the practice."
-            }
-        },
-        "count": {
-            "Español": {
-                "descriptions": [
-                    "Ningún empleado o caso (0%).",
-                    "Menos de un cuarto de los empleados (1-25%).",
-                    "Entre un cuarto y la mitad (25-50%).",
-                    "Más de la mitad pero no la mayoría (50-75%).",
-                    "Más del 75% de los empleados o casos."
-                ],
-                "scores": [0, 25, 50, 75, 100],
-                "tooltip": "Selecciona la descripción que mejor refleje la cantidad de empleados o casos afectados."
-            },
-            "English": {
-                "descriptions": [
-                    "No employees or cases (0%).",
-                    "Less than a quarter of employees (1-25%).",
-                    "Between a quarter and half (25-50%).",
-                    "More than half but not most (50-75%).",
-                    "Over 75% of employees or cases."
-                ],
-                "scores": [0, 25, 50, 75, 100],
-                "tooltip": "Select the description that best reflects the number of employees or cases affected."
-            }
-        }
-    }
-
-    valid_q_types = set(response_options.keys())
-    for cat in questions:
-        for lang in questions[cat]:
-            for _, q_type, _ in questions[cat][lang]:
-                if q_type not in valid_q_types:
-                    raise ValueError(f"Invalid question type '{q_type}' in category {cat}, language {lang}")
-
-    return questions, response_options
-
 # Configuration
 CONFIG = {
-    "contact": {
-        "email": os.getenv("CONTACT_EMAIL", "contacto@lean2institute.org"),
-        "website": os.getenv("CONTACT_WEBSITE", "https://lean2institute.mystrikingly.com/")
-    }
-}
-
-# Category mapping
-category_mapping = {
-    "Español": {
-        "Empoderamiento de Empleados": "Empoderamiento de Empleados",
-        "Liderazgo Ético": "Liderazgo Ético",
-        "Operaciones Centradas en las Personas": "Operaciones Centradas en las Personas",
-        "Prácticas Sostenibles y Éticas": "Prácticas Sostenibles y Éticas",
-        "Bienestar y Equilibrio": "Bienestar y Equilibrio",
-        "Iniciativas Organizacionales Centradas en las Personas": "Iniciativas Organizacionales Centradas en las Personas",
-        "Impacto Humano de Procesos Lean": "Impacto Humano de Procesos Lean"
+    "contact": DEFAULT_CONTACT,
+    "logo": os.getenv("LOGO_PATH", "assets/FOBO2.png"),
+    "tenants": {
+        "file": os.getenv("TENANTS_FILE", "tenants.json"),
+        "default": os.getenv("DEFAULT_TENANT", "default"),
+        "cache_max_bytes": int(os.getenv("TENANT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
     },
-    "English": {
-        "Employee Empowerment": "Empoderamiento de Empleados",
-        "Ethical Leadership": "Liderazgo Ético",
-        "Human-Centered Operations": "Operaciones Centradas en las Personas",
-        "Sustainable and Ethical Practices": "Prácticas Sostenibles y Éticas",
-        "Well-Being and Balance": "Bienestar y Equilibrio",
-        "Human-Centered Organizational Initiatives": "Iniciativas Organizacionales Centradas en las Personas",
-        "Human Impact of Lean Processes": "Impacto Humano de Procesos Lean"
-    }
+    "peer_index": {
+        # Log of the default question bank; other banks log to "<path stem>.v<version>-<hash>.jsonl"
+        "path": os.getenv("PEER_INDEX_PATH", "data/peer_index.jsonl"),
+        "min_peers": int(os.getenv("PEER_INDEX_MIN_PEERS", "10"))
+    },
+    "archive": {
+        "path": os.getenv("AUDIT_ARCHIVE_PATH", "data/audits.db")
+    },
+    # "live" reruns on every answer; "form" sends all answers in one submission
+    "questionnaire_mode": os.getenv("QUESTIONNAIRE_MODE", "live"),
+    # Question banks larger than this render one category per page
+    "questionnaire_page_threshold": int(os.getenv("QUESTIONNAIRE_PAGE_THRESHOLD", "60")),
+    "autosave": {
+        "path": os.getenv("AUTOSAVE_PATH", "data/autosave.db"),
+        "delay": float(os.getenv("AUTOSAVE_DELAY_SECONDS", "2")),
+        "max_delay": float(os.getenv("AUTOSAVE_MAX_DELAY_SECONDS", "10"))
+    },
+    "metrics": {
+        # Set METRICS_PORT=0 to disable the local Prometheus endpoint
+        "port": int(os.getenv("METRICS_PORT", "9464"))
+    },
+    "report_cache": {
+        # Shared by every worker process on the host
+        "path": os.getenv("REPORT_CACHE_PATH", "data/report_cache.db"),
+        "max_bytes": int(os.getenv("REPORT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    },
+    "charts": {
+        # Upper bound on the JSON size of server-binned distribution charts
+        "max_payload_bytes": int(os.getenv("CHART_PAYLOAD_MAX_BYTES", str(presentation.DISTRIBUTION_PAYLOAD_BYTES)))
+    },
+    "action_plan": {
+        # Default client effort budget; tenants can override it with "effort_budget"
+        "budget": int(os.getenv("ACTION_PLAN_BUDGET_DAYS", "40"))
+    },
+    "scheduler": {
+        # Background jobs such as weekly organization digests; set SCHEDULER_ENABLED=0 when a standalone
+        # `python scheduler.py` serves the same queue
+        "enabled": os.getenv("SCHEDULER_ENABLED", "1") == "1",
+        "path": os.getenv("SCHEDULER_PATH", "data/jobs.db"),
+        "concurrency": int(os.getenv("SCHEDULER_CONCURRENCY", "1")),
+        "digest_outbox": os.getenv("DIGEST_OUTBOX", "data/outbox"),
+        "digest_language": os.getenv("DIGEST_LANGUAGE", "Español")
+    },
+    "campaigns": {
+        # Seconds between live refreshes of a campaign's results page; 0 refreshes on interaction only
+        "refresh_seconds": float(os.getenv("CAMPAIGN_REFRESH_SECONDS", "10"))
+    },
+    "sessions": {
+        # Rebuildable artifacts (workbook bytes) of sessions idle this long are released
+        "idle_seconds": float(os.getenv("SESSION_IDLE_SECONDS", "900"))
+    },
+    "admin": {
+        # The admin view (?view=admin) stays disabled until a token is configured
+        "token": os.getenv("ADMIN_TOKEN", "")
+    },
+    # Date printed on reports (YYYY-MM-DD); unset means the day each report is generated
+    "report_date": os.getenv("REPORT_DATE", "")
 }
 
-# Load static data before initializing session state
-questions, response_options = load_static_data()
+def report_date() -> str:
+    """Report date injected into the generators, read per report rather than once at startup."""
+    return CONFIG["report_date"] or datetime.now().strftime("%Y-%m-%d")
+
+# Shared per process; tenant assets are built lazily and bounded by cache_max_bytes
+@st.cache_resource
+def get_tenant_registry() -> TenantRegistry:
+    return TenantRegistry(
+        {
+            "contact": CONFIG["contact"],
+            "logo": CONFIG["logo"],
+            "thresholds": SCORE_THRESHOLDS,
+            "effort_budget": CONFIG["action_plan"]["budget"],
+            "questionnaire_version": DEFAULT_QUESTIONNAIRE_VERSION
+        },
+        CONFIG["tenants"]["file"],
+        CONFIG["tenants"]["cache_max_bytes"]
+    )
+
+# Resolve the tenant for this request before initializing session state
+if "tenant_id" not in st.session_state:
+    st.session_state.tenant_id = st.query_params.get("tenant", CONFIG["tenants"]["default"])
+TENANT = get_tenant_registry().resolve(st.session_state.tenant_id)
+CONFIG["contact"] = TENANT["contact"]
+SCORE_THRESHOLDS = TENANT["thresholds"]
+question_bank = get_tenant_registry().question_bank(TENANT)
+# Keys every per-process cache built from the tenant's questions
+QUESTION_BANK_KEY = question_bank_key(TENANT)
+questions = question_bank["questions"]
+response_options = question_bank["response_options"]
+category_mapping = question_bank["category_mapping"]
+recommendation_effort = question_bank["recommendation_effort"]
 
 # Initialize session state
 def initialize_session_state():
@@ -393,41 +187,93 @@ def initialize_session_state():
                     current[:expected_len] + [None] * (expected_len - len(current))
                 ) if len(current) < expected_len else current[:expected_len]
 
+# Autosave and resume
+@st.cache_resource
+def get_autosave_writer() -> CoalescingWriter:
+    return CoalescingWriter(
+        AutosaveStore(CONFIG["autosave"]["path"]),
+        CONFIG["autosave"]["delay"],
+        CONFIG["autosave"]["max_delay"]
+    )
+
+def restore_draft(report_id: str) -> bool:
+    draft = get_autosave_writer().load(report_id)
+    if draft is None or draft.get("tenant_id") != st.session_state.tenant_id or draft.get("language") not in TRANSLATIONS:
+        return False
+    language = draft["language"]
+    st.session_state.language = language
+    st.session_state.language_select = language
+    st.session_state.report_id = report_id
+    st.session_state.responses = draft["responses"]
+    st.session_state.autosave_snapshot = json.dumps(draft["responses"], sort_keys=True)
+    # Restore the radio widgets too, otherwise they would overwrite responses with their defaults
+    for cat, scores in draft["responses"].items():
+        if cat not in questions:
+            continue
+        for q_idx, score in enumerate(scores[:len(questions[cat][language])]):
+            q_type = questions[cat][language][q_idx][1]
+            options = response_options[q_type][language]
+            if score in options["scores"]:
+                st.session_state[f"{cat}_{q_idx}_{report_id}"] = options["descriptions"][options["scores"].index(score)]
+    return True
+
+if "resume_checked" not in st.session_state:
+    st.session_state.resume_checked = True
+    resume_id = st.query_params.get("resume")
+    if resume_id and restore_draft(resume_id):
+        st.toast(TRANSLATIONS[st.session_state.language]["draft_restored"])
+
 # Call initialize_session_state
 initialize_session_state()
 
+# Generated workbooks, HTML reports and figures, shared across worker processes
+@st.cache_resource
+def get_report_cache() -> ReportCache:
+    return ReportCache(CONFIG["report_cache"]["path"], CONFIG["report_cache"]["max_bytes"])
+
+# Metrics
+@st.cache_resource
+def start_metrics_endpoint():
+    if CONFIG["metrics"]["port"]:
+        return metrics.start_metrics_server(CONFIG["metrics"]["port"])
+    return None
+
+start_metrics_endpoint()
+
+# Digests run in low-priority worker processes, never on a session's script thread
+@st.cache_resource
+def start_job_scheduler() -> Optional[JobScheduler]:
+    if not CONFIG["scheduler"]["enabled"]:
+        return None
+    queue = JobQueue(CONFIG["scheduler"]["path"])
+    digests.schedule_weekly_digests(queue, {
+        "archive_path": CONFIG["archive"]["path"],
+        "queue_path": CONFIG["scheduler"]["path"],
+        "outbox": CONFIG["scheduler"]["digest_outbox"],
+        "language": CONFIG["scheduler"]["digest_language"],
+        "thresholds": get_tenant_registry().default_tenant["thresholds"],
+    })
+    return JobScheduler(queue, digests.JOB_HANDLERS, CONFIG["scheduler"]["concurrency"]).start()
+
+start_job_scheduler()
+
+@st.cache_resource
+def get_session_lifecycle() -> SessionLifecycle:
+    return SessionLifecycle(CONFIG["sessions"]["idle_seconds"])
+
+script_ctx = get_script_run_ctx()
+SESSION_ID = script_ctx.session_id if script_ctx is not None else "local"
+metrics.SESSIONS.touch(SESSION_ID)
+# Radio keys of earlier audits in this session (before a reset or language change) are never shown again
+for stale_key in stale_report_keys(list(st.session_state.keys()), st.session_state.report_id):
+    del st.session_state[stale_key]
+get_session_lifecycle().touch(SESSION_ID, sum(estimate_size(st.session_state[key]) for key in st.session_state.keys()))
+metrics.RERUNS.inc(language=st.session_state.language)
+st.session_state.reruns_this_audit = st.session_state.get("reruns_this_audit", 0) + 1
+
 # Load CSS
 def load_css():
-    default_css = """
-        .main-container { overflow-anchor: none; min-height: 100vh; }
-        .main-title { font-size: 2.5rem; color: #1E88E5; text-align: center; }
-        .section-title { font-size: 1.8rem; color: #424242; margin-bottom: 1rem; }
-        .card-modern { background: #FFFFFF; border-radius: 8px; padding: 1.5rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 1rem; min-height: 200px; }
-        .question-container { display: flex; align-items: center; margin-bottom: 0.5rem; }
-        .question-text { font-weight: 500; color: #212121; margin-right: 0.5rem; }
-        .required { color: #D32F2F; font-weight: bold; }
-        .tooltip { position: relative; display: inline-block; }
-        .tooltip-icon { background: #1E88E5; color: white; border-radius: 50%; width: 20px; height: 20px; text-align: center; line-height: 20px; cursor: help; }
-        .tooltip-text { visibility: hidden; width: 200px; background: #424242; color: #FFFFFF; text-align: center; border-radius: 6px; padding: 5px; position: absolute; z-index: 1; bottom: 125%; left: 50%; margin-left: -100px; opacity: 0; transition: opacity 0.3s; }
-        .tooltip:hover .tooltip-text { visibility: visible; opacity: 1; }
-        .sticky-nav { position: sticky; bottom: 0; background: #F5F5F5; padding: 1rem; border-radius: 8px; box-shadow: 0 -2px 4px rgba(0,0,0,0.1); z-index: 10; }
-        .grade-excellent { background: #43A047; color: #FFFFFF; padding: 0.5rem; border-radius: 4px; }
-        .grade-good { background: #FFD54F; color: #212121; padding: 0.5rem; border-radius: 4px; }
-        .grade-needs-improvement { background: #FF9800; color: #FFFFFF; padding: 0.5rem; border-radius: 4px; }
-        .grade-critical { background: #D32F2F; color: #FFFFFF; padding: 0.5rem; border-radius: 4px; }
-        .alert { padding: 1rem; border-radius: 4px; margin-bottom: 1rem; min-height: 60px; }
-        .alert-info { background: #E3F2FD; color: #1E88E5; }
-        .alert-success { background: #E8F5E9; color: #43A047; }
-        .alert-warning { background: #FFF3E0; color: #FF9800; }
-        .badge { background: #1E88E5; color: #FFFFFF; padding: 0.5rem 1rem; border-radius: 16px; display: inline-block; margin: 1rem 0; }
-        .contact-info { margin-top: 1rem; font-size: 0.9rem; color: #424242; }
-        @media (max-width: 768px) { 
-            .main-title { font-size: 2rem; } 
-            .section-title { font-size: 1.5rem; } 
-            .card-modern { padding: 1rem; } 
-        }
-    """
-    st.markdown(f"<style>{default_css}</style>", unsafe_allow_html=True)
+    st.markdown(f"<style>{DEFAULT_CSS}</style>", unsafe_allow_html=True)
 
 # JavaScript for scroll preservation
 st.markdown("""
@@ -459,31 +305,34 @@ def sanitize_input(text: str) -> str:
     return re.sub(r'[<>]', '', text)
 
 def get_grade(score: float) -> Tuple[str, str, str]:
-    lang = st.session_state.language
-    if score >= SCORE_THRESHOLDS["GOOD"]:
-        return (
-            "Excelente" if lang == "Español" else "Excellent",
-            TRANSLATIONS[lang]["grade_excellent_desc"],
-            "grade-excellent"
-        )
-    elif score >= SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"]:
-        return (
-            "Bueno" if lang == "Español" else "Good",
-            TRANSLATIONS[lang]["grade_good_desc"],
-            "grade-good"
-        )
-    elif score >= SCORE_THRESHOLDS["CRITICAL"]:
-        return (
-            "Necesita Mejora" if lang == "Español" else "Needs Improvement",
-            TRANSLATIONS[lang]["grade_needs_improvement_desc"],
-            "grade-needs-improvement"
-        )
-    else:
-        return (
-            "Crítico" if lang == "Español" else "Critical",
-            TRANSLATIONS[lang]["grade_critical_desc"],
-            "grade-critical"
-        )
+    return presentation.get_grade(score, st.session_state.language, SCORE_THRESHOLDS)
+
+def peer_index_path(question_bank_key: Tuple[str, Optional[str]]) -> str:
+    """Peer log of one question bank; the default bank keeps the configured path."""
+    version, questions_file = question_bank_key
+    if version == DEFAULT_QUESTIONNAIRE_VERSION and not questions_file:
+        return CONFIG["peer_index"]["path"]
+    root, ext = os.path.splitext(CONFIG["peer_index"]["path"])
+    bank = hashlib.sha1((questions_file or "").encode("utf-8")).hexdigest()[:8]
+    return f"{root}.v{version}-{bank}{ext}"
+
+@st.cache_resource
+def get_peer_index(question_bank_key: Tuple[str, Optional[str]]) -> PeerIndex:
+    # Audits are only ranked against audits of the same questionnaire
+    return PeerIndex(peer_index_path(question_bank_key))
+
+@st.cache_resource
+def get_audit_archive() -> AuditArchive:
+    return AuditArchive(CONFIG["archive"]["path"])
+
+def format_percentile(percentile: Optional[float]) -> str:
+    if percentile is None:
+        return "-"
+    value = int(round(percentile))
+    if st.session_state.language == "Español":
+        return str(value)
+    suffix = "th" if 10 <= value % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(value % 10, "th")
+    return f"{value}{suffix}"
 
 def update_language():
     if st.session_state.language_select != st.session_state.language:
@@ -509,15 +358,402 @@ def reset_audit():
         st.session_state.report_id = str(uuid.uuid4())
         st.session_state.submit_clicked = False
 
+# Admin view
+@st.cache_resource
+def get_question_correlation(question_bank_key: Tuple[str, Optional[str]], organization: Optional[str]) -> QuestionCorrelation:
+    # One streaming accumulator per question bank and organization; refreshed incrementally
+    return QuestionCorrelation(questions, response_options)
+
+@st.cache_resource
+def get_score_distribution(question_bank_key: Tuple[str, Optional[str]], organization: Optional[str]) -> ScoreDistribution:
+    return ScoreDistribution(questions, response_options)
+
+@st.cache_resource
+def get_drilldown_cube(question_bank_key: Tuple[str, Optional[str]]) -> DrillDownCube:
+    # Covers every organization; tenants are restricted when the cube is sliced
+    return DrillDownCube(questions, response_options)
+
+@st.cache_resource
+def get_archive_screening(question_bank_key: Tuple[str, Optional[str]]) -> ArchiveScreening:
+    # Seeded from the archive on the first submission; later refreshes fold in other workers' submissions
+    return ArchiveScreening(questions, response_options)
+
+@st.cache_resource
+def get_campaign_rollup(question_bank_key: Tuple[str, Optional[str]], campaign_id: str) -> CampaignRollup:
+    # One per campaign, shared by every admin session; each refresh folds in only new submissions
+    return CampaignRollup(questions, response_options, campaign_id)
+
+def render_drilldown(labels: Dict, organization: Optional[str], display_names: Dict):
+    st.markdown(f'<h2 class="section-title">{labels["drilldown_title"]}</h2>', unsafe_allow_html=True)
+    cube = get_drilldown_cube(QUESTION_BANK_KEY)
+    cube.refresh(get_audit_archive())
+    dimension_labels = {
+        "organization": labels["admin_organization"],
+        "site": labels["drilldown_site"],
+        "department": labels["drilldown_department"],
+        "role": labels["drilldown_role"],
+    }
+    # Each selector only offers values present within the selections to its left
+    filters = {"organization": organization}
+    columns = st.columns(len(DRILL_DIMENSIONS) - 1)
+    for column, dimension in zip(columns, DRILL_DIMENSIONS[1:]):
+        options = [labels["admin_all_organizations"]] + cube.values(dimension, **filters)
+        selected = column.selectbox(
+            dimension_labels[dimension], options, format_func=lambda value: value or "—", key=f"drilldown_{dimension}"
+        )
+        filters[dimension] = None if selected == labels["admin_all_organizations"] else selected
+
+    summary = cube.slice(**filters)
+    if not summary["count"].any():
+        st.info(labels["drilldown_empty"])
+        return
+    names = {**display_names, OVERALL_LABEL: labels["overall_score"]}
+    st.dataframe(
+        pd.DataFrame({
+            labels["category"]: [names[label] for label in summary.index],
+            labels["audit_count"]: summary["count"].values,
+            labels["mean_score"]: summary["mean"].round(1).values,
+            labels["std_dev"]: summary["std"].round(1).values,
+        }),
+        hide_index=True,
+        use_container_width=True
+    )
+
+    open_dimensions = [dim for dim in DRILL_DIMENSIONS if filters[dim] is None]
+    if not open_dimensions:
+        return
+    group_by = st.selectbox(
+        labels["drilldown_group_by"], open_dimensions, format_func=dimension_labels.get, key="drilldown_group_by"
+    )
+    breakdown = cube.breakdown(group_by, **filters)
+    breakdown = breakdown.rename(columns={**names, "count": labels["audit_count"]}).round(1)
+    # Audits submitted without a value for this dimension
+    breakdown.index = [value or "—" for value in breakdown.index]
+    breakdown.index.name = dimension_labels[group_by]
+    st.dataframe(breakdown, use_container_width=True)
+
+def render_organization_workbook(labels: Dict, organization: Optional[str], campaign: Optional[str] = None):
+    st.markdown(f'<h3 class="subsection-title">{labels["org_workbook_title"]}</h3>', unsafe_allow_html=True)
+    st.caption(labels["org_workbook_caption"])
+    workbook_key = (organization, campaign, st.session_state.language, QUESTION_BANK_KEY)
+    if st.button(labels["org_workbook_build"], key="build_org_workbook"):
+        with st.spinner(labels["generating_excel"]):
+            output = io.BytesIO()
+            respondents = generate_organization_workbook(
+                get_audit_archive(),
+                output,
+                questions,
+                response_options,
+                st.session_state.language,
+                category_mapping,
+                SCORE_THRESHOLDS,
+                report_date(),
+                organization=organization,
+                campaign=campaign
+            )
+            metrics.EXCEL_BYTES.observe(output.tell(), generator="organization")
+            get_session_lifecycle().put(SESSION_ID, "org_workbook", workbook_key, (respondents, output.getvalue()))
+    # Released once the session has been idle for a while; the button above builds it again
+    built = get_session_lifecycle().get(SESSION_ID, "org_workbook", workbook_key)
+    if built is not None:
+        st.download_button(
+            label=labels["org_workbook_download"].format(built[0]),
+            data=built[1],
+            file_name=labels["org_workbook_filename"],
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key="download_org_workbook"
+        )
+
+def tenant_query() -> str:
+    """Query string prefix that keeps links within the current tenant."""
+    return f"tenant={TENANT['id']}&" if TENANT["id"] != CONFIG["tenants"]["default"] else ""
+
+def render_campaigns(labels: Dict, organization: Optional[str]):
+    st.markdown(f'<h2 class="section-title">{labels["campaigns_title"]}</h2>', unsafe_allow_html=True)
+    st.caption(labels["campaigns_caption"])
+    with st.form("create_campaign", clear_on_submit=True, border=False):
+        name = st.text_input(labels["campaign_name"], key="campaign_name")
+        created = st.form_submit_button(labels["campaign_create"])
+    if created and sanitize_input(name).strip():
+        get_audit_archive().create_campaign(sanitize_input(name).strip(), organization or TENANT["id"])
+    campaigns = get_audit_archive().campaigns(organization)
+    if not campaigns:
+        st.info(labels["campaigns_empty"])
+        return
+    for campaign in campaigns:
+        st.markdown(labels["campaign_line"].format(
+            campaign["name"],
+            campaign["created_at"][:10],
+            get_audit_archive().count(campaign=campaign["campaign_id"]),
+            f"?{tenant_query()}campaign={campaign['campaign_id']}",
+            f"?{tenant_query()}view=admin&campaign={campaign['campaign_id']}"
+        ))
+
+def render_campaign_results(labels: Dict, campaign_id: str):
+    campaign = get_audit_archive().campaign(campaign_id)
+    # Tenants other than the default only see their own campaigns
+    if campaign is None or (TENANT["id"] != CONFIG["tenants"]["default"] and campaign["organization"] != TENANT["id"]):
+        st.error(labels["campaign_unknown"], icon="❌")
+        return
+    st.markdown(f'<h2 class="section-title">{campaign["name"]}</h2>', unsafe_allow_html=True)
+    st.caption(labels["campaign_caption"].format(campaign["organization"], campaign["created_at"][:10]))
+    st.markdown(f'[{labels["campaign_back"]}](?{tenant_query()}view=admin)')
+    display_names = {v: k for k, v in category_mapping[st.session_state.language].items()}
+    names = {**display_names, OVERALL_LABEL: labels["overall_score"]}
+    priorities = [labels["high_priority"], labels["medium_priority"], labels["low_priority"], labels["low_priority"]]
+    rollup = get_campaign_rollup(QUESTION_BANK_KEY, campaign_id)
+
+    # Reruns on its own while respondents submit; only the audits archived since the last run are read
+    @st.fragment(run_every=CONFIG["campaigns"]["refresh_seconds"] or None)
+    def render_rollup():
+        rollup.refresh(get_audit_archive())
+        received = get_audit_archive().count(campaign=campaign_id)
+        summary = rollup.summary(SCORE_THRESHOLDS)
+        col1, col2, col3 = st.columns(3)
+        col1.metric(labels["campaign_responses"], rollup.responses)
+        col2.metric(labels["campaign_screened_out"], max(received - rollup.responses, 0))
+        overall = summary.loc[OVERALL_LABEL, "mean"]
+        col3.metric(labels["average_score"], f"{overall:.1f}%" if summary.loc[OVERALL_LABEL, "count"] else "-")
+        if not rollup.responses:
+            st.info(labels["campaign_no_responses"])
+            return
+        table = pd.DataFrame({
+            labels["category"]: [names[label] for label in summary.index],
+            labels["audit_count"]: summary["count"].values,
+            labels["mean_score"]: summary["mean"].round(1).values,
+            labels["priority"]: [priorities[band] if band >= 0 else "-" for band in summary["band"]],
+        })
+        st.dataframe(
+            table.style.map(color_percent, thresholds=SCORE_THRESHOLDS, subset=[labels["mean_score"]]).format({labels["mean_score"]: "{:.1f}%"}, na_rep="-"),
+            hide_index=True,
+            use_container_width=True
+        )
+
+    render_rollup()
+    render_organization_workbook(labels, campaign["organization"], campaign_id)
+
+def render_admin_view():
+    labels = TRANSLATIONS[st.session_state.language]
+    st.markdown(f'<h1 class="main-title">{labels["admin_title"]}</h1>', unsafe_allow_html=True)
+    if not CONFIG["admin"]["token"]:
+        st.info(labels["admin_disabled"])
+        return
+    if not st.session_state.get("admin_authenticated", False):
+        token = st.text_input(labels["admin_token"], type="password", key="admin_token_input")
+        if not token:
+            return
+        if not hmac.compare_digest(token.encode(), CONFIG["admin"]["token"].encode()):
+            st.error(labels["admin_invalid_token"], icon="❌")
+            return
+        st.session_state.admin_authenticated = True
+
+    campaign_id = st.query_params.get("campaign")
+    if campaign_id:
+        render_campaign_results(labels, campaign_id)
+        return
+
+    # Tenants other than the default only see their own audits
+    if TENANT["id"] == CONFIG["tenants"]["default"]:
+        organizations = [labels["admin_all_organizations"]] + get_audit_archive().organizations()
+        selected = st.selectbox(labels["admin_organization"], organizations, key="admin_organization")
+        organization = None if selected == labels["admin_all_organizations"] else selected
+    else:
+        organization = TENANT["id"]
+
+    memory = get_session_lifecycle().stats()
+    st.caption(labels["session_memory_caption"].format(
+        memory["sessions"], memory["state_bytes"] / 2 ** 20, memory["artifact_bytes"] / 2 ** 20, memory["reclaimed_bytes"] / 2 ** 20
+    ))
+
+    display_names = {v: k for k, v in category_mapping[st.session_state.language].items()}
+    quality = get_audit_archive().quality_counts(organization)
+    if quality:
+        flagged = lambda mask: sum(count for flags, count in quality.items() if flags & mask)
+        st.caption(labels["quality_caption"].format(
+            flagged(SCREENED_OUT),
+            flagged(QUALITY_FLAGS["straight_line"]),
+            flagged(QUALITY_FLAGS["duplicate"]),
+            flagged(QUALITY_FLAGS["invalid"]),
+            flagged(QUALITY_FLAGS["outlier"])
+        ))
+    render_campaigns(labels, organization)
+    render_drilldown(labels, organization, display_names)
+    render_organization_workbook(labels, organization)
+
+    st.markdown(f'<h2 class="section-title">{labels["correlation_title"]}</h2>', unsafe_allow_html=True)
+    analysis = get_question_correlation(QUESTION_BANK_KEY, organization)
+    analysis.refresh(get_audit_archive(), organization)
+    if analysis.count < 2:
+        st.info(labels["not_enough_audits"])
+        return
+    st.caption(labels["correlation_caption"].format(analysis.count, analysis.incomplete))
+    n_questions = len(question_labels(questions))
+    corr = analysis.correlation().iloc[:n_questions].rename(columns=display_names)
+    st.plotly_chart(build_correlation_heatmap(corr, labels["correlation_title"]), use_container_width=True)
+
+    st.markdown(f'<h3 class="subsection-title">{labels["drivers_title"]}</h3>', unsafe_allow_html=True)
+    question_text = {
+        label: questions[cat][st.session_state.language][q_idx][0][:QUESTION_TRUNCATE_LENGTH]
+        for label, (cat, q_idx, _) in zip(question_labels(questions), question_layout(questions))
+    }
+    drivers = analysis.drivers()
+    drivers_view = pd.DataFrame({
+        labels["question"]: drivers["question"].map(question_text),
+        labels["category"]: drivers["category"].map(display_names),
+        labels["mean_score"]: drivers["mean_score"].round(1),
+        labels["drivers_category_correlation"]: drivers["category_correlation"].round(2),
+        labels["drivers_overall_correlation"]: drivers["overall_correlation"].round(2),
+    })
+    st.dataframe(drivers_view, hide_index=True, use_container_width=True)
+
+    st.markdown(f'<h2 class="section-title">{labels["distribution_title"]}</h2>', unsafe_allow_html=True)
+    distribution = get_score_distribution(QUESTION_BANK_KEY, organization)
+    distribution.refresh(get_audit_archive(), organization)
+    kind = st.radio(
+        labels["distribution_kind"],
+        DISTRIBUTION_KINDS,
+        format_func=lambda k: labels[f"distribution_{k}"],
+        horizontal=True,
+        key="distribution_kind"
+    )
+    st.caption(labels["distribution_caption"].format(int(distribution.totals.max())))
+    try:
+        figure = build_distribution_chart(
+            distribution,
+            kind,
+            [display_names[cat] for cat in questions] + [labels["overall_score"]],
+            labels["distribution_title"],
+            SCORE_THRESHOLDS,
+            max_bytes=CONFIG["charts"]["max_payload_bytes"]
+        )
+    except ValueError as e:
+        st.error(str(e), icon="❌")
+        return
+    st.plotly_chart(figure, use_container_width=True)
+
+if st.query_params.get("view") == "admin":
+    render_admin_view()
+    st.stop()
+
+# Respondents of a survey campaign arrive through its link (?campaign=<id>) and submit under it
+if "campaign" not in st.session_state:
+    campaign_id = st.query_params.get("campaign")
+    campaign = get_audit_archive().campaign(campaign_id) if campaign_id else None
+    if campaign is not None and TENANT["id"] != CONFIG["tenants"]["default"] and campaign["organization"] != TENANT["id"]:
+        campaign = None
+    st.session_state.campaign = campaign
+    st.session_state.campaign_unknown = bool(campaign_id) and campaign is None
+CAMPAIGN = st.session_state.campaign
+
+# Questionnaire pages
+paged = len(question_layout(questions)) > CONFIG["questionnaire_page_threshold"]
+question_numbers = question_offsets(questions)
+if st.session_state.get("current_category", 0) >= len(questions):
+    st.session_state.current_category = 0
+st.session_state.setdefault("current_category", 0)
+
+def radio_key(category: str, q_idx: int) -> str:
+    return f"{category}_{q_idx}_{st.session_state.report_id}"
+
+def save_category_answers(category: str):
+    """Copy the category's widget values into responses, e.g. before its page is left."""
+    for q_idx, (_, q_type, _) in enumerate(questions[category][st.session_state.language]):
+        selected = st.session_state.get(radio_key(category, q_idx))
+        options = response_options[q_type][st.session_state.language]
+        if selected in options["descriptions"]:
+            st.session_state.responses[category][q_idx] = options["scores"][options["descriptions"].index(selected)]
+
+def go_to_category(idx: int):
+    current = category_mapping[st.session_state.language][display_categories[st.session_state.current_category]]
+    save_category_answers(current)
+    st.session_state.current_category = idx
+
+def render_category(idx: int, display_category: str):
+    category = category_mapping[st.session_state.language][display_category]
+    category_id = f"category_{idx}"
+    with st.container():
+        st.markdown(f'<div id="{category_id}" class="card-modern" role="region" aria-label="Category {display_category} Questions">', unsafe_allow_html=True)
+        st.markdown(f'<h2 class="section-title">{display_category}</h2>', unsafe_allow_html=True)
+        for q_idx, (q, q_type, _) in enumerate(questions[category][st.session_state.language]):
+            with st.container():
+                is_unanswered = st.session_state.responses[category][q_idx] is None
+                st.markdown(
+                    f"""
+                    <div class="question-container" id="question_{question_numbers[category] + q_idx + 1}">
+                        <label class="question-text" for="{category}_{q_idx}">
+                            {question_numbers[category] + q_idx + 1}. {sanitize_input(q)} {'<span class="required" aria-label="Required">*</span>' if is_unanswered else ''}
+                        </label>
+                        <div class="tooltip">
+                            <span class="tooltip-icon">?</span>
+                            <span class="tooltip-text">{response_options[q_type][st.session_state.language]['tooltip']}</span>
+                        </div>
+                    </div>
+                    """,
+                    unsafe_allow_html=True
+                )
+                descriptions = response_options[q_type][st.session_state.language]["descriptions"]
+                scores = response_options[q_type][st.session_state.language]["scores"]
+                key = radio_key(category, q_idx)
+                # Widgets of pages not shown are dropped by Streamlit; restore them from the saved answer
+                stored = st.session_state.responses[category][q_idx]
+                if key not in st.session_state and stored in scores:
+                    st.session_state[key] = descriptions[scores.index(stored)]
+                selected_description = st.radio(
+                    "",
+                    descriptions,
+                    key=key,
+                    horizontal=False,
+                    help=response_options[q_type][st.session_state.language]['tooltip'],
+                    label_visibility="hidden"
+                )
+                score_idx = descriptions.index(selected_description)
+                st.session_state.responses[category][q_idx] = scores[score_idx]
+        st.markdown('</div>', unsafe_allow_html=True)
+
+@st.cache_resource
+def get_question_search(question_bank_key: Tuple[str, Optional[str]]) -> List[QuestionIndex]:
+    # One index per language of the bank, so a term in either language finds the question
+    return build_indexes(questions, list(next(iter(questions.values()))))
+
+def render_question_search():
+    labels = TRANSLATIONS[st.session_state.language]
+    query = st.text_input(labels["search_label"], key="question_search", placeholder=labels["search_placeholder"])
+    if not query:
+        return
+    indexes = get_question_search(QUESTION_BANK_KEY)
+    start_time = time.perf_counter()
+    hits = search_any(indexes, query)
+    metrics.SEARCH_SECONDS.observe(time.perf_counter() - start_time)
+    if not hits:
+        st.caption(labels["search_no_results"])
+        return
+    internal_categories = [category_mapping[st.session_state.language][display_cat] for display_cat in display_categories]
+    for hit in hits:
+        text, _, recommendation = questions[hit.category][st.session_state.language][hit.q_idx]
+        number = hit.position + 1
+        category_idx = internal_categories.index(hit.category)
+        if st.button(
+            f"{number}. {text[:70]}{'…' if len(text) > 70 else ''}",
+            key=f"search_hit_{number}",
+            use_container_width=True,
+            on_click=go_to_category if paged else None,
+            args=(category_idx,) if paged else None
+        ) and not paged:
+            st.markdown(f'<script>scrollToCategory("question_{number}")</script>', unsafe_allow_html=True)
+        if hit.recommendation_match:
+            st.caption(f"{labels['suggestion']}: {recommendation}")
+
 # Sidebar
 with st.sidebar:
     st.markdown('<section class="sidebar-container" role="navigation" aria-label="Audit Navigation">', unsafe_allow_html=True)
-    st.image("assets/FOBO2.png", width=250, caption="LEAN 2.0 Institute")
+    st.image(get_tenant_registry().logo_bytes(TENANT), width=250, caption="LEAN 2.0 Institute")
     # Contact Information
     email_link = f'<a href="mailto:{CONFIG["contact"]["email"]}">{CONFIG["contact"]["email"]}</a>'
     website_link = f'<a href="{CONFIG["contact"]["website"]}">{CONFIG["contact"]["website"]}</a>'
     contact_text = TRANSLATIONS[st.session_state.language]["contact_info"].format(email_link, website_link)
     st.markdown(f'<div class="contact-info">{contact_text}</div>', unsafe_allow_html=True)
+    resume_query = f"?tenant={TENANT['id']}&resume={st.session_state.report_id}" if TENANT["id"] != CONFIG["tenants"]["default"] else f"?resume={st.session_state.report_id}"
+    st.markdown(f'<div class="contact-info"><a href="{resume_query}">{TRANSLATIONS[st.session_state.language]["resume_link"]}</a></div>', unsafe_allow_html=True)
     st.selectbox(
         "Idioma / Language",
         ["Español", "English"],
@@ -544,9 +780,12 @@ with st.sidebar:
             display_cat,
             key=f"nav_{i}",
             use_container_width=True,
-            type="secondary"
-        ):
+            type="primary" if paged and i == st.session_state.current_category else "secondary",
+            on_click=go_to_category if paged else None,
+            args=(i,) if paged else None
+        ) and not paged:
             st.markdown(f'<script>scrollToCategory("{category_id}")</script>', unsafe_allow_html=True)
+    render_question_search()
     if st.button(TRANSLATIONS[st.session_state.language]["reset_audit"], key="reset_audit_button", type="secondary"):
         st.session_state.reset_confirmed = True
         st.warning(TRANSLATIONS[st.session_state.language]["reset_warning"])
@@ -559,10 +798,475 @@ with st.sidebar:
                 st.session_state.reset_confirmed = False
     st.markdown('</section>', unsafe_allow_html=True)
 
+# Results page
+def render_results(responses: Dict, report_id: str, record_submission: bool = True):
+    """Results page of a completed audit; record_submission archives it once per report_id."""
+    # Results section
+    st.markdown(f'<div class="card-modern report-section" role="region" aria-label="{TRANSLATIONS[st.session_state.language]["report_title"]}">', unsafe_allow_html=True)
+    st.markdown(f'<h2 class="section-title">{TRANSLATIONS[st.session_state.language]["report_title"]}</h2>', unsafe_allow_html=True)
+    st.markdown(COMPLETION_BADGE[st.session_state.language], unsafe_allow_html=True)
+
+    # Calculate scores
+    df = build_results_frame(responses, st.session_state.language, SCORE_THRESHOLDS)
+    results = df[TRANSLATIONS[st.session_state.language]["percent"]].to_dict()
+
+    # Summary dashboard
+    st.markdown('<h3 class="subsection-title">Resumen Ejecutivo</h3>', unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        overall_score = df[TRANSLATIONS[st.session_state.language]["percent"]].mean()
+        grade, grade_description, grade_class = get_grade(overall_score)
+        st.markdown(grade_banner(grade, grade_class, overall_score, st.session_state.language), unsafe_allow_html=True)
+        st.markdown(f'<p class="grade-description">{grade_description}</p>', unsafe_allow_html=True)
+    with col2:
+        st.metric(
+            TRANSLATIONS[st.session_state.language]["high_priority_categories"],
+            len(df[df[TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["CRITICAL"]])
+        )
+    with col3:
+        st.metric(
+            TRANSLATIONS[st.session_state.language]["average_score"],
+            f"{overall_score:.1f}%"
+        )
+
+    answer_levels = responses_to_levels(responses, questions, response_options)
+    questionnaire_version = TENANT.get("questionnaire_version", DEFAULT_QUESTIONNAIRE_VERSION)
+    results_token = encode_token(answer_levels, score_table(questions, response_options).shape[1], questionnaire_version)
+    results_query = f"?tenant={TENANT['id']}&results={results_token}" if TENANT["id"] != CONFIG["tenants"]["default"] else f"?results={results_token}"
+    st.markdown(f'<div class="contact-info"><a href="{results_query}">{TRANSLATIONS[st.session_state.language]["results_link"]}</a></div>', unsafe_allow_html=True)
+
+    # Peer percentiles, recorded once per submitted report
+    peer_index = get_peer_index(QUESTION_BANK_KEY)
+    peer_scores = {**results, OVERALL_KEY: overall_score}
+    if record_submission and st.session_state.get("peer_recorded_report_id") != report_id:
+        peer_index.add(peer_scores)
+        organization = CAMPAIGN["organization"] if CAMPAIGN else TENANT["id"]
+        # Duplicates of any archived audit and outliers against the organization's archived scores
+        archive_screening = get_archive_screening(QUESTION_BANK_KEY)
+        archive_screening.refresh(get_audit_archive())
+        get_audit_archive().add({
+            "report_id": report_id,
+            "language": st.session_state.language,
+            "organization": organization,
+            "campaign": CAMPAIGN["campaign_id"] if CAMPAIGN else "",
+            "answers": encode_answers(answer_levels),
+            "overall_score": overall_score,
+            "quality_flags": int(archive_screening.screen([answer_levels], [organization])[0])
+        })
+        st.session_state.peer_recorded_report_id = report_id
+        # Fold the new audit into the drill-down cube once it has been built
+        drilldown_cube = get_drilldown_cube(QUESTION_BANK_KEY)
+        if drilldown_cube.last_rowid:
+            drilldown_cube.refresh(get_audit_archive())
+        get_autosave_writer().discard(report_id)
+        metrics.SUBMISSIONS.inc(language=st.session_state.language)
+        metrics.RERUNS_PER_SUBMISSION.observe(st.session_state.reruns_this_audit)
+        st.session_state.reruns_this_audit = 0
+    else:
+        peer_index.refresh()
+    if len(peer_index) >= CONFIG["peer_index"]["min_peers"]:
+        percentiles = peer_index.percentiles(peer_scores)
+        st.markdown(
+            f'<div class="alert alert-info">{TRANSLATIONS[st.session_state.language]["percentile_text"].format(format_percentile(percentiles[OVERALL_KEY]), len(peer_index))}</div>',
+            unsafe_allow_html=True
+        )
+    else:
+        percentiles = {}
+        st.caption(TRANSLATIONS[st.session_state.language]["not_enough_peers"])
+
+    # Color-coded dataframe
+    df_view = df.copy()
+    if percentiles:
+        df_view[TRANSLATIONS[st.session_state.language]["peer_percentile"]] = [format_percentile(percentiles[cat]) for cat in df.index]
+    st.dataframe(
+        df_view.style.map(color_percent, thresholds=SCORE_THRESHOLDS, subset=[TRANSLATIONS[st.session_state.language]["percent"]]).format({TRANSLATIONS[st.session_state.language]["percent"]: "{:.1f}%"}),
+        use_container_width=True
+    )
+
+    # Everything that shapes the generated reports besides per-report options
+    REPORT_DATE = report_date()
+    report_fingerprint = cache_key(
+        results_token,
+        st.session_state.language,
+        TENANT["id"],
+        questionnaire_version,
+        SCORE_THRESHOLDS,
+        CONFIG["contact"],
+        REPORT_DATE
+    )
+    report_cache = get_report_cache()
+
+    # Bar chart with improvements
+    df_display = build_display_frame(df, st.session_state.language, category_mapping)
+    fig = report_cache.get_or_create_figure(
+        cache_key("overview_chart", report_fingerprint),
+        lambda: build_overview_chart(df_display, st.session_state.language, SCORE_THRESHOLDS)
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.markdown(TRANSLATIONS[st.session_state.language]["reference_lines"].format(SCORE_THRESHOLDS["CRITICAL"], SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"], SCORE_THRESHOLDS["GOOD"]), unsafe_allow_html=True)
+
+    # Question-level breakdown with improvements
+    with st.expander(TRANSLATIONS[st.session_state.language]["question_breakdown"]):
+        selected_display_category = st.selectbox(
+            TRANSLATIONS[st.session_state.language]["select_category"],
+            display_categories,
+            key="category_explore"
+        )
+        selected_category = category_mapping[st.session_state.language][selected_display_category]
+        show_low_scores = st.checkbox(TRANSLATIONS[st.session_state.language]["show_low_scores"], key="show_low_scores")
+        fig_questions = report_cache.get_or_create_figure(
+            cache_key("question_chart", report_fingerprint, selected_category, show_low_scores),
+            lambda: build_question_chart(
+                questions,
+                responses,
+                selected_category,
+                selected_display_category,
+                st.session_state.language,
+                SCORE_THRESHOLDS,
+                low_scores_only=show_low_scores
+            )
+        )
+        st.plotly_chart(fig_questions, use_container_width=True)
+
+    # Actionable insights
+    with st.expander(TRANSLATIONS[st.session_state.language]["actionable_insights"]):
+        insights = category_insights(df, questions, st.session_state.language, SCORE_THRESHOLDS, category_mapping)
+        if insights:
+            st.markdown("<div class='alert alert-info'>" + "<br>".join(insights) + "</div>", unsafe_allow_html=True)
+        else:
+            st.markdown(
+                f"<div class='alert alert-success'>{TRANSLATIONS[st.session_state.language]['all_categories_above_70']}</div>",
+                unsafe_allow_html=True
+            )
+
+    # What-if ranking of recommendations; cheap enough to recompute on every rerun
+    improvements = improvement_frame(
+        rank_improvements(
+            answer_levels,
+            questions,
+            response_options,
+            SCORE_THRESHOLDS
+        ),
+        questions,
+        response_options,
+        st.session_state.language,
+        TRANSLATIONS[st.session_state.language],
+        category_mapping
+    )
+    with st.expander(TRANSLATIONS[st.session_state.language]["improvement_ranking"], expanded=True):
+        if improvements.empty:
+            st.markdown(
+                f"<div class='alert alert-success'>{TRANSLATIONS[st.session_state.language]['improvement_none']}</div>",
+                unsafe_allow_html=True
+            )
+        else:
+            st.caption(TRANSLATIONS[st.session_state.language]["improvement_ranking_caption"])
+            st.dataframe(improvements, hide_index=True, use_container_width=True)
+
+    # Best set of recommendations within the client's effort budget
+    with st.expander(TRANSLATIONS[st.session_state.language]["action_plan"]):
+        effort_budget = st.number_input(
+            TRANSLATIONS[st.session_state.language]["effort_budget"],
+            min_value=0,
+            max_value=1000,
+            value=int(TENANT.get("effort_budget", CONFIG["action_plan"]["budget"])),
+            step=5,
+            key="effort_budget"
+        )
+        plan = plan_actions(answer_levels, questions, response_options, SCORE_THRESHOLDS, effort_budget, recommendation_effort)
+        action_plan = action_plan_frame(
+            plan,
+            questions,
+            response_options,
+            st.session_state.language,
+            TRANSLATIONS[st.session_state.language],
+            category_mapping
+        )
+        action_plan_summary = TRANSLATIONS[st.session_state.language]["action_plan_summary"].format(
+            plan.attrs["total_effort"], plan.attrs["budget"], plan.attrs["base_overall"], plan.attrs["projected_overall"]
+        )
+        if action_plan.empty:
+            st.info(TRANSLATIONS[st.session_state.language]["action_plan_empty"])
+        else:
+            st.caption(action_plan_summary)
+            st.dataframe(action_plan, hide_index=True, use_container_width=True)
+
+    # Download Excel report
+    def generate_excel_report() -> io.BytesIO:
+        excel_output = io.BytesIO()
+        with pd.ExcelWriter(excel_output, engine='xlsxwriter') as writer:
+            workbook = writer.book
+            set_document_properties(workbook, TRANSLATIONS[st.session_state.language]["report_title"], parse_report_date(REPORT_DATE))
+            excel_formats = get_tenant_registry().excel_formats(TENANT)
+            bold = workbook.add_format(excel_formats["bold"])
+            percent_format = workbook.add_format(excel_formats["percent"])
+            wrap_format = workbook.add_format(excel_formats["wrap"])
+            border_format = workbook.add_format(excel_formats["border"])
+            header_format = workbook.add_format(excel_formats["header"])
+
+            # Single Actionable Worksheet
+            worksheet = workbook.add_worksheet(TRANSLATIONS[st.session_state.language]["actionable"])
+            row = 0
+
+            # Report Title and Date
+            worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["report_title"], bold)
+            row += 1
+            worksheet.write(row, 0, f"Date: {REPORT_DATE}", bold)
+            row += 2
+
+            # Summary Section
+            worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["summary"], bold)
+            row += 1
+            critical_count = len(df[df[TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["CRITICAL"]])
+            improvement_count = len(df[(df[TRANSLATIONS[st.session_state.language]["percent"]] >= SCORE_THRESHOLDS["CRITICAL"]) & (df[TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"])])
+            summary_df = pd.DataFrame({
+                TRANSLATIONS[st.session_state.language]["overall_score"]: [f"{overall_score:.1f}%"],
+                TRANSLATIONS[st.session_state.language]["grade"]: [grade],
+                TRANSLATIONS[st.session_state.language]["findings_summary"]: [
+                    TRANSLATIONS[st.session_state.language]["findings_summary_text"].format(
+                        critical_count,
+                        SCORE_THRESHOLDS["CRITICAL"],
+                        improvement_count,
+                        SCORE_THRESHOLDS["CRITICAL"],
+                        SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"]-1,
+                        overall_score
+                    )
+                ]
+            })
+            if percentiles:
+                summary_df[TRANSLATIONS[st.session_state.language]["peer_percentile"]] = [format_percentile(percentiles[OVERALL_KEY])]
+            summary_df.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], index=False, startrow=row)
+            for col_num, value in enumerate(summary_df.columns.values):
+                worksheet.write(row, col_num, value, header_format)
+            row += len(summary_df) + 2
+
+            # Contact Section
+            worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["contact"], bold)
+            row += 1
+            contact_df = pd.DataFrame({
+                "Contact Method": ["Email", "Website"],
+                "Details": [CONFIG["contact"]["email"], CONFIG["contact"]["website"]]
+            })
+            contact_df.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], index=False, startrow=row)
+            for col_num, value in enumerate(contact_df.columns.values):
+                worksheet.write(row, col_num, value, header_format)
+            row += len(contact_df) + 1
+            worksheet.write(row, 0, "¡Trabajemos juntos!|Let's work together!", bold)
+            row += 1
+            worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["marketing_message"], wrap_format)
+            row += 2
+
+            # Results Section
+            worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["results"], bold)
+            row += 1
+            results_export = df_display.copy()
+            if percentiles:
+                results_export[TRANSLATIONS[st.session_state.language]["peer_percentile"]] = [
+                    format_percentile(percentiles[category_mapping[st.session_state.language][idx]]) for idx in df_display.index
+                ]
+            results_export.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], float_format="%.1f", startrow=row+1)
+            for col_num, value in enumerate(results_export.columns.values):
+                worksheet.write(row+1, col_num + 1, value, header_format)
+            worksheet.write(row+1, 0, TRANSLATIONS[st.session_state.language]["category"], header_format)
+            row += len(df_display) + 3
+
+            # Findings Section
+            worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["findings"], bold)
+            row += 1
+            findings_data = []
+            for cat in questions.keys():
+                display_cat = next(k for k, v in category_mapping[st.session_state.language].items() if v == cat)
+                if df.loc[cat, TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"]:
+                    findings_data.append([
+                        display_cat,
+                        f"{df.loc[cat, TRANSLATIONS[st.session_state.language]['percent']]:.1f}%",
+                        TRANSLATIONS[st.session_state.language]["high_priority"] if df.loc[cat, TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["CRITICAL"] else TRANSLATIONS[st.session_state.language]["medium_priority"],
+                        TRANSLATIONS[st.session_state.language]["action_required"].format(
+                            "Urgent" if df.loc[cat, TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["CRITICAL"] else "Specific"
+                        )
+                    ])
+                    for idx, score in enumerate(responses[cat]):
+                        if score < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"]:
+                            question, _, rec = questions[cat][st.session_state.language][idx]
+                            findings_data.append([
+                                "", "", "", f"{TRANSLATIONS[st.session_state.language]['question']}: {question[:50]}... - {TRANSLATIONS[st.session_state.language]['suggestion']}: {rec}"
+                            ])
+            findings_df = pd.DataFrame(
+                findings_data,
+                columns=[
+                    TRANSLATIONS[st.session_state.language]["category"],
+                    TRANSLATIONS[st.session_state.language]["score"],
+                    TRANSLATIONS[st.session_state.language]["priority"],
+                    TRANSLATIONS[st.session_state.language]["findings_and_suggestions"]
+                ]
+            )
+            findings_df.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], index=False, startrow=row)
+            for col_num, value in enumerate(findings_df.columns.values):
+                worksheet.write(row, col_num, value, header_format)
+            row += len(findings_df) + 2
+
+            # Highest-impact improvements
+            if not improvements.empty:
+                worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["improvement_ranking"], bold)
+                row += 1
+                improvements.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], index=False, startrow=row)
+                for col_num, value in enumerate(improvements.columns.values):
+                    worksheet.write(row, col_num, value, header_format)
+                row += len(improvements) + 2
+
+            # Action plan within the effort budget
+            worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["action_plan"], bold)
+            row += 1
+            if action_plan.empty:
+                worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["action_plan_empty"])
+                row += 2
+            else:
+                worksheet.write(row, 0, action_plan_summary, wrap_format)
+                row += 1
+                action_plan.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], index=False, startrow=row)
+                for col_num, value in enumerate(action_plan.columns.values):
+                    worksheet.write(row, col_num, value, header_format)
+                row += len(action_plan) + 2
+
+            # Actionable Insights Section
+            worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["actionable_insights"], bold)
+            row += 1
+            insights_data = []
+            for cat in questions.keys():
+                display_cat = next(k for k, v in category_mapping[st.session_state.language].items() if v == cat)
+                score = df.loc[cat, TRANSLATIONS[st.session_state.language]["percent"]]
+                if score < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"]:
+                    insights_data.append([display_cat, f"{score:.1f}%", "Focus on immediate improvements."])
+            insights_df = pd.DataFrame(
+                insights_data,
+                columns=[
+                    TRANSLATIONS[st.session_state.language]["category"],
+                    TRANSLATIONS[st.session_state.language]["score"],
+                    TRANSLATIONS[st.session_state.language]["actionable_insights"]
+                ]
+            )
+            insights_df.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], index=False, startrow=row)
+            for col_num, value in enumerate(insights_df.columns.values):
+                worksheet.write(row, col_num, value, header_format)
+            row += len(insights_df) + 2
+
+            # Actionable Charts Section
+            worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["actionable_charts"], bold)
+            row += 1
+            chart_data = df_display[[TRANSLATIONS[st.session_state.language]["percent"]]].reset_index()
+            chart_data.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], startrow=row, index=False)
+            worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["category"], header_format)
+            worksheet.write(row, 1, TRANSLATIONS[st.session_state.language]["score_percent"], header_format)
+            bar_chart = workbook.add_chart({'type': 'bar'})
+            bar_chart.add_series({
+                'name': TRANSLATIONS[st.session_state.language]["score_percent"],
+                'categories': f"='{TRANSLATIONS[st.session_state.language]['actionable']}'!$A${row+1}:$A${row+len(chart_data)}",
+                'values': f"='{TRANSLATIONS[st.session_state.language]['actionable']}'!$B${row+1}:$B${row+len(chart_data)}",
+                'fill': {'color': '#1E88E5'}
+            })
+            bar_chart.set_title({'name': TRANSLATIONS[st.session_state.language]["chart_title"]})
+            bar_chart.set_x_axis({'name': TRANSLATIONS[st.session_state.language]["score_percent"], 'min': 0, 'max': 100})
+            bar_chart.set_y_axis({'name': TRANSLATIONS[st.session_state.language]["category"]})
+            worksheet.insert_chart(f'D{row+1}', bar_chart)
+            row += len(chart_data) + 2
+
+            # Set column widths
+            worksheet.set_column('A:A', 30)
+            worksheet.set_column('B:B', 15)
+            worksheet.set_column('C:C', 20)
+            worksheet.set_column('D:D', 80, wrap_format)
+
+        excel_output.seek(0)
+        return excel_output
+
+    with st.spinner(TRANSLATIONS[st.session_state.language]["generating_excel"]):
+        try:
+            excel_cache_key = (report_id, st.session_state.language, tuple(sorted(percentiles.items())), effort_budget)
+
+            def build_excel_bytes() -> bytes:
+                start_time = time.perf_counter()
+                excel_bytes = generate_excel_report().getvalue()
+                metrics.EXCEL_SECONDS.observe(time.perf_counter() - start_time, generator="app")
+                metrics.EXCEL_BYTES.observe(len(excel_bytes), generator="app")
+                return excel_bytes
+
+            # Held per session until it goes idle; after that another worker may still have it on disk
+            excel_bytes, excel_cache_hit = get_session_lifecycle().get_or_create(
+                SESSION_ID,
+                "excel_report",
+                excel_cache_key,
+                lambda: report_cache.get_or_create(
+                    cache_key("excel_report", report_fingerprint, sorted(percentiles.items()), effort_budget),
+                    build_excel_bytes
+                ),
+                sizeof=len
+            )
+            metrics.record_cache("excel_report", excel_cache_hit)
+            excel_file = io.BytesIO(excel_bytes)
+            st.download_button(
+                label=TRANSLATIONS[st.session_state.language]["download_excel"],
+                data=excel_file,
+                file_name=TRANSLATIONS[st.session_state.language]["report_filename_excel"],
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                key="download_excel",
+                use_container_width=True,
+                type="primary"
+            )
+        except Exception as e:
+            st.error(TRANSLATIONS[st.session_state.language]["excel_error"].format(str(e)), icon="❌")
+
+    # Self-contained page with the same table, charts and insights for sharing offline
+    st.download_button(
+        label=TRANSLATIONS[st.session_state.language]["download_html"],
+        data=report_cache.get_or_create(
+            cache_key("html_report", report_fingerprint, sorted(percentiles.items())),
+            lambda: render_html_report(
+                responses,
+                questions,
+                st.session_state.language,
+                SCORE_THRESHOLDS,
+                CONFIG,
+                REPORT_DATE,
+                category_mapping=category_mapping,
+                percentiles=percentiles,
+                include_plotlyjs="cdn"
+            ).encode("utf-8")
+        ),
+        file_name=TRANSLATIONS[st.session_state.language]["report_filename_html"],
+        mime="text/html",
+        key="download_html",
+        use_container_width=True
+    )
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# Shared results links are rebuilt from the answer token alone, so any worker can serve them
+shared_token = st.query_params.get("results")
+if shared_token:
+    with st.container():
+        st.markdown('<section class="main-container" role="main">', unsafe_allow_html=True)
+        try:
+            token_levels = decode_token(
+                shared_token,
+                len(question_layout(questions)),
+                score_table(questions, response_options).shape[1],
+                TENANT.get("questionnaire_version", DEFAULT_QUESTIONNAIRE_VERSION)
+            )
+        except ValueError:
+            st.error(TRANSLATIONS[st.session_state.language]["invalid_results_token"], icon="❌")
+        else:
+            render_results(levels_to_responses(token_levels, questions, response_options), f"token-{shared_token}", record_submission=False)
+        st.markdown('</section>', unsafe_allow_html=True)
+    st.stop()
+
 # Main content
 with st.container():
     st.markdown('<section class="main-container" role="main">', unsafe_allow_html=True)
     st.markdown(f'<h1 class="main-title">{TRANSLATIONS[st.session_state.language]["header"]}</h1>', unsafe_allow_html=True)
+    if CAMPAIGN:
+        st.info(TRANSLATIONS[st.session_state.language]["campaign_banner"].format(CAMPAIGN["name"]))
+    elif st.session_state.campaign_unknown:
+        st.warning(TRANSLATIONS[st.session_state.language]["campaign_unknown"], icon="⚠️")
     st.markdown(
         f"""
         <div class="intro-content">
@@ -572,62 +1276,75 @@ with st.container():
         unsafe_allow_html=True
     )
 
-    # Display all categories and questions
-    for idx, display_category in enumerate(display_categories):
-        category = category_mapping[st.session_state.language][display_category]
-        category_id = f"category_{idx}"
-        with st.container():
-            st.markdown(f'<div id="{category_id}" class="card-modern" role="region" aria-label="Category {display_category} Questions">', unsafe_allow_html=True)
-            st.markdown(f'<h2 class="section-title">{display_category}</h2>', unsafe_allow_html=True)
-            for q_idx, (q, q_type, _) in enumerate(questions[category][st.session_state.language]):
-                with st.container():
-                    is_unanswered = st.session_state.responses[category][q_idx] is None
-                    st.markdown(
-                        f"""
-                        <div class="question-container">
-                            <label class="question-text" for="{category}_{q_idx}">
-                                {sanitize_input(q)} {'<span class="required" aria-label="Required">*</span>' if is_unanswered else ''}
-                            </label>
-                            <div class="tooltip">
-                                <span class="tooltip-icon">?</span>
-                                <span class="tooltip-text">{response_options[q_type][st.session_state.language]['tooltip']}</span>
-                            </div>
-                        </div>
-                        """,
-                        unsafe_allow_html=True
-                    )
-                    descriptions = response_options[q_type][st.session_state.language]["descriptions"]
-                    scores = response_options[q_type][st.session_state.language]["scores"]
-                    radio_key = f"{category}_{q_idx}_{st.session_state.report_id}"
-                    selected_description = st.radio(
-                        "",
-                        descriptions,
-                        key=radio_key,
-                        horizontal=False,
-                        help=response_options[q_type][st.session_state.language]['tooltip'],
-                        label_visibility="hidden"
-                    )
-                    score_idx = descriptions.index(selected_description)
-                    st.session_state.responses[category][q_idx] = scores[score_idx]
-            st.markdown('</div>', unsafe_allow_html=True)
-
-    # Submit Answers button
-    if st.button(
-        TRANSLATIONS[st.session_state.language]["submit_answers"],
-        key="submit_answers",
-        type="primary",
-        use_container_width=True
-    ):
+    # Display the questions; in form mode the answers stay in the browser until submitted
+    form_mode = CONFIG["questionnaire_mode"] == "form"
+    submit_label = TRANSLATIONS[st.session_state.language]["submit_answers"]
+    if not paged:
+        with st.form("questionnaire_form", border=False) if form_mode else st.container():
+            for idx, display_category in enumerate(display_categories):
+                render_category(idx, display_category)
+
+            # Submit Answers button
+            if form_mode:
+                submitted = st.form_submit_button(submit_label, type="primary", use_container_width=True)
+            else:
+                submitted = st.button(submit_label, key="submit_answers", type="primary", use_container_width=True)
+    else:
+        # Only the current category is rendered; the others live in session state until visited
+        current = st.session_state.current_category
+        last = len(display_categories) - 1
+        answered = sum(score is not None for scores in st.session_state.responses.values() for score in scores)
+        st.caption(TRANSLATIONS[st.session_state.language]["page_progress"].format(
+            current + 1, len(display_categories), answered, len(question_layout(questions))
+        ))
+        with st.form(f"questionnaire_form_{current}", border=False) if form_mode else st.container():
+            render_category(current, display_categories[current])
+            nav_button = st.form_submit_button if form_mode else st.button
+            col1, col2 = st.columns(2)
+            with col1:
+                nav_button(
+                    TRANSLATIONS[st.session_state.language]["previous_page"],
+                    on_click=go_to_category,
+                    args=(max(current - 1, 0),),
+                    disabled=current == 0,
+                    use_container_width=True,
+                    **({} if form_mode else {"key": "previous_page"})
+                )
+            with col2:
+                nav_button(
+                    TRANSLATIONS[st.session_state.language]["next_page"],
+                    on_click=go_to_category,
+                    args=(min(current + 1, last),),
+                    disabled=current == last,
+                    use_container_width=True,
+                    **({} if form_mode else {"key": "next_page"})
+                )
+            # Submitting from any page also saves that page's answers
+            if form_mode:
+                submitted = st.form_submit_button(submit_label, type="primary", use_container_width=True)
+            else:
+                submitted = st.button(submit_label, key="submit_answers", type="primary", use_container_width=True)
+    if submitted:
         st.session_state.submit_clicked = True
 
-    # Check audit completion
-    audit_complete = all(
-        all(score is not None for score in scores)
-        for scores in st.session_state.responses.values()
-    )
+    # Autosave changed answers; the writer coalesces rapid clicks into one write
+    autosave_snapshot = json.dumps(st.session_state.responses, sort_keys=True)
+    if autosave_snapshot != st.session_state.get("autosave_snapshot"):
+        get_autosave_writer().schedule(st.session_state.report_id, {
+            "tenant_id": st.session_state.tenant_id,
+            "language": st.session_state.language,
+            "responses": {cat: list(scores) for cat, scores in st.session_state.responses.items()}
+        })
+        st.session_state.autosave_snapshot = autosave_snapshot
+    if st.query_params.get("resume") != st.session_state.report_id:
+        st.query_params["resume"] = st.session_state.report_id
 
-    # Handle submit logic
+    # Handle submit logic; completeness is only checked once answers are submitted
     if st.session_state.submit_clicked:
+        audit_complete = all(
+            all(score is not None for score in scores)
+            for scores in st.session_state.responses.values()
+        )
         if not audit_complete:
             unanswered_questions = []
             question_counter = 1
@@ -641,7 +1358,7 @@ with st.container():
                             q[:QUESTION_TRUNCATE_LENGTH] + ("..." if len(q) > QUESTION_TRUNCATE_LENGTH else "")
                         )
                         unanswered_questions.append(
-                            f"{display_cat}: Pregunta {question_counter} - {truncated_q}"
+                            f"{display_cat}: {TRANSLATIONS[st.session_state.language]['question']} {question_counter} - {truncated_q}"
                         )
                     question_counter += 1
             st.error(
@@ -666,323 +1383,6 @@ with st.container():
                 TRANSLATIONS[st.session_state.language]["all_answered"],
                 icon="✅"
             )
-            # Results section
-            st.markdown(f'<div class="card-modern report-section" role="region" aria-label="{TRANSLATIONS[st.session_state.language]["report_title"]}">', unsafe_allow_html=True)
-            st.markdown(f'<h2 class="section-title">{TRANSLATIONS[st.session_state.language]["report_title"]}</h2>', unsafe_allow_html=True)
-            st.markdown(
-                '<div class="badge">🏆 ¡Auditoría Completada! ¡Gracias por tu compromiso con la construcción de un entorno laboral saludable, seguro y respetuoso para todas las personas!</div>' if st.session_state.language == "Español" else
-                '<div class="badge">🏆 Audit Completed! Thank you for your commitment to fostering a healthy, safe, and respectful work environment for everyone!</div>',
-                unsafe_allow_html=True
-            )
-
-            # Calculate scores
-            results = {cat: sum(scores) / len(scores) for cat, scores in st.session_state.responses.items()}
-            df = pd.DataFrame.from_dict(results, orient="index", columns=[TRANSLATIONS[st.session_state.language]["score"]])
-            df[TRANSLATIONS[st.session_state.language]["percent"]] = df[TRANSLATIONS[st.session_state.language]["score"]]
-            df[TRANSLATIONS[st.session_state.language]["priority"]] = df[TRANSLATIONS[st.session_state.language]["percent"]].apply(
-                lambda x: TRANSLATIONS[st.session_state.language]["high_priority"] if x < SCORE_THRESHOLDS["CRITICAL"] else 
-                          TRANSLATIONS[st.session_state.language]["medium_priority"] if x < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"] else 
-                          TRANSLATIONS[st.session_state.language]["low_priority"]
-            )
-
-            # Summary dashboard
-            st.markdown('<h3 class="subsection-title">Resumen Ejecutivo</h3>', unsafe_allow_html=True)
-            col1, col2, col3 = st.columns([2, 1, 1])
-            with col1:
-                overall_score = df[TRANSLATIONS[st.session_state.language]["percent"]].mean()
-                grade, grade_description, grade_class = get_grade(overall_score)
-                st.markdown(
-                    f'<div class="grade {grade_class}">Calificación General: {grade} ({overall_score:.1f}%)</div>' if st.session_state.language == "Español" else
-                    f'<div class="grade {grade_class}">Overall Grade: {grade} ({overall_score:.1f}%)</div>',
-                    unsafe_allow_html=True
-                )
-                st.markdown(f'<p class="grade-description">{grade_description}</p>', unsafe_allow_html=True)
-            with col2:
-                st.metric(
-                    TRANSLATIONS[st.session_state.language]["high_priority_categories"],
-                    len(df[df[TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["CRITICAL"]])
-                )
-            with col3:
-                st.metric(
-                    TRANSLATIONS[st.session_state.language]["average_score"],
-                    f"{overall_score:.1f}%"
-                )
-
-            # Color-coded dataframe
-            def color_percent(val):
-                color = CHART_COLORS[0] if val < SCORE_THRESHOLDS["CRITICAL"] else CHART_COLORS[1] if val < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"] else CHART_COLORS[2]
-                return f'background-color: {color}; color: white;'
-
-            st.dataframe(
-                df.style.applymap(color_percent, subset=[TRANSLATIONS[st.session_state.language]["percent"]]).format({TRANSLATIONS[st.session_state.language]["percent"]: "{:.1f}%"}),
-                use_container_width=True
-            )
-
-            # Bar chart with improvements
-            df_display = df.copy()
-            df_display.index = [next(k for k, v in category_mapping[st.session_state.language].items() if v == idx) for idx in df.index]
-            df_display = df_display.sort_values(by=TRANSLATIONS[st.session_state.language]["percent"], ascending=True)  # Sort by score ascending
-            fig = px.bar(
-                df_display.reset_index(),
-                y="index",
-                x=TRANSLATIONS[st.session_state.language]["percent"],
-                orientation='h',
-                title=TRANSLATIONS[st.session_state.language]["chart_title"],
-                labels={
-                    "index": TRANSLATIONS[st.session_state.language]["category"],
-                    TRANSLATIONS[st.session_state.language]["percent"]: TRANSLATIONS[st.session_state.language]["score_percent"]
-                },
-                color=TRANSLATIONS[st.session_state.language]["percent"],
-                color_continuous_scale=CHART_COLORS,
-                range_x=[0, 100],
-                height=CHART_HEIGHT
-            )
-            fig.update_layout(
-                showlegend=False,
-                title_x=0.5,
-                xaxis_title=TRANSLATIONS[st.session_state.language]["score_percent"],
-                yaxis_title=TRANSLATIONS[st.session_state.language]["category"],
-                coloraxis_showscale=False
-            )
-            # Add reference lines
-            fig.add_vline(x=50, line_dash="dash", line_color="black")
-            fig.add_vline(x=70, line_dash="dot", line_color="black")
-            fig.add_vline(x=85, line_dash="dashdot", line_color="black")
-            st.plotly_chart(fig, use_container_width=True)
-            st.markdown(TRANSLATIONS[st.session_state.language]["reference_lines"], unsafe_allow_html=True)
-
-            # Question-level breakdown with improvements
-            with st.expander(TRANSLATIONS[st.session_state.language]["question_breakdown"]):
-                selected_display_category = st.selectbox(
-                    TRANSLATIONS[st.session_state.language]["select_category"],
-                    display_categories,
-                    key="category_explore"
-                )
-                selected_category = category_mapping[st.session_state.language][selected_display_category]
-                question_scores = pd.DataFrame({
-                    TRANSLATIONS[st.session_state.language]["question"]: [q for q, _, _ in questions[selected_category][st.session_state.language]],
-                    TRANSLATIONS[st.session_state.language]["score"]: st.session_state.responses[selected_category]
-                })
-                show_low_scores = st.checkbox(TRANSLATIONS[st.session_state.language]["show_low_scores"], key="show_low_scores")
-                if show_low_scores:
-                    filtered_scores = question_scores[question_scores[TRANSLATIONS[st.session_state.language]["score"]] < 70]
-                    title_suffix = " (Below 70%)"
-                else:
-                    filtered_scores = question_scores
-                    title_suffix = ""
-                fig_questions = px.bar(
-                    filtered_scores,
-                    x=TRANSLATIONS[st.session_state.language]["score"],
-                    y=TRANSLATIONS[st.session_state.language]["question"],
-                    orientation='h',
-                    title=f"{TRANSLATIONS[st.session_state.language]['question_scores_for']} {selected_display_category}{title_suffix}",
-                    color=TRANSLATIONS[st.session_state.language]["score"],
-                    color_continuous_scale=CHART_COLORS,
-                    range_x=[0, 100],
-                    height=300 + len(filtered_scores) * 50
-                )
-                fig_questions.update_layout(
-                    showlegend=False,
-                    title_x=0.5,
-                    xaxis_title=TRANSLATIONS[st.session_state.language]["score_percent"],
-                    yaxis_title=TRANSLATIONS[st.session_state.language]["question"],
-                    coloraxis_showscale=False
-                )
-                # Add reference lines
-                fig_questions.add_vline(x=50, line_dash="dash", line_color="black")
-                fig_questions.add_vline(x=70, line_dash="dot", line_color="black")
-                fig_questions.add_vline(x=85, line_dash="dashdot", line_color="black")
-                st.plotly_chart(fig_questions, use_container_width=True)
-
-            # Actionable insights
-            with st.expander(TRANSLATIONS[st.session_state.language]["actionable_insights"]):
-                insights = []
-                for cat in questions.keys():
-                    display_cat = next(k for k, v in category_mapping[st.session_state.language].items() if v == cat)
-                    score = df.loc[cat, TRANSLATIONS[st.session_state.language]["percent"]]
-                    if score < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"]:
-                        insights.append(
-                            f"**{display_cat}** scored {score:.1f}% ({TRANSLATIONS[st.session_state.language]['high_priority'] if score < SCORE_THRESHOLDS['CRITICAL'] else TRANSLATIONS[st.session_state.language]['medium_priority']}). Focus on immediate improvements."
-                        )
-                if insights:
-                    st.markdown("<div class='alert alert-info'>" + "<br>".join(insights) + "</div>", unsafe_allow_html=True)
-                else:
-                    st.markdown(
-                        f"<div class='alert alert-success'>{TRANSLATIONS[st.session_state.language]['all_categories_above_70']}</div>",
-                        unsafe_allow_html=True
-                    )
-
-            # Download Excel report
-            def generate_excel_report() -> io.BytesIO:
-                excel_output = io.BytesIO()
-                with pd.ExcelWriter(excel_output, engine='xlsxwriter') as writer:
-                    workbook = writer.book
-                    bold = workbook.add_format({'bold': True})
-                    percent_format = workbook.add_format({'num_format': '0.0%'})
-                    wrap_format = workbook.add_format({'text_wrap': True})
-                    border_format = workbook.add_format({'border': 1})
-                    header_format = workbook.add_format({'bold': True, 'bg_color': '#1E88E5', 'color': 'white', 'border': 1})
-
-                    # Single Actionable Worksheet
-                    worksheet = workbook.add_worksheet(TRANSLATIONS[st.session_state.language]["actionable"])
-                    row = 0
-
-                    # Report Title and Date
-                    worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["report_title"], bold)
-                    row += 1
-                    worksheet.write(row, 0, f"Date: {REPORT_DATE}", bold)
-                    row += 2
-
-                    # Summary Section
-                    worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["summary"], bold)
-                    row += 1
-                    critical_count = len(df[df[TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["CRITICAL"]])
-                    improvement_count = len(df[(df[TRANSLATIONS[st.session_state.language]["percent"]] >= SCORE_THRESHOLDS["CRITICAL"]) & (df[TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"])])
-                    summary_df = pd.DataFrame({
-                        TRANSLATIONS[st.session_state.language]["overall_score"]: [f"{overall_score:.1f}%"],
-                        TRANSLATIONS[st.session_state.language]["grade"]: [grade],
-                        TRANSLATIONS[st.session_state.language]["findings_summary"]: [
-                            TRANSLATIONS[st.session_state.language]["findings_summary_text"].format(
-                                critical_count,
-                                SCORE_THRESHOLDS["CRITICAL"],
-                                improvement_count,
-                                SCORE_THRESHOLDS["CRITICAL"],
-                                SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"]-1,
-                                overall_score
-                            )
-                        ]
-                    })
-                    summary_df.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], index=False, startrow=row)
-                    for col_num, value in enumerate(summary_df.columns.values):
-                        worksheet.write(row, col_num, value, header_format)
-                    row += len(summary_df) + 2
-
-                    # Contact Section
-                    worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["contact"], bold)
-                    row += 1
-                    contact_df = pd.DataFrame({
-                        "Contact Method": ["Email", "Website"],
-                        "Details": [CONFIG["contact"]["email"], CONFIG["contact"]["website"]]
-                    })
-                    contact_df.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], index=False, startrow=row)
-                    for col_num, value in enumerate(contact_df.columns.values):
-                        worksheet.write(row, col_num, value, header_format)
-                    row += len(contact_df) + 1
-                    worksheet.write(row, 0, "¡Trabajemos juntos!|Let's work together!", bold)
-                    row += 1
-                    worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["marketing_message"], wrap_format)
-                    row += 2
-
-                    # Results Section
-                    worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["results"], bold)
-                    row += 1
-                    df_display.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], float_format="%.1f", startrow=row+1)
-                    for col_num, value in enumerate(df_display.columns.values):
-                        worksheet.write(row+1, col_num + 1, value, header_format)
-                    worksheet.write(row+1, 0, TRANSLATIONS[st.session_state.language]["category"], header_format)
-                    row += len(df_display) + 3
-
-                    # Findings Section
-                    worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["findings"], bold)
-                    row += 1
-                    findings_data = []
-                    for cat in questions.keys():
-                        display_cat = next(k for k, v in category_mapping[st.session_state.language].items() if v == cat)
-                        if df.loc[cat, TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"]:
-                            findings_data.append([
-                                display_cat,
-                                f"{df.loc[cat, TRANSLATIONS[st.session_state.language]['percent']]:.1f}%",
-                                TRANSLATIONS[st.session_state.language]["high_priority"] if df.loc[cat, TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["CRITICAL"] else TRANSLATIONS[st.session_state.language]["medium_priority"],
-                                TRANSLATIONS[st.session_state.language]["action_required"].format(
-                                    "Urgent" if df.loc[cat, TRANSLATIONS[st.session_state.language]["percent"]] < SCORE_THRESHOLDS["CRITICAL"] else "Specific"
-                                )
-                            ])
-                            for idx, score in enumerate(st.session_state.responses[cat]):
-                                if score < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"]:
-                                    question, _, rec = questions[cat][st.session_state.language][idx]
-                                    findings_data.append([
-                                        "", "", "", f"{TRANSLATIONS[st.session_state.language]['question']}: {question[:50]}... - {TRANSLATIONS[st.session_state.language]['suggestion']}: {rec}"
-                                    ])
-                    findings_df = pd.DataFrame(
-                        findings_data,
-                        columns=[
-                            TRANSLATIONS[st.session_state.language]["category"],
-                            TRANSLATIONS[st.session_state.language]["score"],
-                            TRANSLATIONS[st.session_state.language]["priority"],
-                            TRANSLATIONS[st.session_state.language]["findings_and_suggestions"]
-                        ]
-                    )
-                    findings_df.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], index=False, startrow=row)
-                    for col_num, value in enumerate(findings_df.columns.values):
-                        worksheet.write(row, col_num, value, header_format)
-                    row += len(findings_df) + 2
-
-                    # Actionable Insights Section
-                    worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["actionable_insights"], bold)
-                    row += 1
-                    insights_data = []
-                    for cat in questions.keys():
-                        display_cat = next(k for k, v in category_mapping[st.session_state.language].items() if v == cat)
-                        score = df.loc[cat, TRANSLATIONS[st.session_state.language]["percent"]]
-                        if score < SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"]:
-                            insights_data.append([display_cat, f"{score:.1f}%", "Focus on immediate improvements."])
-                    insights_df = pd.DataFrame(
-                        insights_data,
-                        columns=[
-                            TRANSLATIONS[st.session_state.language]["category"],
-                            TRANSLATIONS[st.session_state.language]["score"],
-                            TRANSLATIONS[st.session_state.language]["actionable_insights"]
-                        ]
-                    )
-                    insights_df.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], index=False, startrow=row)
-                    for col_num, value in enumerate(insights_df.columns.values):
-                        worksheet.write(row, col_num, value, header_format)
-                    row += len(insights_df) + 2
-
-                    # Actionable Charts Section
-                    worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["actionable_charts"], bold)
-                    row += 1
-                    chart_data = df_display[[TRANSLATIONS[st.session_state.language]["percent"]]].reset_index()
-                    chart_data.to_excel(writer, sheet_name=TRANSLATIONS[st.session_state.language]["actionable"], startrow=row, index=False)
-                    worksheet.write(row, 0, TRANSLATIONS[st.session_state.language]["category"], header_format)
-                    worksheet.write(row, 1, TRANSLATIONS[st.session_state.language]["score_percent"], header_format)
-                    bar_chart = workbook.add_chart({'type': 'bar'})
-                    bar_chart.add_series({
-                        'name': TRANSLATIONS[st.session_state.language]["score_percent"],
-                        'categories': f"='{TRANSLATIONS[st.session_state.language]['actionable']}'!$A${row+1}:$A${row+len(chart_data)}",
-                        'values': f"='{TRANSLATIONS[st.session_state.language]['actionable']}'!$B${row+1}:$B${row+len(chart_data)}",
-                        'fill': {'color': '#1E88E5'}
-                    })
-                    bar_chart.set_title({'name': TRANSLATIONS[st.session_state.language]["chart_title"]})
-                    bar_chart.set_x_axis({'name': TRANSLATIONS[st.session_state.language]["score_percent"], 'min': 0, 'max': 100})
-                    bar_chart.set_y_axis({'name': TRANSLATIONS[st.session_state.language]["category"]})
-                    worksheet.insert_chart(f'D{row+1}', bar_chart)
-                    row += len(chart_data) + 2
-
-                    # Set column widths
-                    worksheet.set_column('A:A', 30)
-                    worksheet.set_column('B:B', 15)
-                    worksheet.set_column('C:C', 20)
-                    worksheet.set_column('D:D', 80, wrap_format)
-
-                excel_output.seek(0)
-                return excel_output
-
-            with st.spinner(TRANSLATIONS[st.session_state.language]["generating_excel"]):
-                try:
-                    excel_file = generate_excel_report()
-                    st.download_button(
-                        label=TRANSLATIONS[st.session_state.language]["download_excel"],
-                        data=excel_file,
-                        file_name=TRANSLATIONS[st.session_state.language]["report_filename_excel"],
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="download_excel",
-                        use_container_width=True,
-                        type="primary"
-                    )
-                except Exception as e:
-                    st.error(TRANSLATIONS[st.session_state.language]["excel_error"].format(str(e)), icon="❌")
-
-            st.markdown('</div>', unsafe_allow_html=True)
+            render_results(st.session_state.responses, st.session_state.report_id)
 
     st.markdown('</section>', unsafe_allow_html=True)
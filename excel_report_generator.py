@@ -1,13 +1,55 @@
 import pandas as pd
+import argparse
 import io
+import math
+import numpy as np
 import xlsxwriter
 import logging
-from typing import Dict
-from datetime import datetime
+import os
+from typing import BinaryIO, Dict, Optional, Sequence, Union
+from datetime import datetime, timezone
+from analytics import OVERALL_LABEL
+from audit_archive import AuditArchive
+from audit_data import category_mapping as default_category_mapping, load_static_data
+from peer_index import OVERALL_KEY
+from scoring import MISSING_LEVEL, decode_answer_matrix, question_layout, score_levels
+from screening import SCREENED_OUT, flag_names
+from whatif import score_bands
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configure logging; level comes from LOG_LEVEL so DEBUG output stays off in production. This runs on
+# import (the app imports this module), so an unknown level falls back to INFO instead of raising.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+logging.basicConfig(
+    level=LOG_LEVEL if LOG_LEVEL in logging.getLevelNamesMapping() else "INFO",
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
 logger = logging.getLogger(__name__)
+if LOG_LEVEL not in logging.getLevelNamesMapping():
+    logger.warning("Unknown LOG_LEVEL %r; using INFO", LOG_LEVEL)
+
+# Written into every workbook; without a "created" property xlsxwriter stamps the current time
+# into docProps/core.xml, which is the only part of its output that changes from run to run
+DOCUMENT_PROPERTIES = {"author": "LEAN 2.0 Institute", "company": "LEAN 2.0 Institute"}
+
+
+def parse_report_date(REPORT_DATE: str) -> datetime:
+    """
+    REPORT_DATE (YYYY-MM-DD) as midnight UTC.
+
+    The generators never fall back to the clock, so the same inputs always give
+    the same workbook; callers inject the date they want printed.
+    """
+    try:
+        return datetime.strptime(REPORT_DATE, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        logger.error("Invalid REPORT_DATE: %r", REPORT_DATE)
+        raise ValueError(f"REPORT_DATE must be a YYYY-MM-DD date, got {REPORT_DATE!r}")
+
+
+def set_document_properties(workbook: xlsxwriter.Workbook, title: str, report_date: datetime) -> None:
+    """Fixed document properties with report_date as the creation time, so equal inputs give byte-identical workbooks."""
+    workbook.set_properties({**DOCUMENT_PROPERTIES, "title": title, "created": report_date})
+
 
 def generate_excel_report(
     df: pd.DataFrame,
@@ -20,7 +62,10 @@ def generate_excel_report(
     CONFIG: Dict,
     overall_score: float,
     grade: str,
-    REPORT_DATE: str
+    REPORT_DATE: str,
+    percentiles: Optional[Dict[str, float]] = None,
+    improvements: Optional[pd.DataFrame] = None,
+    action_plan: Optional[pd.DataFrame] = None
 ) -> io.BytesIO:
     """
     Generate an Excel report with contact information at the beginning and all content consolidated into a single worksheet.
@@ -36,7 +81,10 @@ def generate_excel_report(
         CONFIG: Configuration dictionary with contact info
         overall_score: Overall audit score
         grade: Overall grade
-        REPORT_DATE: Report generation date
+        REPORT_DATE: Report date (YYYY-MM-DD), also the workbook's creation time
+        percentiles: Optional peer percentiles keyed by internal category, plus OVERALL_KEY
+        improvements: Optional ranked recommendations (whatif.improvement_frame) added to the findings
+        action_plan: Optional budgeted plan (action_plan.action_plan_frame) written to the Action Plan section
 
     Returns:
         io.BytesIO: Excel file buffer with a single worksheet
@@ -87,7 +135,9 @@ def generate_excel_report(
             "date_format": "%m/%d/%Y",
             "metric": "Metric",
             "value": "Value",
-            "prepared_by": "Prepared by: LEAN 2.0 Institute"
+            "prepared_by": "Prepared by: LEAN 2.0 Institute",
+            "peer_percentile": "Peer Percentile",
+            "improvement_ranking": "Highest-Impact Improvements"
         },
         "Español": {
             "report_title": "Informe de Auditoría LEAN 2.0",
@@ -116,16 +166,15 @@ def generate_excel_report(
             "date_format": "%d/%m/%Y",
             "metric": "Métrica",
             "value": "Valor",
-            "prepared_by": "Preparado por: Instituto LEAN 2.0"
+            "prepared_by": "Preparado por: Instituto LEAN 2.0",
+            "peer_percentile": "Percentil entre Pares",
+            "improvement_ranking": "Mejoras de Mayor Impacto"
         }
     }
 
     # Format date
-    try:
-        report_date_formatted = datetime.strptime(REPORT_DATE, "%Y-%m-%d").strftime(translations[language]["date_format"])
-    except ValueError:
-        report_date_formatted = datetime.now().strftime(translations[language]["date_format"])
-        logger.warning("Invalid REPORT_DATE format. Using current date: %s", report_date_formatted)
+    report_date = parse_report_date(REPORT_DATE)
+    report_date_formatted = report_date.strftime(translations[language]["date_format"])
 
     # Initialize Excel output with a single worksheet
     excel_output = io.BytesIO()
@@ -134,6 +183,7 @@ def generate_excel_report(
 
     with pd.ExcelWriter(excel_output, engine='xlsxwriter') as writer:
         workbook = writer.book
+        set_document_properties(workbook, translations[language]["report_title"], report_date)
         worksheet = workbook.add_worksheet(sheet_name)
         logger.debug("Single worksheet created: %s", sheet_name)
 
@@ -185,6 +235,9 @@ def generate_excel_report(
             translations[language]["metric"]: [translations[language]["overall_score"], translations[language]["grade"]],
             translations[language]["value"]: [f"{overall_score:.1f}%", grade]
         }
+        if percentiles and percentiles.get(OVERALL_KEY) is not None:
+            summary_data[translations[language]["metric"]].append(translations[language]["peer_percentile"])
+            summary_data[translations[language]["value"]].append(f"{percentiles[OVERALL_KEY]:.0f}")
         summary_df = pd.DataFrame(summary_data)
         write_dataframe(summary_df, current_row)
 
@@ -192,6 +245,11 @@ def generate_excel_report(
         write_section_header(translations[language]["results"])
         results_data = df_display.reset_index()
         results_data.columns = [translations[language]["category"], translations[language]["score"], translations[language]["percent"], translations[language]["priority"]]
+        if percentiles:
+            results_data[translations[language]["peer_percentile"]] = [
+                f"{percentiles[category_mapping[language][display_cat]]:.0f}" if percentiles.get(category_mapping[language][display_cat]) is not None else "-"
+                for display_cat in results_data[translations[language]["category"]]
+            ]
         write_dataframe(results_data, current_row)
 
         # Hallazgos (Findings)
@@ -212,6 +270,12 @@ def generate_excel_report(
         else:
             worksheet.write(current_row, 0, "No critical findings.", cell_format)
             current_row += 1
+        if improvements is not None and not improvements.empty:
+            write_section_header(translations[language]["improvement_ranking"])
+            write_dataframe(improvements, current_row)
+        if action_plan is not None and not action_plan.empty:
+            write_section_header(translations[language]["action_plan"])
+            write_dataframe(action_plan, current_row)
 
         # Perspectivas Accionables (Actionable Insights)
         write_section_header(translations[language]["actionable_insights"])
@@ -247,3 +311,417 @@ def generate_excel_report(
     excel_output.seek(0)
     logger.debug("Excel report generated successfully with single worksheet")
     return excel_output
+
+
+# Labels of the organization workbook; grades and priorities are indexed by whatif.score_bands
+ORGANIZATION_WORKBOOK_LABELS = {
+    "English": {
+        "summary_sheet": "Summary",
+        "data_sheet": "Responses",
+        "title": "LEAN 2.0 Organization Audit",
+        "organization": "Organization",
+        "all_organizations": "All organizations",
+        "date": "Date",
+        "respondents": "Respondents",
+        "included": "Included in aggregates",
+        "category": "Category",
+        "mean_score": "Mean Score",
+        "std_dev": "Std. Dev.",
+        "priority": "Priority",
+        "overall_score": "Overall Score",
+        "grade": "Grade",
+        "grade_distribution": "Grade Distribution",
+        "report_id": "Report ID",
+        "submitted_at": "Submitted",
+        "source": "Source",
+        "language": "Language",
+        "site": "Site",
+        "department": "Department",
+        "role": "Role",
+        "campaign": "Campaign",
+        "question": "Q",
+        "quality_flags": "Quality Flags",
+        "digest_sheet": "Digest",
+        "digest_title": "LEAN 2.0 Weekly Digest",
+        "period": "Period",
+        "previous_audits": "Audits before the period",
+        "period_audits": "New audits in the period",
+        "previous_mean": "Previous Mean",
+        "period_mean": "Period Mean",
+        "change": "Change",
+        "new_critical": "New Critical",
+        "new_critical_findings": "New Critical Findings",
+        "no_new_critical": "No new critical findings.",
+        "yes": "Yes",
+        "grades": ["Critical", "Needs Improvement", "Good", "Excellent"],
+        "priorities": ["High", "Medium", "Low", "Low"],
+        "date_format": "%m/%d/%Y",
+    },
+    "Español": {
+        "summary_sheet": "Resumen",
+        "data_sheet": "Respuestas",
+        "title": "Auditoría Organizacional LEAN 2.0",
+        "organization": "Organización",
+        "all_organizations": "Todas las organizaciones",
+        "date": "Fecha",
+        "respondents": "Encuestados",
+        "included": "Incluidos en los agregados",
+        "category": "Categoría",
+        "mean_score": "Puntuación Media",
+        "std_dev": "Desv. Estándar",
+        "priority": "Prioridad",
+        "overall_score": "Puntuación General",
+        "grade": "Calificación",
+        "grade_distribution": "Distribución de Calificaciones",
+        "report_id": "ID de Informe",
+        "submitted_at": "Enviado",
+        "source": "Origen",
+        "language": "Idioma",
+        "site": "Sede",
+        "department": "Departamento",
+        "role": "Rol",
+        "campaign": "Campaña",
+        "question": "P",
+        "quality_flags": "Indicadores de Calidad",
+        "digest_sheet": "Resumen Semanal",
+        "digest_title": "Resumen Semanal LEAN 2.0",
+        "period": "Periodo",
+        "previous_audits": "Auditorías anteriores al periodo",
+        "period_audits": "Auditorías nuevas en el periodo",
+        "previous_mean": "Media Anterior",
+        "period_mean": "Media del Periodo",
+        "change": "Cambio",
+        "new_critical": "Nuevo Crítico",
+        "new_critical_findings": "Nuevos Hallazgos Críticos",
+        "no_new_critical": "Sin nuevos hallazgos críticos.",
+        "yes": "Sí",
+        "grades": ["Crítico", "Necesita Mejora", "Bueno", "Excelente"],
+        "priorities": ["Alta", "Media", "Baja", "Baja"],
+        "date_format": "%d/%m/%Y",
+    },
+}
+
+# Archive columns written before the answer levels on every respondent row
+RESPONDENT_COLUMNS = ("report_id", "submitted_at", "source", "language", "organization", "site", "department", "role", "campaign")
+
+
+def generate_organization_workbook(
+    archive: AuditArchive,
+    output: Union[str, BinaryIO],
+    questions: Dict,
+    response_options: Dict,
+    language: str,
+    category_mapping: Dict,
+    SCORE_THRESHOLDS: Dict,
+    REPORT_DATE: str,
+    organization: Optional[str] = None,
+    exclude_flags: int = SCREENED_OUT,
+    chunk_size: int = 10000,
+    campaign: Optional[str] = None
+) -> int:
+    """
+    Write an organization workbook with one row per archived respondent.
+
+    The "Responses" sheet holds the answer level (0 = first option) of every
+    question, the category and overall scores, grade, priority and quality flags
+    of each audit, with an autofilter and a named range (AuditData) so it can
+    feed a pivot table directly. The "Summary" sheet holds the category
+    aggregates and native charts of them; audits with any of the exclude_flags
+    quality flags are listed but left out of the aggregates.
+
+    Rows are streamed from the archive chunk by chunk and xlsxwriter runs in
+    constant_memory mode, flushing every row to disk as it is completed, so
+    memory stays flat however many respondents the organization has. Audits of
+    other questionnaire versions (another number of answers) are skipped.
+
+    Args:
+        archive: Source of the audits
+        output: File path or binary file object for the workbook
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        language: Language of the labels ("Español" or "English")
+        category_mapping: Mapping of display categories to internal categories
+        SCORE_THRESHOLDS: Thresholds for score categories
+        REPORT_DATE: Report generation date (YYYY-MM-DD)
+        organization: Restrict to one organization
+        exclude_flags: Quality flags that keep an audit out of the aggregates
+        chunk_size: Audits read from the archive at a time
+        campaign: Restrict to the audits submitted under one campaign
+
+    Returns:
+        int: Number of respondent rows written
+    """
+    if language not in ORGANIZATION_WORKBOOK_LABELS:
+        raise ValueError(f"Unsupported language: {language}")
+    labels = ORGANIZATION_WORKBOOK_LABELS[language]
+    display_names = {v: k for k, v in category_mapping[language].items()}
+    categories = [display_names[cat] for cat in questions]
+    n_questions = len(question_layout(questions))
+    n_categories = len(categories)
+    created = parse_report_date(REPORT_DATE)
+    report_date = created.strftime(labels["date_format"])
+
+    workbook = xlsxwriter.Workbook(output, {"constant_memory": True, "strings_to_numbers": False, "strings_to_formulas": False})
+    set_document_properties(workbook, labels["title"], created)
+    header_format = workbook.add_format({'bold': True, 'bg_color': '#1E88E5', 'font_color': 'white', 'border': 1})
+    title_format = workbook.add_format({'bold': True, 'font_size': 16})
+    bold_format = workbook.add_format({'bold': True})
+    score_format = workbook.add_format({'num_format': '0.0'})
+    # Added first so it opens as the first tab; its rows are only written once the data is streamed
+    summary = workbook.add_worksheet(labels["summary_sheet"])
+    data = workbook.add_worksheet(labels["data_sheet"])
+
+    headers = (
+        [labels[column] for column in RESPONDENT_COLUMNS]
+        + [f"{labels['question']}{i + 1}" for i in range(n_questions)]
+        + categories
+        + [labels["overall_score"], labels["grade"], labels["priority"], labels["quality_flags"]]
+    )
+    first_score_column = len(RESPONDENT_COLUMNS) + n_questions
+    data.write_row(0, 0, headers, header_format)
+    data.freeze_panes(1, 1)
+    data.set_column(0, 0, 38)
+    data.set_column(1, len(RESPONDENT_COLUMNS) - 1, 16)
+    data.set_column(len(RESPONDENT_COLUMNS), first_score_column - 1, 5)
+    data.set_column(first_score_column, first_score_column + n_categories, 12, score_format)
+    data.set_column(first_score_column + n_categories + 1, len(headers) - 1, 16)
+
+    # Running count, sum and sum of squares per category and overall, over included audits
+    stats = np.zeros((3, n_categories + 1))
+    grade_counts = np.zeros(len(labels["grades"]), dtype=np.int64)
+    row = 1
+    included = 0
+    for records in archive.iter_records(chunk_size, organization, campaign):
+        records = [record for record in records if len(record["answers"]) == n_questions]
+        if not records:
+            continue
+        levels = decode_answer_matrix([record["answers"] for record in records], n_questions)
+        cat_scores, overall = score_levels(levels, questions, response_options)
+        scores = np.column_stack([cat_scores, overall])
+        bands = score_bands(overall, SCORE_THRESHOLDS)
+        flags = np.array([record["quality_flags"] or 0 for record in records], dtype=np.int64)
+        keep = (flags & exclude_flags) == 0
+        kept = scores[keep]
+        answered = ~np.isnan(kept)
+        stats[0] += answered.sum(axis=0)
+        stats[1] += np.where(answered, kept, 0).sum(axis=0)
+        stats[2] += np.where(answered, kept * kept, 0).sum(axis=0)
+        complete = keep & ~np.isnan(overall)
+        grade_counts += np.bincount(bands[complete], minlength=len(grade_counts))
+        included += int(keep.sum())
+
+        # Missing answers and scores become empty cells
+        level_cells = np.where(levels == MISSING_LEVEL, None, levels.astype(object))
+        score_cells = np.where(np.isnan(scores), None, np.round(scores, 1).astype(object))
+        for i, record in enumerate(records):
+            scored = not math.isnan(overall[i])
+            data.write_row(row, 0, [
+                *(record[column] for column in RESPONDENT_COLUMNS),
+                *level_cells[i],
+                *score_cells[i],
+                labels["grades"][bands[i]] if scored else None,
+                labels["priorities"][bands[i]] if scored else None,
+                ", ".join(flag_names(flags[i])),
+            ])
+            row += 1
+    respondents = row - 1
+    data.autofilter(0, 0, max(respondents, 1), len(headers) - 1)
+    workbook.define_name("AuditData", f"={xlsxwriter.utility.quote_sheetname(labels['data_sheet'])}!$A$1:${xlsxwriter.utility.xl_col_to_name(len(headers) - 1)}${respondents + 1}")
+
+    # Summary: category aggregates and the grade distribution, each with a native chart
+    summary.set_column(0, 0, 48)
+    summary.set_column(1, 4, 16)
+    summary.write(0, 0, labels["title"], title_format)
+    summary.write_row(1, 0, [labels["organization"], organization or labels["all_organizations"]], bold_format)
+    summary.write_row(2, 0, [labels["date"], report_date])
+    summary.write_row(3, 0, [labels["respondents"], respondents])
+    summary.write_row(4, 0, [labels["included"], included])
+    if campaign is not None:
+        summary.write_row(5, 0, [labels["campaign"], campaign])
+    summary.write_row(6, 0, [labels["category"], labels["respondents"], labels["mean_score"], labels["std_dev"], labels["priority"]], header_format)
+    counts, sums, squares = stats
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+        stds = np.sqrt(np.maximum(squares / counts - means * means, 0))
+    means_bands = score_bands(means, SCORE_THRESHOLDS)
+    for c, name in enumerate(categories + [labels["overall_score"]]):
+        aggregated = counts[c] > 0
+        summary.write_row(7 + c, 0, [
+            name,
+            int(counts[c]),
+            round(float(means[c]), 1) if aggregated else None,
+            round(float(stds[c]), 1) if aggregated else None,
+            labels["priorities"][means_bands[c]] if aggregated else None,
+        ], bold_format if c == n_categories else None)
+    grade_row = 7 + n_categories + 2
+    summary.write_row(grade_row, 0, [labels["grade"], labels["respondents"]], header_format)
+    for g, grade in enumerate(labels["grades"]):
+        summary.write_row(grade_row + 1 + g, 0, [grade, int(grade_counts[g])])
+
+    sheet = labels["summary_sheet"]
+    category_chart = workbook.add_chart({"type": "bar"})
+    category_chart.add_series({
+        "name": labels["mean_score"],
+        "categories": [sheet, 7, 0, 6 + n_categories, 0],
+        "values": [sheet, 7, 2, 6 + n_categories, 2],
+        "fill": {"color": "#1E88E5"},
+        "data_labels": {"value": True, "num_format": "0.0"},
+    })
+    category_chart.set_title({"name": labels["mean_score"]})
+    category_chart.set_x_axis({"min": 0, "max": 100})
+    category_chart.set_y_axis({"reverse": True})
+    category_chart.set_legend({"none": True})
+    category_chart.set_size({"width": 720, "height": 360})
+    summary.insert_chart(1, 6, category_chart)
+    grade_chart = workbook.add_chart({"type": "column"})
+    grade_chart.add_series({
+        "name": labels["grade_distribution"],
+        "categories": [sheet, grade_row + 1, 0, grade_row + len(labels["grades"]), 0],
+        "values": [sheet, grade_row + 1, 1, grade_row + len(labels["grades"]), 1],
+        "points": [{"fill": {"color": color}} for color in ("#D32F2F", "#FFA000", "#43A047", "#1E88E5")],
+    })
+    grade_chart.set_title({"name": labels["grade_distribution"]})
+    grade_chart.set_legend({"none": True})
+    summary.insert_chart(20, 6, grade_chart)
+    workbook.close()
+    logger.info("Organization workbook written with %d respondents (%d in aggregates)", respondents, included)
+    return respondents
+
+
+def generate_digest_report(
+    summary: pd.DataFrame,
+    organization: str,
+    period_start: str,
+    period_end: str,
+    language: str,
+    category_mapping: Dict,
+    SCORE_THRESHOLDS: Dict,
+    REPORT_DATE: str
+) -> io.BytesIO:
+    """
+    Generate a periodic digest workbook for one organization.
+
+    A category is a new critical finding when its mean over the period's audits
+    is below the critical threshold and its mean before the period was not (or
+    there were no earlier audits).
+
+    Args:
+        summary: Category scores before and within the period (digests.digest_summary)
+        organization: Organization the digest is for
+        period_start: Start of the period (ISO 8601)
+        period_end: End of the period (ISO 8601)
+        language: Selected language ("Español" or "English")
+        category_mapping: Mapping of display categories to internal categories
+        SCORE_THRESHOLDS: Thresholds for score categories
+        REPORT_DATE: Report generation date (YYYY-MM-DD)
+
+    Returns:
+        io.BytesIO: Excel file buffer
+    """
+    if language not in ORGANIZATION_WORKBOOK_LABELS:
+        raise ValueError(f"Unsupported language: {language}")
+    labels = ORGANIZATION_WORKBOOK_LABELS[language]
+    display_names = {v: k for k, v in category_mapping[language].items()}
+    date_format = labels["date_format"]
+    created = parse_report_date(REPORT_DATE)
+    report_date = created.strftime(date_format)
+    period = " - ".join(datetime.fromisoformat(bound).strftime(date_format) for bound in (period_start, period_end))
+
+    previous, current = summary["previous_mean"].to_numpy(), summary["period_mean"].to_numpy()
+    critical = SCORE_THRESHOLDS["CRITICAL"]
+    new_critical = (current < critical) & ~(previous < critical)
+    bands = score_bands(current, SCORE_THRESHOLDS)
+    cell = lambda value: None if pd.isna(value) else round(float(value), 1)
+
+    excel_output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(excel_output, {"in_memory": True})
+    set_document_properties(workbook, f'{labels["digest_title"]} - {organization}', created)
+    worksheet = workbook.add_worksheet(labels["digest_sheet"])
+    title_format = workbook.add_format({'bold': True, 'font_size': 16})
+    bold_format = workbook.add_format({'bold': True})
+    header_format = workbook.add_format({'bold': True, 'bg_color': '#1E88E5', 'font_color': 'white', 'border': 1})
+    critical_format = workbook.add_format({'bold': True, 'font_color': '#D32F2F'})
+    worksheet.set_column(0, 0, 48)
+    worksheet.set_column(1, 6, 16)
+
+    worksheet.write(0, 0, labels["digest_title"], title_format)
+    worksheet.write_row(1, 0, [labels["organization"], organization], bold_format)
+    worksheet.write_row(2, 0, [labels["period"], period])
+    worksheet.write_row(3, 0, [labels["date"], report_date])
+    worksheet.write_row(4, 0, [labels["previous_audits"], summary.attrs.get("previous_audits", 0)])
+    worksheet.write_row(5, 0, [labels["period_audits"], summary.attrs.get("period_audits", 0)])
+
+    table_row = 7
+    worksheet.write_row(table_row, 0, [
+        labels["category"], labels["previous_mean"], labels["respondents"], labels["period_mean"],
+        labels["change"], labels["priority"], labels["new_critical"]
+    ], header_format)
+    names = {**display_names, OVERALL_LABEL: labels["overall_score"]}
+    for i, category in enumerate(summary.index):
+        worksheet.write_row(table_row + 1 + i, 0, [
+            names[category],
+            cell(previous[i]),
+            int(summary["period_count"].iloc[i]),
+            cell(current[i]),
+            cell(current[i] - previous[i]),
+            labels["priorities"][bands[i]] if not pd.isna(current[i]) else None,
+            labels["yes"] if new_critical[i] else None,
+        ], critical_format if new_critical[i] else None)
+
+    findings_row = table_row + len(summary) + 2
+    worksheet.write(findings_row, 0, labels["new_critical_findings"], bold_format)
+    findings = [names[category] for category, flagged in zip(summary.index, new_critical) if flagged and category != OVERALL_LABEL]
+    for i, finding in enumerate(findings or [labels["no_new_critical"]]):
+        worksheet.write(findings_row + 1 + i, 0, finding, critical_format if findings else None)
+
+    chart = workbook.add_chart({"type": "bar"})
+    last_category_row = table_row + len(summary) - 1
+    for column, color in ((1, "#B0BEC5"), (3, "#1E88E5")):
+        chart.add_series({
+            "name": [labels["digest_sheet"], table_row, column],
+            "categories": [labels["digest_sheet"], table_row + 1, 0, last_category_row, 0],
+            "values": [labels["digest_sheet"], table_row + 1, column, last_category_row, column],
+            "fill": {"color": color},
+        })
+    chart.set_title({"name": labels["period_mean"]})
+    chart.set_x_axis({"min": 0, "max": 100})
+    chart.set_y_axis({"reverse": True})
+    chart.set_size({"width": 720, "height": 400})
+    worksheet.insert_chart(1, 8, chart)
+    workbook.close()
+    excel_output.seek(0)
+    return excel_output
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write an organization workbook with one row per archived audit.")
+    parser.add_argument("output", help="Workbook path (.xlsx)")
+    parser.add_argument("--archive", default=os.getenv("AUDIT_ARCHIVE_PATH", "data/audits.db"))
+    parser.add_argument("--organization", default=None)
+    parser.add_argument("--campaign", default=None)
+    parser.add_argument("--language", default="Español", choices=sorted(ORGANIZATION_WORKBOOK_LABELS))
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--date", default=None, help="Report date (YYYY-MM-DD), today by default; a fixed date reproduces a workbook byte for byte")
+    args = parser.parse_args(argv)
+
+    questions, response_options = load_static_data()
+    thresholds = {"CRITICAL": 50, "NEEDS_IMPROVEMENT": 70, "GOOD": 85}
+    respondents = generate_organization_workbook(
+        AuditArchive(args.archive),
+        args.output,
+        questions,
+        response_options,
+        args.language,
+        default_category_mapping,
+        thresholds,
+        args.date or datetime.now().strftime("%Y-%m-%d"),
+        organization=args.organization,
+        chunk_size=args.chunk_size,
+        campaign=args.campaign
+    )
+    print(f"{respondents} respondents written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,280 @@
+import argparse
+import html
+import logging
+import os
+import re
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+from audit_archive import AuditArchive
+from audit_data import category_mapping as default_category_mapping
+from peer_index import OVERALL_KEY
+from presentation import (
+    COMPLETION_BADGE, DEFAULT_CSS, build_display_frame, build_overview_chart, build_question_chart,
+    build_results_frame, category_insights, color_percent, get_grade, grade_banner
+)
+from scoring import decode_answers, levels_to_responses, question_layout
+from tenants import DEFAULT_CONTACT, DEFAULT_QUESTIONNAIRE_VERSION, DEFAULT_SCORE_THRESHOLDS, DEFAULT_TENANT_ID, TenantRegistry
+from translations import TRANSLATIONS
+
+logger = logging.getLogger(__name__)
+
+PLOTLY_JS_FILENAME = "plotly.min.js"
+CDN_URL = "https://cdn.plot.ly/plotly-2.35.2.min.js"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="{lang}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ font-family: "Source Sans Pro", Arial, sans-serif; background: #F5F5F5; margin: 0; padding: 2rem; }}
+.report-table table {{ border-collapse: collapse; width: 100%; }}
+.report-table th, .report-table td {{ border: 1px solid #E0E0E0; padding: 0.4rem 0.6rem; text-align: left; }}
+.summary {{ display: flex; gap: 2rem; flex-wrap: wrap; align-items: flex-start; }}
+.metric {{ min-width: 10rem; }}
+.metric-label {{ font-size: 0.9rem; color: #424242; }}
+.metric-value {{ font-size: 1.8rem; }}
+{css}
+</style>
+{plotly_script}
+</head>
+<body>
+<section class="main-container" role="main">
+<div class="card-modern report-section" role="region" aria-label="{title}">
+<h1 class="main-title">{title}</h1>
+<p>{date_label}: {report_date}</p>
+{badge}
+<h3 class="subsection-title">{summary_title}</h3>
+<div class="summary">
+<div>{grade_banner}<p class="grade-description">{grade_description}</p></div>
+<div class="metric"><div class="metric-label">{high_priority_label}</div><div class="metric-value">{high_priority_count}</div></div>
+<div class="metric"><div class="metric-label">{average_label}</div><div class="metric-value">{overall_score:.1f}%</div></div>
+</div>
+{percentile_block}
+<div class="report-table">{table}</div>
+{figures}
+<p>{reference_lines}</p>
+<h3 class="subsection-title">{insights_title}</h3>
+{insights}
+<div class="contact-info">{contact}</div>
+</div>
+</section>
+</body>
+</html>
+"""
+
+
+def _plotly_script(include_plotlyjs: Union[bool, str]) -> str:
+    if include_plotlyjs is True:
+        return f"<script>{get_plotlyjs()}</script>"
+    if include_plotlyjs == "cdn":
+        return f'<script src="{CDN_URL}"></script>'
+    if include_plotlyjs == "directory":
+        return f'<script src="{PLOTLY_JS_FILENAME}"></script>'
+    raise ValueError(f"Unsupported include_plotlyjs value: {include_plotlyjs!r}")
+
+
+def _markdown_bold(text: str) -> str:
+    return re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html.escape(text, quote=False))
+
+
+def render_html_report(
+    responses: Dict,
+    questions: Dict,
+    language: str,
+    SCORE_THRESHOLDS: Dict,
+    CONFIG: Dict,
+    REPORT_DATE: str,
+    category_mapping: Dict = default_category_mapping,
+    percentiles: Optional[Dict[str, float]] = None,
+    include_plotlyjs: Union[bool, str] = True
+) -> str:
+    """
+    Render the results page of a submitted audit as one self-contained HTML document.
+
+    Figures are embedded as Plotly JSON and drawn client-side; the page CSS is the
+    app's DEFAULT_CSS, so no Streamlit session is needed to reopen the results.
+
+    Args:
+        responses: Submitted responses (scores per category)
+        questions: Dictionary of questions by category and language
+        language: Selected language ("Español" or "English")
+        SCORE_THRESHOLDS: Thresholds for score categories
+        CONFIG: Configuration dictionary with contact info
+        REPORT_DATE: Report date (YYYY-MM-DD)
+        category_mapping: Mapping of display categories to internal categories
+        percentiles: Optional peer percentiles keyed by internal category, plus OVERALL_KEY
+        include_plotlyjs: True to inline plotly.js, "cdn" to load it from the CDN, or
+            "directory" to reference plotly.min.js next to the HTML file
+
+    Returns:
+        str: HTML document
+    """
+    if language not in TRANSLATIONS:
+        raise ValueError(f"Unsupported language: {language}")
+    labels = TRANSLATIONS[language]
+
+    df = build_results_frame(responses, language, SCORE_THRESHOLDS)
+    df_display = build_display_frame(df, language, category_mapping)
+    overall_score = df[labels["percent"]].mean()
+    grade, grade_description, grade_class = get_grade(overall_score, language, SCORE_THRESHOLDS)
+
+    df_view = df_display.copy()
+    percentile_block = ""
+    if percentiles:
+        df_view[labels["peer_percentile"]] = [
+            f"{percentiles[category_mapping[language][idx]]:.0f}" for idx in df_display.index
+        ]
+        if percentiles.get(OVERALL_KEY) is not None:
+            percentile_block = f'<div class="alert alert-info">{html.escape(labels["peer_percentile"])}: {percentiles[OVERALL_KEY]:.0f}</div>'
+    table = (
+        df_view.style
+        .map(color_percent, thresholds=SCORE_THRESHOLDS, subset=[labels["percent"]])
+        .format({labels["percent"]: "{:.1f}%", labels["score"]: "{:.1f}"})
+        .to_html()
+    )
+
+    figures = [build_overview_chart(df_display, language, SCORE_THRESHOLDS)]
+    display_names = {v: k for k, v in category_mapping[language].items()}
+    for cat in questions:
+        figures.append(build_question_chart(questions, responses, cat, display_names[cat], language, SCORE_THRESHOLDS))
+    figure_html = []
+    for i, fig in enumerate(figures):
+        # Escape "</" so figure text can never close the script element early
+        spec = pio.to_json(fig, validate=False).replace("</", "<\\/")
+        figure_html.append(
+            f'<div id="figure-{i}"></div>'
+            f'<script type="application/json" id="figure-{i}-spec">{spec}</script>'
+            f'<script>(function(){{var s=JSON.parse(document.getElementById("figure-{i}-spec").textContent);'
+            f'Plotly.newPlot("figure-{i}",s.data,s.layout,{{responsive:true,displaylogo:false}});}})();</script>'
+        )
+
+    insights = category_insights(df, questions, language, SCORE_THRESHOLDS, category_mapping)
+    insights_html = (
+        "<div class='alert alert-info'>" + "<br>".join(_markdown_bold(i) for i in insights) + "</div>"
+        if insights else f"<div class='alert alert-success'>{html.escape(labels['all_categories_above_70'])}</div>"
+    )
+    email, website = html.escape(CONFIG["contact"]["email"]), html.escape(CONFIG["contact"]["website"])
+
+    return PAGE_TEMPLATE.format(
+        lang="es" if language == "Español" else "en",
+        title=html.escape(labels["report_title"]),
+        css=DEFAULT_CSS,
+        plotly_script=_plotly_script(include_plotlyjs),
+        date_label="Fecha" if language == "Español" else "Date",
+        report_date=html.escape(REPORT_DATE),
+        badge=COMPLETION_BADGE[language],
+        summary_title=html.escape(labels["summary"]),
+        grade_banner=grade_banner(html.escape(grade), grade_class, overall_score, language),
+        grade_description=html.escape(grade_description),
+        high_priority_label=html.escape(labels["high_priority_categories"]),
+        high_priority_count=int((df[labels["percent"]] < SCORE_THRESHOLDS["CRITICAL"]).sum()),
+        average_label=html.escape(labels["average_score"]),
+        overall_score=overall_score,
+        percentile_block=percentile_block,
+        table=table,
+        figures="\n".join(figure_html),
+        reference_lines=_markdown_bold(labels["reference_lines"].format(
+            SCORE_THRESHOLDS["CRITICAL"], SCORE_THRESHOLDS["NEEDS_IMPROVEMENT"], SCORE_THRESHOLDS["GOOD"]
+        )),
+        insights_title=html.escape(labels["actionable_insights"]),
+        insights=insights_html,
+        contact=labels["contact_info"].format(
+            f'<a href="mailto:{email}">{email}</a>', f'<a href="{website}">{website}</a>'
+        ),
+    )
+
+
+def export_archive(
+    archive: AuditArchive,
+    out_dir: str,
+    questions: Dict,
+    response_options: Dict,
+    SCORE_THRESHOLDS: Dict,
+    CONFIG: Dict,
+    category_mapping: Dict = default_category_mapping,
+    organization: Optional[str] = None,
+    include_plotlyjs: Union[bool, str] = True
+) -> int:
+    """
+    Export every complete archived audit of this question bank to <out_dir>/<report_id>.html.
+
+    Audits of other question banks share the archive and are skipped.
+
+    Each file inlines plotly.js and opens on its own. With include_plotlyjs="directory"
+    plotly.js is instead written once to out_dir and shared by all reports, which keeps
+    each file small but ties it to that directory.
+
+    Returns:
+        int: Number of reports written
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    if include_plotlyjs == "directory":
+        with open(os.path.join(out_dir, PLOTLY_JS_FILENAME), "w", encoding="utf-8") as f:
+            f.write(get_plotlyjs())
+    n_questions = len(question_layout(questions))
+    written = other_banks = 0
+    for chunk in archive.iter_records(organization=organization):
+        for record in chunk:
+            if len(record["answers"]) != n_questions:
+                other_banks += 1
+                continue
+            levels = decode_answers(record["answers"])
+            if None in levels:
+                logger.warning("Skipping incomplete audit %s", record["report_id"])
+                continue
+            page = render_html_report(
+                levels_to_responses(levels, questions, response_options),
+                questions,
+                record["language"],
+                SCORE_THRESHOLDS,
+                CONFIG,
+                record["submitted_at"][:10],
+                category_mapping=category_mapping,
+                include_plotlyjs=include_plotlyjs
+            )
+            path = os.path.join(out_dir, f"{record['report_id']}.html")
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(page)
+            os.replace(tmp_path, path)
+            written += 1
+    logger.info("Exported %d HTML reports to %s (%d audits of other question banks skipped)", written, out_dir, other_banks)
+    return written
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export archived audits as static HTML reports.")
+    parser.add_argument("--archive", default=os.getenv("AUDIT_ARCHIVE_PATH", "data/audits.db"))
+    parser.add_argument("--out", default="outbox/html")
+    parser.add_argument("--organization", default=None)
+    parser.add_argument("--tenant", default=os.getenv("DEFAULT_TENANT", DEFAULT_TENANT_ID), help="Tenant whose thresholds, contact and question bank are used")
+    parser.add_argument("--tenants-file", default=os.getenv("TENANTS_FILE", "tenants.json"))
+    parser.add_argument("--plotlyjs", choices=["inline", "cdn", "directory"], default="inline")
+    args = parser.parse_args()
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format='%(asctime)s - %(levelname)s - %(message)s')
+
+    registry = TenantRegistry(
+        {"contact": DEFAULT_CONTACT, "thresholds": DEFAULT_SCORE_THRESHOLDS, "questionnaire_version": DEFAULT_QUESTIONNAIRE_VERSION},
+        args.tenants_file
+    )
+    tenant = registry.resolve(args.tenant)
+    question_bank = registry.question_bank(tenant)
+    written = export_archive(
+        AuditArchive(args.archive), args.out, question_bank["questions"], question_bank["response_options"],
+        tenant["thresholds"], {"contact": tenant["contact"]},
+        category_mapping=question_bank["category_mapping"],
+        organization=args.organization,
+        include_plotlyjs=True if args.plotlyjs == "inline" else args.plotlyjs
+    )
+    print(f"Exported {written} reports to {args.out} ({datetime.now():%Y-%m-%d %H:%M})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
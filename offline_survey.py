@@ -0,0 +1,375 @@
+import argparse
+import glob
+import hashlib
+import io
+import logging
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import openpyxl
+import xlsxwriter
+
+from analytics import ArchiveScreening
+from audit_archive import AuditArchive
+from audit_data import category_mapping, load_static_data
+from screening import QUALITY_FLAGS, screen_records
+from scoring import category_scores, encode_answers, levels_to_responses, overall_score, question_layout
+
+logger = logging.getLogger(__name__)
+
+FORM_VERSION = "1"
+SURVEY_SHEET = "Survey"
+OPTIONS_SHEET = "Options"
+META_SHEET = "Meta"
+HEADER_ROW = 5
+
+SURVEY_TEXT = {
+    "English": {
+        "title": "LEAN 2.0 Workplace Audit - Offline Survey",
+        "organization": "Organization",
+        "department": "Department",
+        "instructions": "Choose the description that best represents the situation for each question from the dropdown in the Answer column. Do not edit other cells.",
+        "number": "#",
+        "category": "Category",
+        "question": "Question",
+        "answer": "Answer",
+        "invalid_title": "Invalid answer",
+        "invalid_message": "Please choose one of the listed descriptions.",
+    },
+    "Español": {
+        "title": "Auditoría LEAN 2.0 del Lugar de Trabajo - Encuesta sin Conexión",
+        "organization": "Organización",
+        "department": "Departamento",
+        "instructions": "Elige en la columna Respuesta la descripción que mejor represente la situación para cada pregunta. No edites otras celdas.",
+        "number": "#",
+        "category": "Categoría",
+        "question": "Pregunta",
+        "answer": "Respuesta",
+        "invalid_title": "Respuesta no válida",
+        "invalid_message": "Elige una de las descripciones de la lista.",
+    },
+}
+
+
+def generate_survey_workbook(
+    questions: Dict,
+    response_options: Dict,
+    language: str,
+    department: str,
+    organization: str = "",
+    form_id: Optional[str] = None
+) -> io.BytesIO:
+    """
+    Generate a fillable questionnaire workbook with dropdown answers.
+
+    Args:
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        language: Selected language ("Español" or "English")
+        department: Department the workbook is distributed to
+        organization: Organization name printed on the form
+        form_id: Identifier stored in the workbook; a new UUID by default
+
+    Returns:
+        io.BytesIO: Excel file buffer
+    """
+    if language not in SURVEY_TEXT:
+        raise ValueError(f"Unsupported language: {language}")
+    text = SURVEY_TEXT[language]
+    display_names = {v: k for k, v in category_mapping[language].items()}
+
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, {"in_memory": True})
+    worksheet = workbook.add_worksheet(SURVEY_SHEET)
+    options_sheet = workbook.add_worksheet(OPTIONS_SHEET)
+    meta_sheet = workbook.add_worksheet(META_SHEET)
+
+    title_format = workbook.add_format({'bold': True, 'font_size': 16, 'bg_color': '#1E88E5', 'font_color': 'white'})
+    bold = workbook.add_format({'bold': True})
+    header_format = workbook.add_format({'bold': True, 'bg_color': '#E0E0E0', 'border': 1})
+    wrap_format = workbook.add_format({'text_wrap': True, 'valign': 'top', 'border': 1})
+    answer_format = workbook.add_format({'text_wrap': True, 'valign': 'top', 'border': 1, 'locked': False, 'bg_color': '#FFF9C4'})
+
+    # Dropdown sources, one column per question type
+    option_ranges = {}
+    for col, (q_type, scale) in enumerate(response_options.items()):
+        descriptions = scale[language]["descriptions"]
+        options_sheet.write(0, col, q_type)
+        options_sheet.write_column(1, col, descriptions)
+        col_letter = xlsxwriter.utility.xl_col_to_name(col)
+        option_ranges[q_type] = f"={OPTIONS_SHEET}!${col_letter}$2:${col_letter}${len(descriptions) + 1}"
+    options_sheet.hide()
+
+    # Metadata read back by the ingester
+    form_id = form_id or str(uuid.uuid4())
+    for row, (key, value) in enumerate([
+        ("form_version", FORM_VERSION),
+        ("form_id", form_id),
+        ("language", language),
+        ("organization", organization),
+        ("department", department),
+    ]):
+        meta_sheet.write_string(row, 0, key)
+        meta_sheet.write_string(row, 1, value)
+    meta_sheet.hide()
+
+    worksheet.merge_range(0, 0, 0, 3, text["title"], title_format)
+    worksheet.write(1, 0, text["organization"], bold)
+    worksheet.write(1, 1, organization)
+    worksheet.write(2, 0, text["department"], bold)
+    worksheet.write(2, 1, department)
+    worksheet.merge_range(3, 0, 3, 3, text["instructions"], workbook.add_format({'text_wrap': True, 'italic': True}))
+    worksheet.set_row(3, 30)
+    for col, key in enumerate(["number", "category", "question", "answer"]):
+        worksheet.write(HEADER_ROW, col, text[key], header_format)
+
+    row = HEADER_ROW + 1
+    for number, (cat, q_idx, q_type) in enumerate(question_layout(questions), start=1):
+        question_text = questions[cat][language][q_idx][0]
+        worksheet.write_number(row, 0, number, wrap_format)
+        worksheet.write_string(row, 1, display_names[cat], wrap_format)
+        worksheet.write_string(row, 2, question_text, wrap_format)
+        worksheet.write_blank(row, 3, None, answer_format)
+        worksheet.data_validation(row, 3, row, 3, {
+            'validate': 'list',
+            'source': option_ranges[q_type],
+            'error_title': text["invalid_title"],
+            'error_message': text["invalid_message"],
+        })
+        row += 1
+
+    worksheet.set_column('A:A', 5)
+    worksheet.set_column('B:B', 30)
+    worksheet.set_column('C:C', 80)
+    worksheet.set_column('D:D', 45)
+    worksheet.freeze_panes(HEADER_ROW + 1, 0)
+    worksheet.protect("", {'format_columns': True, 'format_rows': True})
+    workbook.close()
+    output.seek(0)
+    return output
+
+
+def generate_department_workbooks(
+    departments: Sequence[str],
+    out_dir: str,
+    questions: Dict,
+    response_options: Dict,
+    language: str,
+    organization: str = ""
+) -> List[str]:
+    """
+    Write one survey workbook per department into out_dir.
+
+    Returns:
+        List[str]: Paths of the generated workbooks
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for department in departments:
+        slug = re.sub(r"[^\w-]+", "_", department.strip()).strip("_") or "department"
+        path = os.path.join(out_dir, f"audit_survey_{slug}.xlsx")
+        with open(path, "wb") as f:
+            f.write(generate_survey_workbook(questions, response_options, language, department, organization).getvalue())
+        paths.append(path)
+    logger.info("Generated %d survey workbooks in %s", len(paths), out_dir)
+    return paths
+
+
+def read_survey_workbook(path: str, questions: Dict, response_options: Dict) -> Dict:
+    """
+    Read a returned survey workbook in read-only mode and score it.
+
+    Args:
+        path: Workbook path
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+
+    Returns:
+        Dict: Audit record for AuditArchive
+
+    Raises:
+        ValueError: If the workbook is not a survey form or has invalid or missing answers
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+    try:
+        if META_SHEET not in workbook.sheetnames or SURVEY_SHEET not in workbook.sheetnames:
+            raise ValueError("not an audit survey workbook")
+        meta = {
+            str(key): "" if value is None else str(value)
+            for key, value, *_ in workbook[META_SHEET].iter_rows(max_col=2, values_only=True)
+            if key is not None
+        }
+        language = meta.get("language")
+        if language not in SURVEY_TEXT:
+            raise ValueError(f"unsupported language {language!r}")
+
+        layout = question_layout(questions)
+        lookups = {
+            q_type: {description: level for level, description in enumerate(scale[language]["descriptions"])}
+            for q_type, scale in response_options.items()
+        }
+        levels: List[Optional[int]] = [None] * len(layout)
+        problems = []
+        invalid = set()
+        for number, _, _, answer in workbook[SURVEY_SHEET].iter_rows(min_row=HEADER_ROW + 2, max_col=4, values_only=True):
+            if not isinstance(number, (int, float)) or not 1 <= int(number) <= len(layout):
+                continue
+            q_type = layout[int(number) - 1][2]
+            if answer is None or str(answer).strip() == "":
+                continue
+            level = lookups[q_type].get(str(answer).strip())
+            if level is None:
+                invalid.add(int(number))
+                problems.append(f"question {int(number)}: unrecognized answer {answer!r}")
+            else:
+                levels[int(number) - 1] = level
+    finally:
+        workbook.close()
+
+    missing = [str(i + 1) for i, level in enumerate(levels) if level is None and i + 1 not in invalid]
+    if missing:
+        problems.append(f"unanswered questions: {', '.join(missing)}")
+    if problems:
+        raise ValueError("; ".join(problems))
+
+    responses = levels_to_responses(levels, questions, response_options)
+    return {
+        # Copies of one department form share its form_id; the file digest tells respondents apart
+        "report_id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"{meta.get('form_id', '')}:{hashlib.sha256(content).hexdigest()}")),
+        "source": "offline_workbook",
+        "language": language,
+        "organization": meta.get("organization", ""),
+        "department": meta.get("department", ""),
+        "answers": encode_answers(levels),
+        "overall_score": overall_score(category_scores(responses)),
+    }
+
+
+def _read_or_error(path: str, questions: Dict, response_options: Dict) -> Tuple[str, Optional[Dict], Optional[str]]:
+    try:
+        return path, read_survey_workbook(path, questions, response_options), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def iter_survey_workbooks(
+    paths: Sequence[str],
+    questions: Dict,
+    response_options: Dict,
+    workers: Optional[int] = None
+) -> Iterator[Tuple[str, Optional[Dict], Optional[str]]]:
+    """
+    Parse workbooks in parallel worker processes.
+
+    Yields:
+        Tuple[str, Optional[Dict], Optional[str]]: (path, record, error); exactly one of record and error is set
+    """
+    reader = partial(_read_or_error, questions=questions, response_options=response_options)
+    if workers == 1 or len(paths) < 2:
+        yield from map(reader, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(reader, paths, chunksize=max(1, len(paths) // (4 * (workers or os.cpu_count() or 1))))
+
+
+def ingest_survey_workbooks(
+    paths: Sequence[str],
+    archive: AuditArchive,
+    questions: Dict,
+    response_options: Dict,
+    workers: Optional[int] = None,
+    batch_size: int = 500
+) -> Dict:
+    """
+    Validate, screen, score and bulk-load returned survey workbooks into the archive.
+
+    Straight-lined and duplicate answers (also against audits already archived)
+    are loaded with their quality flags rather than rejected.
+
+    Args:
+        paths: Workbook paths
+        archive: Destination archive
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        workers: Parser processes; defaults to the CPU count
+        batch_size: Records per archive transaction
+
+    Returns:
+        Dict: Summary with "read", "loaded", "rejected" (list of (path, reason)),
+        "flagged" (audits per quality flag) and "seconds"
+    """
+    start = time.perf_counter()
+    rejected = []
+    flagged = dict.fromkeys(QUALITY_FLAGS, 0)
+    read = 0
+
+    def valid_records():
+        nonlocal read
+        for path, record, error in iter_survey_workbooks(paths, questions, response_options, workers):
+            read += 1
+            if error is not None:
+                logger.warning("Rejected %s: %s", path, error)
+                rejected.append((path, error))
+            else:
+                yield record
+
+    def screened_records():
+        screening = ArchiveScreening(questions, response_options)
+        screening.refresh(archive)
+        records = screen_records(valid_records(), questions, response_options, screening.index, batch_size, screening.reference())
+        for record in records:
+            for name, bit in QUALITY_FLAGS.items():
+                flagged[name] += bool(record["quality_flags"] & bit)
+            yield record
+
+    loaded = archive.add_many(screened_records(), batch_size=batch_size)
+    seconds = time.perf_counter() - start
+    logger.info("Ingested %d of %d workbooks in %.2fs", loaded, read, seconds)
+    return {"read": read, "loaded": loaded, "rejected": rejected, "flagged": flagged, "seconds": seconds}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate and ingest offline audit survey workbooks.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    gen = subparsers.add_parser("generate", help="Write one survey workbook per department")
+    gen.add_argument("--departments", required=True, help="Comma-separated department names")
+    gen.add_argument("--organization", default="")
+    gen.add_argument("--language", default="Español", choices=list(SURVEY_TEXT))
+    gen.add_argument("--out", default="outbox/surveys")
+
+    ing = subparsers.add_parser("ingest", help="Load returned workbooks into the audit archive")
+    ing.add_argument("paths", nargs="+", help="Workbook files or glob patterns")
+    ing.add_argument("--archive", default=os.getenv("AUDIT_ARCHIVE_PATH", "data/audits.db"))
+    ing.add_argument("--workers", type=int, default=None)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format='%(asctime)s - %(levelname)s - %(message)s')
+    questions, response_options = load_static_data()
+
+    if args.command == "generate":
+        departments = [d.strip() for d in args.departments.split(",") if d.strip()]
+        for path in generate_department_workbooks(departments, args.out, questions, response_options, args.language, args.organization):
+            print(path)
+        return 0
+
+    paths = sorted({p for pattern in args.paths for p in (glob.glob(pattern) or [pattern])})
+    summary = ingest_survey_workbooks(paths, AuditArchive(args.archive), questions, response_options, workers=args.workers)
+    for path, reason in summary["rejected"]:
+        print(f"REJECTED {path}: {reason}")
+    print(f"Loaded {summary['loaded']} of {summary['read']} workbooks in {summary['seconds']:.2f}s")
+    flagged = ", ".join(f"{name} {count}" for name, count in summary["flagged"].items() if count)
+    if flagged:
+        print(f"Flagged by screening: {flagged}")
+    return 1 if summary["rejected"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
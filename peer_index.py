@@ -0,0 +1,125 @@
+import bisect
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Key under which the overall audit score is indexed next to the categories
+OVERALL_KEY = "__overall__"
+
+
+class PeerIndex:
+    """
+    Precomputed peer distribution of audit scores, one sorted array per category.
+
+    Scores are persisted as an append-only JSON Lines log so that several worker
+    processes can share one index: each read appends the new lines' scores and
+    sorts every category once, so a cold load is one sort of the whole log and
+    later reads only fold in the lines appended since the last one. Percentile
+    lookups are two binary searches, so no audit history is scanned per render.
+
+    Args:
+        path: Location of the JSON Lines log. When None the index is in-memory only.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._scores: Dict[str, List[float]] = {}
+        self._offset = 0
+        self._lock = threading.Lock()
+        if self.path:
+            self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._scores.get(OVERALL_KEY, []))
+
+    def _insert(self, scores: Dict[str, float]) -> None:
+        """Add a single audit; bulk reads go through refresh() instead."""
+        for key, value in scores.items():
+            bisect.insort(self._scores.setdefault(key, []), float(value))
+
+    def refresh(self) -> int:
+        """
+        Fold in audits appended to the log by other processes since the last read.
+
+        Returns:
+            int: Number of audits added to the in-memory index.
+        """
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        added = 0
+        with self._lock:
+            if os.path.getsize(self.path) <= self._offset:
+                return 0
+            touched = set()
+            with open(self.path, "rb") as log:
+                log.seek(self._offset)
+                for line in log:
+                    if not line.endswith(b"\n"):
+                        # Partially written line from a concurrent writer; read it next time
+                        break
+                    self._offset += len(line)
+                    try:
+                        scores = {key: float(value) for key, value in json.loads(line).items()}
+                    except (ValueError, TypeError, AttributeError):
+                        logger.warning("Skipping malformed peer index entry at offset %d", self._offset - len(line))
+                        continue
+                    for key, value in scores.items():
+                        self._scores.setdefault(key, []).append(value)
+                    touched.update(scores)
+                    added += 1
+            # The old values are one sorted run, so this is close to a merge with the sorted new ones
+            for key in touched:
+                self._scores[key].sort()
+        if added:
+            logger.debug("Peer index refreshed with %d audits (%d total)", added, len(self))
+        return added
+
+    def add(self, scores: Dict[str, float]) -> None:
+        """
+        Add one audit's category scores (and OVERALL_KEY) to the index and the log.
+
+        Args:
+            scores: Mapping of internal category name to percentage score
+        """
+        self.refresh()
+        line = (json.dumps(scores, ensure_ascii=False, sort_keys=True) + "\n").encode("utf-8")
+        with self._lock:
+            if self.path:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "ab") as log:
+                    log.write(line)
+                # Only skip our own line if nobody else appended in between
+                if os.path.getsize(self.path) == self._offset + len(line):
+                    self._offset += len(line)
+                    self._insert(scores)
+                    return
+            else:
+                self._insert(scores)
+                return
+        self.refresh()
+
+    def percentile(self, key: str, score: float) -> Optional[float]:
+        """
+        Mid-rank percentile of a score within the indexed peer distribution.
+
+        Args:
+            key: Internal category name or OVERALL_KEY
+            score: Percentage score to rank
+
+        Returns:
+            Optional[float]: Percentile in [0, 100], or None when there are no peers
+        """
+        values = self._scores.get(key)
+        if not values:
+            return None
+        below = bisect.bisect_left(values, score)
+        equal = bisect.bisect_right(values, score, lo=below) - below
+        return 100.0 * (below + 0.5 * equal) / len(values)
+
+    def percentiles(self, scores: Dict[str, float]) -> Dict[str, Optional[float]]:
+        """Percentile of every score in the mapping, keyed like the input."""
+        return {key: self.percentile(key, value) for key, value in scores.items()}
@@ -0,0 +1,349 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+from scoring import question_offsets
+from translations import TRANSLATIONS
+
+CHART_COLORS = ["#D32F2F", "#FFD54F", "#43A047"]
+CHART_HEIGHT = 400
+# Distribution charts are binned on the server; these bound what is sent to the browser
+DISTRIBUTION_BINS = 50
+DISTRIBUTION_MIN_BINS = 10
+DISTRIBUTION_PAYLOAD_BYTES = 150_000
+DISTRIBUTION_KINDS = ("histogram", "box", "violin")
+
+DEFAULT_CSS = """
+    .main-container { overflow-anchor: none; min-height: 100vh; }
+    .main-title { font-size: 2.5rem; color: #1E88E5; text-align: center; }
+    .section-title { font-size: 1.8rem; color: #424242; margin-bottom: 1rem; }
+    .card-modern { background: #FFFFFF; border-radius: 8px; padding: 1.5rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 1rem; min-height: 200px; }
+    .question-container { display: flex; align-items: center; margin-bottom: 0.5rem; }
+    .question-text { font-weight: 500; color: #212121; margin-right: 0.5rem; }
+    .required { color: #D32F2F; font-weight: bold; }
+    .tooltip { position: relative; display: inline-block; }
+    .tooltip-icon { background: #1E88E5; color: white; border-radius: 50%; width: 20px; height: 20px; text-align: center; line-height: 20px; cursor: help; }
+    .tooltip-text { visibility: hidden; width: 200px; background: #424242; color: #FFFFFF; text-align: center; border-radius: 6px; padding: 5px; position: absolute; z-index: 1; bottom: 125%; left: 50%; margin-left: -100px; opacity: 0; transition: opacity 0.3s; }
+    .tooltip:hover .tooltip-text { visibility: visible; opacity: 1; }
+    .sticky-nav { position: sticky; bottom: 0; background: #F5F5F5; padding: 1rem; border-radius: 8px; box-shadow: 0 -2px 4px rgba(0,0,0,0.1); z-index: 10; }
+    .grade-excellent { background: #43A047; color: #FFFFFF; padding: 0.5rem; border-radius: 4px; }
+    .grade-good { background: #FFD54F; color: #212121; padding: 0.5rem; border-radius: 4px; }
+    .grade-needs-improvement { background: #FF9800; color: #FFFFFF; padding: 0.5rem; border-radius: 4px; }
+    .grade-critical { background: #D32F2F; color: #FFFFFF; padding: 0.5rem; border-radius: 4px; }
+    .alert { padding: 1rem; border-radius: 4px; margin-bottom: 1rem; min-height: 60px; }
+    .alert-info { background: #E3F2FD; color: #1E88E5; }
+    .alert-success { background: #E8F5E9; color: #43A047; }
+    .alert-warning { background: #FFF3E0; color: #FF9800; }
+    .badge { background: #1E88E5; color: #FFFFFF; padding: 0.5rem 1rem; border-radius: 16px; display: inline-block; margin: 1rem 0; }
+    .contact-info { margin-top: 1rem; font-size: 0.9rem; color: #424242; }
+    @media (max-width: 768px) {
+        .main-title { font-size: 2rem; }
+        .section-title { font-size: 1.5rem; }
+        .card-modern { padding: 1rem; }
+    }
+"""
+
+COMPLETION_BADGE = {
+    "Español": '<div class="badge">🏆 ¡Auditoría Completada! ¡Gracias por tu compromiso con la construcción de un entorno laboral saludable, seguro y respetuoso para todas las personas!</div>',
+    "English": '<div class="badge">🏆 Audit Completed! Thank you for your commitment to fostering a healthy, safe, and respectful work environment for everyone!</div>',
+}
+
+
+def get_grade(score: float, language: str, thresholds: Dict) -> Tuple[str, str, str]:
+    """Grade name, description and CSS class for an overall score."""
+    if score >= thresholds["GOOD"]:
+        return (
+            "Excelente" if language == "Español" else "Excellent",
+            TRANSLATIONS[language]["grade_excellent_desc"],
+            "grade-excellent"
+        )
+    elif score >= thresholds["NEEDS_IMPROVEMENT"]:
+        return (
+            "Bueno" if language == "Español" else "Good",
+            TRANSLATIONS[language]["grade_good_desc"],
+            "grade-good"
+        )
+    elif score >= thresholds["CRITICAL"]:
+        return (
+            "Necesita Mejora" if language == "Español" else "Needs Improvement",
+            TRANSLATIONS[language]["grade_needs_improvement_desc"],
+            "grade-needs-improvement"
+        )
+    else:
+        return (
+            "Crítico" if language == "Español" else "Critical",
+            TRANSLATIONS[language]["grade_critical_desc"],
+            "grade-critical"
+        )
+
+
+def grade_banner(grade: str, grade_class: str, overall_score: float, language: str) -> str:
+    label = "Calificación General" if language == "Español" else "Overall Grade"
+    return f'<div class="grade {grade_class}">{label}: {grade} ({overall_score:.1f}%)</div>'
+
+
+def priority_label(score: float, language: str, thresholds: Dict) -> str:
+    if score < thresholds["CRITICAL"]:
+        return TRANSLATIONS[language]["high_priority"]
+    if score < thresholds["NEEDS_IMPROVEMENT"]:
+        return TRANSLATIONS[language]["medium_priority"]
+    return TRANSLATIONS[language]["low_priority"]
+
+
+def build_results_frame(responses: Dict, language: str, thresholds: Dict) -> pd.DataFrame:
+    """Category score, percentage and priority indexed by internal category name."""
+    labels = TRANSLATIONS[language]
+    results = {cat: sum(scores) / len(scores) for cat, scores in responses.items()}
+    df = pd.DataFrame.from_dict(results, orient="index", columns=[labels["score"]])
+    df[labels["percent"]] = df[labels["score"]]
+    df[labels["priority"]] = df[labels["percent"]].apply(lambda x: priority_label(x, language, thresholds))
+    return df
+
+
+def build_display_frame(df: pd.DataFrame, language: str, category_mapping: Dict) -> pd.DataFrame:
+    """Results frame indexed by display category name, sorted by ascending score; ties keep questionnaire order."""
+    display_names = {v: k for k, v in category_mapping[language].items()}
+    df_display = df.copy()
+    df_display.index = [display_names[idx] for idx in df.index]
+    return df_display.sort_values(by=TRANSLATIONS[language]["percent"], ascending=True, kind="stable")
+
+
+def score_color(val: float, thresholds: Dict) -> str:
+    return CHART_COLORS[0] if val < thresholds["CRITICAL"] else CHART_COLORS[1] if val < thresholds["NEEDS_IMPROVEMENT"] else CHART_COLORS[2]
+
+
+def color_percent(val: float, thresholds: Dict) -> str:
+    return f'background-color: {score_color(val, thresholds)}; color: white;'
+
+
+def add_reference_lines(fig: go.Figure, thresholds: Dict, **kwargs) -> go.Figure:
+    fig.add_vline(x=thresholds["CRITICAL"], line_dash="dash", line_color="black", **kwargs)
+    fig.add_vline(x=thresholds["NEEDS_IMPROVEMENT"], line_dash="dot", line_color="black", **kwargs)
+    fig.add_vline(x=thresholds["GOOD"], line_dash="dashdot", line_color="black", **kwargs)
+    return fig
+
+
+def build_overview_chart(df_display: pd.DataFrame, language: str, thresholds: Dict) -> go.Figure:
+    labels = TRANSLATIONS[language]
+    fig = px.bar(
+        df_display.reset_index(),
+        y="index",
+        x=labels["percent"],
+        orientation='h',
+        title=labels["chart_title"],
+        labels={
+            "index": labels["category"],
+            labels["percent"]: labels["score_percent"]
+        },
+        color=labels["percent"],
+        color_continuous_scale=CHART_COLORS,
+        range_x=[0, 100],
+        height=CHART_HEIGHT
+    )
+    fig.update_layout(
+        showlegend=False,
+        title_x=0.5,
+        xaxis_title=labels["score_percent"],
+        yaxis_title=labels["category"],
+        coloraxis_showscale=False
+    )
+    return add_reference_lines(fig, thresholds)
+
+
+def build_question_chart(
+    questions: Dict,
+    responses: Dict,
+    category: str,
+    display_category: str,
+    language: str,
+    thresholds: Dict,
+    low_scores_only: bool = False
+) -> go.Figure:
+    labels = TRANSLATIONS[language]
+    offset = question_offsets(questions)[category]
+    question_scores = pd.DataFrame({
+        labels["question"]: [f"{offset + i + 1}. {q}" for i, (q, _, _) in enumerate(questions[category][language])],
+        labels["score"]: responses[category]
+    })
+    if low_scores_only:
+        question_scores = question_scores[question_scores[labels["score"]] < thresholds["NEEDS_IMPROVEMENT"]]
+        title_suffix = f" (Below {thresholds['NEEDS_IMPROVEMENT']}%)"
+    else:
+        title_suffix = ""
+    fig = px.bar(
+        question_scores,
+        x=labels["score"],
+        y=labels["question"],
+        orientation='h',
+        title=f"{labels['question_scores_for']} {display_category}{title_suffix}",
+        color=labels["score"],
+        color_continuous_scale=CHART_COLORS,
+        range_x=[0, 100],
+        height=300 + len(question_scores) * 50
+    )
+    fig.update_layout(
+        showlegend=False,
+        title_x=0.5,
+        xaxis_title=labels["score_percent"],
+        yaxis_title=labels["question"],
+        coloraxis_showscale=False
+    )
+    return add_reference_lines(fig, thresholds)
+
+
+def category_insights(df: pd.DataFrame, questions: Dict, language: str, thresholds: Dict, category_mapping: Dict) -> List[str]:
+    """Markdown insight line for every category below the improvement threshold."""
+    labels = TRANSLATIONS[language]
+    display_names = {v: k for k, v in category_mapping[language].items()}
+    insights = []
+    for cat in questions.keys():
+        score = df.loc[cat, labels["percent"]]
+        if score < thresholds["NEEDS_IMPROVEMENT"]:
+            insights.append(
+                f"**{display_names[cat]}** scored {score:.1f}% ({labels['high_priority'] if score < thresholds['CRITICAL'] else labels['medium_priority']}). Focus on immediate improvements."
+            )
+    return insights
+
+
+def build_correlation_heatmap(corr: pd.DataFrame, title: str) -> go.Figure:
+    """Diverging heatmap of a correlation matrix, fixed to the [-1, 1] range."""
+    fig = go.Figure(go.Heatmap(
+        z=corr.values,
+        x=list(corr.columns),
+        y=list(corr.index),
+        zmin=-1,
+        zmax=1,
+        colorscale=[[0, CHART_COLORS[0]], [0.5, "#FFFFFF"], [1, "#1E88E5"]],
+        hovertemplate="%{y} / %{x}: %{z:.2f}<extra></extra>"
+    ))
+    fig.update_layout(
+        title=title,
+        title_x=0.5,
+        height=max(CHART_HEIGHT, 22 * len(corr.index) + 150),
+        yaxis_autorange="reversed"
+    )
+    return fig
+
+
+def figure_payload_bytes(fig: go.Figure) -> int:
+    """Size of the figure JSON sent to the browser."""
+    return len(pio.to_json(fig, validate=False))
+
+
+def _histogram_figure(distribution, display_labels: Sequence[str], thresholds: Dict, bins: int) -> go.Figure:
+    edges, counts = distribution.histogram(bins)
+    centers = np.round((edges[:-1] + edges[1:]) / 2, 2)
+    colors = [score_color(c, thresholds) for c in centers]
+    fig = make_subplots(rows=len(display_labels), cols=1, shared_xaxes=True, subplot_titles=list(display_labels), vertical_spacing=0.02)
+    for v in range(len(display_labels)):
+        fig.add_trace(go.Bar(x=centers, y=counts[v], width=100 / bins, marker_color=colors, showlegend=False), row=v + 1, col=1)
+    fig.update_xaxes(range=[0, 100])
+    fig.update_layout(height=max(CHART_HEIGHT, 140 * len(display_labels)), bargap=0)
+    # The x axes are shared, so one paper-high line per threshold crosses every subplot
+    add_reference_lines(fig, thresholds, row=1, col=1)
+    return fig.update_shapes(yref="paper")
+
+
+def _box_figure(distribution, display_labels: Sequence[str], thresholds: Dict, bins: int) -> go.Figure:
+    stats = distribution.box_stats()
+    fig = go.Figure()
+    for label, (_, row) in zip(display_labels, stats.iterrows()):
+        if not row["count"]:
+            continue
+        # Precomputed statistics: the browser draws the box without the raw points
+        fig.add_trace(go.Box(
+            y=[label],
+            q1=[row["q1"]],
+            median=[row["median"]],
+            q3=[row["q3"]],
+            lowerfence=[row["lower_fence"]],
+            upperfence=[row["upper_fence"]],
+            mean=[row["mean"]],
+            orientation="h",
+            marker_color=score_color(row["median"], thresholds),
+            name=label,
+            showlegend=False
+        ))
+    fig.update_layout(height=max(CHART_HEIGHT, 60 * len(display_labels)), xaxis_range=[0, 100])
+    return add_reference_lines(fig, thresholds)
+
+
+def _violin_figure(distribution, display_labels: Sequence[str], thresholds: Dict, bins: int) -> go.Figure:
+    edges, counts = distribution.histogram(bins)
+    centers = np.round((edges[:-1] + edges[1:]) / 2, 2)
+    # Light smoothing of the binned counts stands in for a kernel density estimate
+    kernel = np.exp(-0.5 * np.linspace(-2, 2, 5) ** 2)
+    medians = distribution.box_stats()["median"].to_numpy()
+    fig = go.Figure()
+    for v, label in enumerate(display_labels):
+        density = np.convolve(counts[v], kernel / kernel.sum(), mode="same")
+        if density.max() <= 0:
+            continue
+        half_width = np.round(0.4 * density / density.max(), 3)
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([centers, centers[::-1]]),
+            y=np.concatenate([v + half_width, (v - half_width)[::-1]]),
+            fill="toself",
+            mode="lines",
+            line_width=1,
+            fillcolor=score_color(medians[v], thresholds),
+            line_color=score_color(medians[v], thresholds),
+            opacity=0.7,
+            name=label,
+            hoverinfo="name",
+            showlegend=False
+        ))
+        fig.add_trace(go.Scatter(x=[medians[v]], y=[v], mode="markers", marker_color="black", hoverinfo="x", showlegend=False))
+    fig.update_layout(
+        height=max(CHART_HEIGHT, 60 * len(display_labels)),
+        xaxis_range=[0, 100],
+        yaxis={"tickvals": list(range(len(display_labels))), "ticktext": list(display_labels)}
+    )
+    return add_reference_lines(fig, thresholds)
+
+
+def build_distribution_chart(
+    distribution,
+    kind: str,
+    display_labels: Sequence[str],
+    title: str,
+    thresholds: Dict,
+    max_bytes: int = DISTRIBUTION_PAYLOAD_BYTES,
+    bins: int = DISTRIBUTION_BINS
+) -> go.Figure:
+    """
+    Histogram, box or violin chart of score distributions from pre-binned counts.
+
+    Args:
+        distribution: analytics.ScoreDistribution (or any object with histogram(bins) and box_stats())
+        kind: One of DISTRIBUTION_KINDS
+        display_labels: Label per distribution variable
+        title: Chart title
+        thresholds: Score thresholds for colors and reference lines
+        max_bytes: Payload budget; bins are halved until the figure fits
+        bins: Initial number of bins
+
+    Returns:
+        go.Figure: Figure whose JSON is at most max_bytes
+
+    Raises:
+        ValueError: If the figure exceeds max_bytes even at DISTRIBUTION_MIN_BINS bins
+    """
+    builders = {"histogram": _histogram_figure, "box": _box_figure, "violin": _violin_figure}
+    if kind not in builders:
+        raise ValueError(f"Unsupported distribution chart: {kind}")
+    while True:
+        fig = builders[kind](distribution, display_labels, thresholds, bins)
+        fig.update_layout(title=title, title_x=0.5)
+        size = figure_payload_bytes(fig)
+        if size <= max_bytes or bins <= DISTRIBUTION_MIN_BINS or kind == "box":
+            break
+        bins = max(DISTRIBUTION_MIN_BINS, bins // 2)
+    if size > max_bytes:
+        raise ValueError(f"{kind} chart needs {size} bytes, over the {max_bytes} byte payload budget")
+    return fig
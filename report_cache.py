@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Part of every key; bump when the layout of cached reports or figures changes
+FORMAT_VERSION = 2
+
+# Last-access times are only rewritten when older than this, so hits rarely write
+TOUCH_INTERVAL_SECONDS = 60.0
+
+
+def cache_key(*parts: Any) -> str:
+    """
+    Stable key for JSON-serializable parts, e.g. an answer fingerprint plus the
+    language, thresholds and other configuration that shape a report.
+    """
+    payload = json.dumps([FORMAT_VERSION, *parts], sort_keys=True, ensure_ascii=False, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReportCache:
+    """
+    Size-bounded cache of generated reports and figure specs in a SQLite file.
+
+    Every Streamlit worker on the host opens the same file, so a workbook or
+    figure built by one worker is served by all of them. Each write stores the
+    entry and evicts the least recently used ones in a single transaction, so
+    readers never see a partial value and the file stays within max_bytes.
+    Two workers missing the same key at once may both build it; the last write wins.
+    Workbooks are generated deterministically, so both builds are the same bytes.
+
+    Args:
+        path: SQLite database file, created on first use
+        max_bytes: Cap on the total size of stored values; larger values are returned but never stored
+        name: Cache name used for hit/miss metrics
+    """
+
+    def __init__(self, path: str, max_bytes: int, name: str = "report_cache"):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.name = name
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Hits are read through the page cache mapping instead of read() copies
+        self._conn.execute(f"PRAGMA mmap_size={max(max_bytes, 0) * 2}")
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    value BLOB NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (accessed_at, size)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def current_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT value, accessed_at FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[1] < now - TOUCH_INTERVAL_SECONDS:
+                    with self._conn:
+                        self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        except sqlite3.Error:
+            logger.exception("Cache %s: lookup failed", self.name)
+            return None
+        return bytes(row[0]) if row is not None else None
+
+    def put(self, key: str, value: bytes) -> bool:
+        """
+        Store value under key, evicting least recently used entries to stay within max_bytes.
+
+        Returns:
+            bool: Whether the value was stored
+        """
+        if len(value) > self.max_bytes:
+            logger.warning("Cache %s: %d byte value exceeds the %d byte cap; not cached", self.name, len(value), self.max_bytes)
+            return False
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("INSERT OR REPLACE INTO entries (key, size, accessed_at, value) VALUES (?, ?, ?, ?)", (key, len(value), time.time(), value))
+                total = self._conn.execute("SELECT SUM(size) FROM entries").fetchone()[0]
+                if total > self.max_bytes:
+                    # Newest first; everything past the point where the running total exceeds the cap goes
+                    evicted = self._conn.execute(
+                        """
+                        DELETE FROM entries WHERE key IN (
+                            SELECT key FROM (
+                                SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS running FROM entries
+                            ) WHERE running > ?
+                        )
+                        """,
+                        (self.max_bytes,)
+                    ).rowcount
+                    logger.debug("Cache %s evicted %d entries", self.name, evicted)
+        except sqlite3.Error:
+            logger.exception("Cache %s: write failed", self.name)
+            return False
+        return True
+
+    def get_or_create(self, key: str, factory: Callable[[], bytes]) -> bytes:
+        """Return the cached bytes for key, building and storing them on a miss."""
+        value = self.get(key)
+        metrics.record_cache(self.name, value is not None)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def get_or_create_figure(self, key: str, factory: Callable[[], go.Figure]) -> go.Figure:
+        """Like get_or_create for Plotly figures, stored as their JSON spec."""
+        built = []
+
+        def build() -> bytes:
+            built.append(factory())
+            return pio.to_json(built[0], validate=False).encode("utf-8")
+
+        spec = self.get_or_create(key, build)
+        return built[0] if built else pio.from_json(spec.decode("utf-8"), skip_invalid=True)
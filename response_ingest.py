@@ -0,0 +1,340 @@
+import argparse
+import logging
+import os
+import re
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analytics import ArchiveScreening
+from audit_archive import AuditArchive
+from audit_data import load_static_data
+from screening import QUALITY_FLAGS, FingerprintIndex, flag_counts, screen_levels
+from scoring import MISSING_LEVEL, encode_level_matrix, score_levels, score_table
+
+logger = logging.getLogger(__name__)
+
+SOURCE = "export"
+# Answer columns are named by question number: "q1", "Q2", ...
+QUESTION_COLUMN = re.compile(r"^q(\d+)$", re.IGNORECASE)
+# Archive columns an export may carry besides the answers; report_id is required
+METADATA_COLUMNS = ("report_id", "submitted_at", "source", "language", "organization", "site", "department", "role", "campaign")
+# Export cells hold either the answer level (0 = first option) or the option's score
+VALUE_KINDS = ("level", "score")
+# Rejected rows kept with their reason for the summary; the rest are only counted
+MAX_REJECTED_EXAMPLES = 100
+
+
+class ExportChunk(NamedTuple):
+    """Validated rows of one chunk: row numbers in the file (from 1), answer levels and metadata."""
+    rows: np.ndarray
+    levels: np.ndarray
+    metadata: pd.DataFrame
+
+
+def read_export(path: str, chunk_size: int = 50000) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV or JSONL export in chunks of chunk_size rows, as strings (answer columns of a CSV as categoricals).
+
+    The format follows the extension (.csv, or .jsonl/.ndjson), optionally with a
+    compression suffix such as .gz; only one chunk is held in memory at a time.
+    """
+    name = re.sub(r"\.(gz|bz2|zip|xz|zst)$", "", path.lower())
+    if name.endswith(".csv"):
+        header = pd.read_csv(path, nrows=0, compression="infer").columns
+        # Answer columns hold a handful of distinct values; as categoricals they are parsed
+        # without one string object per cell
+        dtype = {column: "category" if QUESTION_COLUMN.match(str(column).strip()) else str for column in header}
+        reader = pd.read_csv(path, dtype=dtype, keep_default_na=False, chunksize=chunk_size, compression="infer")
+    elif name.endswith((".jsonl", ".ndjson")):
+        reader = pd.read_json(path, lines=True, dtype=False, convert_dates=False, chunksize=chunk_size, compression="infer")
+    else:
+        raise ValueError(f"Unsupported export format: {path} (expected .csv or .jsonl)")
+    with reader:
+        for frame in reader:
+            if not name.endswith(".csv"):
+                # JSON numbers and nulls become the same strings a CSV export would hold
+                frame = frame.astype(object).where(frame.notna(), "").astype(str)
+            yield frame
+
+
+def question_columns(columns: Sequence[str], n_questions: int) -> List[str]:
+    """
+    Export column of every question in questionnaire order.
+
+    Raises:
+        ValueError: If a question number is missing or outside the question bank
+    """
+    numbered = {}
+    for column in columns:
+        match = QUESTION_COLUMN.match(str(column).strip())
+        if match:
+            numbered[int(match.group(1))] = column
+    unknown = sorted(number for number in numbered if not 1 <= number <= n_questions)
+    if unknown:
+        raise ValueError(f"Question numbers {unknown} are not in the {n_questions}-question bank")
+    missing = [number for number in range(1, n_questions + 1) if number not in numbered]
+    if missing:
+        raise ValueError(f"Missing question columns: {', '.join(f'q{number}' for number in missing)}")
+    return [numbered[number] for number in range(1, n_questions + 1)]
+
+
+def _cell_values(answers: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Numeric value and blankness of every answer cell.
+
+    Each column is handled as a categorical, so only its few distinct spellings
+    ("3", " 3", "3.0", ...) are stripped and parsed; the cells are then mapped by code.
+    """
+    numeric = np.empty(answers.shape, dtype=np.float64)
+    blank = np.empty(answers.shape, dtype=bool)
+    for j, (_, column) in enumerate(answers.items()):
+        categorical = pd.Categorical(column)
+        spellings = pd.Series(categorical.categories.astype(str)).str.strip()
+        # Code -1 (no value at all) maps to the appended blank entry
+        numeric[:, j] = np.append(pd.to_numeric(spellings, errors="coerce").to_numpy(dtype=np.float64), np.nan)[categorical.codes]
+        blank[:, j] = np.append((spellings == "").to_numpy(), True)[categorical.codes]
+    return numeric, blank
+
+
+def parse_export_chunk(
+    frame: pd.DataFrame,
+    first_row: int,
+    questions: Dict,
+    response_options: Dict,
+    values: str = "level",
+    rejected: Optional[Dict] = None
+) -> ExportChunk:
+    """
+    Validate one chunk of an export and map its answers to levels through the question bank.
+
+    A row is rejected when it has no report_id, an unreadable submitted_at, a
+    language without questions, no answers at all, or any answer that is not a
+    level (or, with values="score", an option score) of its question's scale.
+    Blank answers are kept as unanswered (MISSING_LEVEL).
+
+    Args:
+        frame: Chunk as read by read_export
+        first_row: File row number (from 1) of the chunk's first row
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        values: "level" or "score"
+        rejected: Accumulates "count", "reasons" (rows per reason) and "examples"
+            ((row, reason) pairs, at most MAX_REJECTED_EXAMPLES)
+
+    Returns:
+        ExportChunk: The chunk's valid rows
+    """
+    if values not in VALUE_KINDS:
+        raise ValueError(f"values must be one of {VALUE_KINDS}")
+    table = score_table(questions, response_options)
+    columns = question_columns(frame.columns, len(table))
+    if "report_id" not in frame.columns:
+        raise ValueError("Missing report_id column")
+    rows = np.arange(first_row, first_row + len(frame))
+
+    numeric, blank = _cell_values(frame[columns])
+    if values == "level":
+        valid = (numeric >= 0) & (numeric < table.shape[1]) & (numeric == np.floor(numeric))
+        levels = np.where(valid, numeric, 0).astype(np.uint8)
+    else:
+        # Level whose score equals the cell, per question; scales without that score leave no match
+        matches = numeric[:, :, None] == table[None, :, :]
+        valid = matches.any(axis=2)
+        levels = matches.argmax(axis=2).astype(np.uint8)
+    levels[blank] = MISSING_LEVEL
+
+    metadata = pd.DataFrame({
+        column: frame[column].str.strip() if column in frame.columns else "" for column in METADATA_COLUMNS
+    })
+    metadata["source"] = metadata["source"].where(metadata["source"] != "", SOURCE)
+    languages = list(next(iter(questions.values())))
+    metadata["language"] = metadata["language"].where(metadata["language"] != "", languages[0])
+    # Timestamps without a zone are taken as UTC; rows without one are stamped with the ingest time
+    dated = metadata["submitted_at"] != ""
+    submitted = pd.to_datetime(metadata["submitted_at"].where(dated), utc=True, errors="coerce", format="mixed")
+    formatted = np.char.add(np.datetime_as_string(submitted.to_numpy(dtype="datetime64[s]"), unit="s"), "+00:00")
+    metadata["submitted_at"] = pd.Series(formatted, index=metadata.index, dtype=object).where(
+        submitted.notna(), datetime.now(timezone.utc).isoformat(timespec="seconds")
+    )
+
+    reasons = np.select(
+        [
+            (metadata["report_id"] == "").to_numpy(),
+            (dated & submitted.isna()).to_numpy(),
+            ~metadata["language"].isin(languages).to_numpy(),
+            (~valid & ~blank).any(axis=1),
+            blank.all(axis=1),
+        ],
+        ["missing report_id", "invalid submitted_at", "unsupported language", f"answer not a {values} of its scale", "no answers"],
+        default=""
+    )
+    keep = reasons == ""
+    if rejected is not None and not keep.all():
+        rejected["count"] = rejected.get("count", 0) + int((~keep).sum())
+        reason_counts = rejected.setdefault("reasons", {})
+        for reason, count in zip(*np.unique(reasons[~keep], return_counts=True)):
+            reason_counts[str(reason)] = reason_counts.get(str(reason), 0) + int(count)
+        examples = rejected.setdefault("examples", [])
+        room = MAX_REJECTED_EXAMPLES - len(examples)
+        if room > 0:
+            examples.extend((int(row), str(reason)) for row, reason in zip(rows[~keep][:room], reasons[~keep][:room]))
+    return ExportChunk(rows[keep], levels[keep], metadata[keep].reset_index(drop=True))
+
+
+def parse_export(
+    frames: Iterable[pd.DataFrame],
+    questions: Dict,
+    response_options: Dict,
+    values: str = "level",
+    rejected: Optional[Dict] = None
+) -> Iterator[ExportChunk]:
+    """Pipeline stage: validated chunks of a stream of export chunks."""
+    first_row = 1
+    for frame in frames:
+        yield parse_export_chunk(frame, first_row, questions, response_options, values, rejected)
+        first_row += len(frame)
+
+
+def screen_export(
+    chunks: Iterable[ExportChunk],
+    questions: Dict,
+    response_options: Dict,
+    index: FingerprintIndex,
+    flagged: Optional[Dict[str, int]] = None,
+    reference: Optional[Dict[str, Tuple[float, float]]] = None
+) -> Iterator[Tuple[ExportChunk, np.ndarray]]:
+    """
+    Pipeline stage: drop duplicates and set the quality flags of the rest.
+
+    A row is a duplicate when its answers and organization fingerprint matches an
+    audit already in the index (e.g. built from the archive) or an earlier row of
+    the export. Outliers are judged against reference, the organizations'
+    archived distribution, as in screening.screen_records.
+
+    Yields:
+        Tuple[ExportChunk, np.ndarray]: The kept rows and their quality flags
+    """
+    for chunk in chunks:
+        flags = screen_levels(chunk.levels, questions, response_options, chunk.metadata["organization"].tolist(), index, reference)
+        if flagged is not None:
+            for name, count in flag_counts(flags).items():
+                flagged[name] = flagged.get(name, 0) + count
+        unique = (flags & QUALITY_FLAGS["duplicate"]) == 0
+        yield ExportChunk(chunk.rows[unique], chunk.levels[unique], chunk.metadata[unique]), flags[unique]
+
+
+def export_records(
+    screened: Iterable[Tuple[ExportChunk, np.ndarray]],
+    questions: Dict,
+    response_options: Dict
+) -> Iterator[Dict]:
+    """Pipeline stage: score every kept row and turn it into an archive record."""
+    for chunk, flags in screened:
+        if not len(chunk.levels):
+            continue
+        _, overall = score_levels(chunk.levels, questions, response_options)
+        overall = np.where(np.isnan(overall), None, np.round(overall, 4)).tolist()
+        answers = encode_level_matrix(chunk.levels).tolist()
+        columns = [chunk.metadata[column].tolist() for column in METADATA_COLUMNS]
+        for *metadata, encoded, score, flag in zip(*columns, answers, overall, flags.tolist()):
+            yield {**dict(zip(METADATA_COLUMNS, metadata)), "answers": encoded, "overall_score": score, "quality_flags": flag}
+
+
+def ingest_export(
+    path: str,
+    archive: AuditArchive,
+    questions: Dict,
+    response_options: Dict,
+    values: str = "level",
+    chunk_size: int = 50000
+) -> Dict:
+    """
+    Stream a CSV or JSONL response export into the archive.
+
+    Reading, validation, deduplication, scoring and storage are chained
+    generators over chunks of chunk_size rows, so memory stays flat however large
+    the file is; only the fingerprint index (8 bytes per archived audit) grows.
+    Rows whose report_id is already archived are skipped by the archive.
+
+    Args:
+        path: Export file (.csv or .jsonl, optionally compressed)
+        archive: Destination archive
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        values: Whether answer cells hold the "level" or the option "score"
+        chunk_size: Rows per chunk and per archive transaction
+
+    Returns:
+        Dict: Summary with "read", "loaded", "duplicates", "rejected" (rows),
+        "rejected_reasons", "rejected_examples" ((row, reason) pairs), "flagged"
+        (rows per quality flag), "seconds" and "rows_per_second"
+    """
+    start = time.perf_counter()
+    rejected: Dict = {}
+    flagged: Dict[str, int] = {}
+    read = 0
+
+    def counted(frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        nonlocal read
+        for frame in frames:
+            read += len(frame)
+            yield frame
+            elapsed = time.perf_counter() - start
+            logger.info("Read %d rows in %.1fs (%.0f rows/s)", read, elapsed, read / max(elapsed, 1e-9))
+
+    screening = ArchiveScreening(questions, response_options)
+    screening.refresh(archive)
+    chunks = parse_export(counted(read_export(path, chunk_size)), questions, response_options, values, rejected)
+    screened = screen_export(chunks, questions, response_options, screening.index, flagged, screening.reference())
+    records = export_records(screened, questions, response_options)
+    loaded = archive.add_many(records, batch_size=chunk_size)
+
+    seconds = time.perf_counter() - start
+    summary = {
+        "read": read,
+        "loaded": loaded,
+        "duplicates": flagged.get("duplicate", 0),
+        "rejected": rejected.get("count", 0),
+        "rejected_reasons": rejected.get("reasons", {}),
+        "rejected_examples": rejected.get("examples", []),
+        "flagged": {name: flagged.get(name, 0) for name in QUALITY_FLAGS if name != "duplicate"},
+        "seconds": seconds,
+        "rows_per_second": read / max(seconds, 1e-9),
+    }
+    logger.info("Ingested %d of %d rows from %s in %.2fs (%.0f rows/s)", loaded, read, path, seconds, summary["rows_per_second"])
+    return summary
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Stream CSV or JSONL response exports into the audit archive.")
+    parser.add_argument("paths", nargs="+", help="Export files (.csv, .jsonl, optionally compressed)")
+    parser.add_argument("--archive", default=os.getenv("AUDIT_ARCHIVE_PATH", "data/audits.db"))
+    parser.add_argument("--values", default="level", choices=VALUE_KINDS, help="What answer cells hold")
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format='%(asctime)s - %(levelname)s - %(message)s')
+
+    questions, response_options = load_static_data()
+    archive = AuditArchive(args.archive)
+    status = 0
+    for path in args.paths:
+        summary = ingest_export(path, archive, questions, response_options, args.values, args.chunk_size)
+        print(
+            f"{path}: loaded {summary['loaded']} of {summary['read']} rows in {summary['seconds']:.2f}s "
+            f"({summary['rows_per_second']:,.0f} rows/s); {summary['duplicates']} duplicates, {summary['rejected']} rejected"
+        )
+        for row, reason in summary["rejected_examples"]:
+            print(f"  REJECTED row {row}: {reason}")
+        flagged = ", ".join(f"{name} {count}" for name, count in summary["flagged"].items() if count)
+        if flagged:
+            print(f"  Flagged by screening: {flagged}")
+        status = status or (1 if summary["rejected"] else 0)
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,460 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import secrets
+import sqlite3
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Running jobs whose scheduler stopped renewing them (e.g. it was killed) are handed out again after this
+DEFAULT_LEASE_SECONDS = 3600.0
+
+
+class Job(NamedTuple):
+    id: int
+    name: Optional[str]
+    kind: str
+    payload: Dict
+    attempts: int
+    max_attempts: int
+    interval_seconds: Optional[float]
+    # Token of this claim; renewals and outcomes of a claim that lost its lease are ignored
+    claim: str = ""
+
+
+class JobQueue:
+    """
+    Persistent job queue in a SQLite file shared by every process on the host.
+
+    A job is claimed by a single statement that also enforces the concurrency
+    limit across processes, so several app workers and a standalone scheduler
+    can poll the same file. Failed attempts are retried with exponential backoff
+    up to max_attempts. Recurring jobs (interval_seconds) go back to pending for
+    their next occurrence once they succeed or run out of attempts.
+
+    A claimed job is leased for lease_seconds and the claimer renews the lease
+    while it runs. Once a lease expires the job is handed out again under a new
+    claim token, and the old claim can no longer renew or finish it.
+
+    Args:
+        path: SQLite database file, created on first use
+        lease_seconds: How long a claimed job may go without a renewal before it is considered lost
+    """
+
+    def __init__(self, path: str, lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT UNIQUE,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    due_at REAL NOT NULL,
+                    run_at REAL NOT NULL,
+                    interval_seconds REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    lease_until REAL,
+                    last_error TEXT,
+                    updated_at REAL NOT NULL,
+                    claim TEXT
+                )
+                """
+            )
+            # Queues created before claims were tokenized
+            if "claim" not in {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}:
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN claim TEXT")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_due ON jobs (status, run_at)")
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict,
+        run_at: Optional[float] = None,
+        name: Optional[str] = None,
+        interval_seconds: Optional[float] = None,
+        max_attempts: int = 3
+    ) -> bool:
+        """
+        Add a job; a named job is only added if no job of that name exists yet.
+
+        Args:
+            kind: Handler the job is dispatched to
+            payload: JSON-serializable handler argument
+            run_at: Epoch seconds of the first run, now by default
+            name: Unique name that makes enqueueing idempotent, e.g. for schedules
+            interval_seconds: Repeat every interval after run_at
+            max_attempts: Attempts per occurrence before it is given up
+
+        Returns:
+            bool: Whether the job was added
+        """
+        now = time.time()
+        run_at = now if run_at is None else run_at
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                """
+                INSERT OR IGNORE INTO jobs (name, kind, payload, due_at, run_at, interval_seconds, max_attempts, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (name, kind, json.dumps(payload, ensure_ascii=False), run_at, run_at, interval_seconds, max_attempts, now)
+            )
+        return cursor.rowcount > 0
+
+    def claim(self, concurrency: int) -> Optional[Job]:
+        """Mark the next due job as running, unless concurrency jobs already are."""
+        now = time.time()
+        with self._lock, self._conn:
+            expired = self._conn.execute(
+                "UPDATE jobs SET status = 'pending', updated_at = ? WHERE status = 'running' AND lease_until < ?", (now, now)
+            ).rowcount
+            if expired:
+                logger.warning("Requeued %d jobs whose lease expired", expired)
+            row = self._conn.execute(
+                """
+                UPDATE jobs SET status = 'running', attempts = attempts + 1, lease_until = ?, updated_at = ?, claim = ?
+                WHERE id = (
+                    SELECT id FROM jobs
+                    WHERE status = 'pending' AND run_at <= ?
+                      AND (SELECT COUNT(*) FROM jobs WHERE status = 'running') < ?
+                    ORDER BY run_at, id LIMIT 1
+                )
+                RETURNING id, name, kind, payload, attempts, max_attempts, interval_seconds, claim
+                """,
+                (now + self.lease_seconds, now, secrets.token_hex(8), now, int(concurrency))
+            ).fetchone()
+        if row is None:
+            return None
+        return Job(row[0], row[1], row[2], json.loads(row[3]), row[4], row[5], row[6], row[7])
+
+    def renew(self, jobs: Sequence[Job]) -> List[Job]:
+        """
+        Extend the leases of running jobs by lease_seconds from now.
+
+        Returns:
+            List[Job]: The jobs whose claim had already been lost
+        """
+        now = time.time()
+        lost = []
+        with self._lock, self._conn:
+            for job in jobs:
+                renewed = self._conn.execute(
+                    "UPDATE jobs SET lease_until = ?, updated_at = ? WHERE id = ? AND status = 'running' AND claim = ?",
+                    (now + self.lease_seconds, now, job.id, job.claim)
+                ).rowcount
+                if not renewed:
+                    lost.append(job)
+        return lost
+
+    def _next_occurrence(self, job: Job, now: float) -> float:
+        due_at = self._conn.execute("SELECT due_at FROM jobs WHERE id = ?", (job.id,)).fetchone()[0]
+        # Occurrences missed while nothing was running are skipped rather than run back to back
+        missed = max(int((now - due_at) // job.interval_seconds) + 1, 1)
+        return due_at + missed * job.interval_seconds
+
+    def complete(self, job: Job) -> bool:
+        """
+        Record a successful run and schedule the next occurrence of a recurring job.
+
+        Returns:
+            bool: False when the claim had been lost, in which case nothing is recorded
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            if job.interval_seconds:
+                next_run = self._next_occurrence(job, now)
+                cursor = self._conn.execute(
+                    """
+                    UPDATE jobs SET status = 'pending', due_at = ?, run_at = ?, attempts = 0, lease_until = NULL,
+                        last_error = NULL, updated_at = ?, claim = NULL WHERE id = ? AND status = 'running' AND claim = ?
+                    """,
+                    (next_run, next_run, now, job.id, job.claim)
+                )
+            else:
+                cursor = self._conn.execute(
+                    """
+                    UPDATE jobs SET status = 'done', lease_until = NULL, updated_at = ?, claim = NULL
+                    WHERE id = ? AND status = 'running' AND claim = ?
+                    """,
+                    (now, job.id, job.claim)
+                )
+        return cursor.rowcount > 0
+
+    def fail(self, job: Job, error: str, retry_delay: float) -> str:
+        """
+        Record a failed attempt and schedule the retry or next occurrence.
+
+        Returns:
+            str: New status of the job: "pending" or "failed", or "lost" when the
+            claim had been lost, in which case nothing is recorded
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            if job.attempts < job.max_attempts:
+                status, run_at, due_at, attempts = "pending", now + retry_delay * 2 ** (job.attempts - 1), None, job.attempts
+            elif job.interval_seconds:
+                due_at = self._next_occurrence(job, now)
+                status, run_at, attempts = "pending", due_at, 0
+            else:
+                status, run_at, due_at, attempts = "failed", None, None, job.attempts
+            cursor = self._conn.execute(
+                """
+                UPDATE jobs SET status = ?, run_at = COALESCE(?, run_at), due_at = COALESCE(?, due_at), attempts = ?,
+                    lease_until = NULL, last_error = ?, updated_at = ?, claim = NULL WHERE id = ? AND status = 'running' AND claim = ?
+                """,
+                (status, run_at, due_at, attempts, error[-4000:], now, job.id, job.claim)
+            )
+        return status if cursor.rowcount else "lost"
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Dict]:
+        """Most recently updated jobs, optionally of one status."""
+        where = "WHERE status = ?" if status else ""
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT id, name, kind, status, run_at, attempts, last_error FROM jobs {where} ORDER BY updated_at DESC LIMIT {int(limit)}",
+                (status,) if status else ()
+            )
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _lower_priority() -> None:
+    """Worker initializer: only use CPU time that interactive sessions leave idle."""
+    try:
+        os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+    except (AttributeError, OSError):
+        try:
+            os.nice(19)
+        except (AttributeError, OSError):
+            logger.warning("Could not lower the priority of the job worker")
+
+
+class JobScheduler:
+    """
+    Polls a JobQueue and runs due jobs in low-priority worker processes.
+
+    Handlers run in separate processes started with "spawn" under SCHED_IDLE
+    (or nice 19 where that is unavailable), so they neither hold the web
+    worker's GIL nor take CPU from interactive sessions. Handlers must be
+    module-level functions taking the job payload. While a job runs, its lease
+    is renewed every quarter lease, so long jobs are not handed out twice.
+
+    Args:
+        queue: Queue to poll
+        handlers: Handler per job kind
+        concurrency: Jobs running at once across every process sharing the queue
+        poll_interval: Seconds between polls when nothing is due
+        retry_delay: Delay before the first retry; doubled on every further attempt
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: Dict[str, Callable[[Dict], Any]],
+        concurrency: int = 1,
+        poll_interval: float = 30.0,
+        retry_delay: float = 60.0
+    ):
+        self.queue = queue
+        self.handlers = handlers
+        self.concurrency = max(int(concurrency), 1)
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self._running: Dict[int, Tuple[Job, Future]] = {}
+        self._renewed_at = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.concurrency,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_lower_priority
+            )
+        return self._executor
+
+    def start(self) -> "JobScheduler":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="job-scheduler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, wait: bool = True) -> None:
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def wake(self) -> None:
+        """Poll now, e.g. after enqueueing a job that is due immediately."""
+        self._wake.set()
+
+    def dispatch(self) -> int:
+        """Submit due jobs until the concurrency limit is reached; returns the number submitted."""
+        submitted = 0
+        while not self._stopped.is_set():
+            with self._lock:
+                if len(self._running) >= self.concurrency:
+                    break
+            job = self.queue.claim(self.concurrency)
+            if job is None:
+                break
+            handler = self.handlers.get(job.kind)
+            if handler is None:
+                self._finish(job, f"No handler for job kind {job.kind!r}", 0.0)
+                continue
+            try:
+                future = self._pool().submit(handler, job.payload)
+            except BrokenProcessPool:
+                logger.exception("Job worker pool is broken; restarting it")
+                self._executor = None
+                future = self._pool().submit(handler, job.payload)
+            started = time.perf_counter()
+            with self._lock:
+                self._running[job.id] = (job, future)
+            future.add_done_callback(lambda f, job=job, started=started: self._done(job, f, started))
+            submitted += 1
+        return submitted
+
+    @property
+    def _renew_interval(self) -> float:
+        return self.queue.lease_seconds / 4
+
+    def renew_leases(self) -> int:
+        """Heartbeat: renew the leases of running jobs once a quarter lease has passed; returns the number renewed."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._renewed_at < self._renew_interval:
+                return 0
+            self._renewed_at = now
+            jobs = [job for job, _ in self._running.values()]
+        if not jobs:
+            return 0
+        for job in self.queue.renew(jobs):
+            logger.warning("Job %s (%s) lost its lease; its outcome will not be recorded", job.id, job.kind)
+        return len(jobs)
+
+    def _done(self, job: Job, future: Future, started: float) -> None:
+        try:
+            future.result()
+            error = None
+        except BaseException:
+            error = traceback.format_exc()
+        self._finish(job, error, time.perf_counter() - started)
+        with self._lock:
+            self._running.pop(job.id, None)
+        self._wake.set()
+
+    def _finish(self, job: Job, error: Optional[str], seconds: float) -> None:
+        if error is None:
+            outcome = "success" if self.queue.complete(job) else "lost"
+            logger.info("Job %s (%s) finished in %.1fs (%s)", job.id, job.kind, seconds, outcome)
+        else:
+            status = self.queue.fail(job, error, self.retry_delay)
+            outcome = "lost" if status == "lost" else "retry" if status == "pending" and job.attempts < job.max_attempts else "failure"
+            logger.warning("Job %s (%s) attempt %d failed (%s): %s", job.id, job.kind, job.attempts, outcome, error.strip().splitlines()[-1])
+        metrics.JOBS.inc(kind=job.kind, outcome=outcome)
+        metrics.JOB_SECONDS.observe(seconds, kind=job.kind)
+
+    def run_pending(self) -> int:
+        """Run every due job and wait for them; returns the number run."""
+        total = 0
+        while True:
+            submitted = self.dispatch()
+            with self._lock:
+                running = list(self._running.values())
+            if not submitted and not running:
+                return total
+            total += submitted
+            # Done callbacks record the outcome and free the slot after the future resolves
+            while True:
+                with self._lock:
+                    if not self._running:
+                        break
+                self.renew_leases()
+                self._wake.wait(0.1)
+                self._wake.clear()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.renew_leases()
+                self.dispatch()
+            except sqlite3.Error:
+                logger.exception("Job queue poll failed")
+            self._wake.wait(min(self.poll_interval, self._renew_interval))
+            self._wake.clear()
+
+
+def default_handlers() -> Dict[str, Callable[[Dict], Any]]:
+    import digests
+    return dict(digests.JOB_HANDLERS)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run scheduled background jobs, such as weekly organization digests.")
+    parser.add_argument("--queue", default=os.getenv("SCHEDULER_PATH", "data/jobs.db"))
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("SCHEDULER_CONCURRENCY", "1")))
+    parser.add_argument("--poll-interval", type=float, default=30.0)
+    parser.add_argument("--once", action="store_true", help="Run the jobs that are due now and exit")
+    parser.add_argument("--status", action="store_true", help="Print job counts and recent jobs and exit")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format='%(asctime)s - %(levelname)s - %(message)s')
+
+    queue = JobQueue(args.queue)
+    if args.status:
+        print(queue.counts())
+        for job in queue.jobs(limit=20):
+            print(job)
+        return 0
+    scheduler = JobScheduler(queue, default_handlers(), args.concurrency, args.poll_interval)
+    if args.once:
+        print(f"{scheduler.run_pending()} jobs run")
+        scheduler.stop()
+        return 0
+    scheduler.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        scheduler.stop(wait=False)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
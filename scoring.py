@@ -0,0 +1,209 @@
+import base64
+import math
+import zlib
+
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Sentinel stored in level matrices for unanswered questions
+MISSING_LEVEL = 255
+# Character used for unanswered questions in encoded answer strings
+MISSING_CHAR = "."
+# Questionnaire scores are language independent; this language is used for lookups
+SCORE_LANGUAGE = "Español"
+# First byte of every answer token; bump when the token layout changes
+TOKEN_VERSION = 1
+
+
+def question_layout(questions: Dict) -> List[Tuple[str, int, str]]:
+    """
+    Flatten the question bank into questionnaire order.
+
+    Args:
+        questions: Dictionary of questions by category and language
+
+    Returns:
+        List[Tuple[str, int, str]]: (category, index within category, question type) per question;
+        the list position plus one is the global question number.
+    """
+    return [
+        (cat, q_idx, q_type)
+        for cat in questions
+        for q_idx, (_, q_type, _) in enumerate(questions[cat][SCORE_LANGUAGE])
+    ]
+
+
+def question_offsets(questions: Dict) -> Dict[str, int]:
+    """Number of questions before each category; question q_idx of cat is number offset + q_idx + 1."""
+    offsets, total = {}, 0
+    for cat in questions:
+        offsets[cat] = total
+        total += len(questions[cat][SCORE_LANGUAGE])
+    return offsets
+
+
+def responses_to_levels(responses: Dict, questions: Dict, response_options: Dict) -> List[Optional[int]]:
+    """Convert session-style responses (scores per category) to answer levels in questionnaire order."""
+    levels = []
+    for cat, q_idx, q_type in question_layout(questions):
+        score = responses.get(cat, [None] * (q_idx + 1))[q_idx]
+        levels.append(None if score is None else response_options[q_type][SCORE_LANGUAGE]["scores"].index(score))
+    return levels
+
+
+def levels_to_responses(levels: Sequence[Optional[int]], questions: Dict, response_options: Dict) -> Dict[str, List[Optional[float]]]:
+    """Convert answer levels in questionnaire order back to session-style responses."""
+    layout = question_layout(questions)
+    if len(levels) != len(layout):
+        raise ValueError(f"Expected {len(layout)} answers, got {len(levels)}")
+    responses = {cat: [None] * len(questions[cat][SCORE_LANGUAGE]) for cat in questions}
+    for (cat, q_idx, q_type), level in zip(layout, levels):
+        if level is not None:
+            responses[cat][q_idx] = response_options[q_type][SCORE_LANGUAGE]["scores"][level]
+    return responses
+
+
+def encode_answers(levels: Sequence[Optional[int]]) -> str:
+    """Encode answer levels as one digit per question, MISSING_CHAR for unanswered."""
+    return "".join(MISSING_CHAR if level is None else str(level) for level in levels)
+
+
+def decode_answers(answers: str) -> List[Optional[int]]:
+    """Inverse of encode_answers."""
+    return [None if char == MISSING_CHAR else int(char) for char in answers]
+
+
+def category_scores(responses: Dict) -> Dict[str, float]:
+    """Mean score per category; every question must be answered."""
+    return {cat: sum(scores) / len(scores) for cat, scores in responses.items()}
+
+
+def overall_score(scores: Dict[str, float]) -> float:
+    """Unweighted mean of the category scores, as shown on the results page."""
+    return sum(scores.values()) / len(scores)
+
+
+def score_table(questions: Dict, response_options: Dict) -> np.ndarray:
+    """Score of every level for every question, shape (questions, levels)."""
+    return np.array(
+        [response_options[q_type][SCORE_LANGUAGE]["scores"] for _, _, q_type in question_layout(questions)],
+        dtype=np.float64
+    )
+
+
+def category_index(questions: Dict) -> np.ndarray:
+    """Category position (in questions order) of every question."""
+    positions = {cat: i for i, cat in enumerate(questions)}
+    return np.array([positions[cat] for cat, _, _ in question_layout(questions)], dtype=np.intp)
+
+
+def score_levels(levels: np.ndarray, questions: Dict, response_options: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized scoring of many audits at once.
+
+    Args:
+        levels: Integer array of shape (audits, questions); MISSING_LEVEL marks unanswered
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Category scores of shape (audits, categories) in
+        questions order, and overall scores of shape (audits,). Categories with an
+        unanswered question score NaN.
+    """
+    levels = np.asarray(levels)
+    table = score_table(questions, response_options)
+    missing = levels == MISSING_LEVEL
+    safe_levels = np.where(missing, 0, levels).astype(np.intp)
+    scores = table[np.arange(table.shape[0]), safe_levels]
+    scores[missing] = np.nan
+    cat_idx = category_index(questions)
+    cat_scores = np.column_stack([scores[:, cat_idx == c].mean(axis=1) for c in range(len(questions))])
+    return cat_scores, cat_scores.mean(axis=1)
+
+
+def encode_level_matrix(levels: np.ndarray) -> np.ndarray:
+    """Vectorized encode_answers: one answer string per row of a (audits, questions) level array."""
+    levels = np.asarray(levels, dtype=np.uint8)
+    lookup = np.full(256, ord(MISSING_CHAR), dtype=np.uint8)
+    lookup[:10] = np.frombuffer(b"0123456789", dtype=np.uint8)
+    chars = np.ascontiguousarray(lookup[levels])
+    return chars.view(f"S{levels.shape[1]}").ravel().astype(str)
+
+
+def decode_answer_matrix(answers: Sequence[str], n_questions: int) -> np.ndarray:
+    """
+    Vectorized decode_answers for many encoded answer strings.
+
+    Returns:
+        np.ndarray: uint8 levels of shape (audits, n_questions) with MISSING_LEVEL for
+        unanswered questions; strings of another length (other questionnaire versions)
+        are dropped.
+    """
+    answers = [a for a in answers if len(a) == n_questions]
+    if not answers:
+        return np.empty((0, n_questions), dtype=np.uint8)
+    chars = np.frombuffer("".join(answers).encode("ascii"), dtype=np.uint8).reshape(len(answers), n_questions)
+    return np.where(chars == ord(MISSING_CHAR), MISSING_LEVEL, chars - ord("0")).astype(np.uint8)
+
+
+def _token_checksum(body: bytes, questionnaire_version: str, n_questions: int, n_levels: int) -> bytes:
+    # Binding the questionnaire into the checksum rejects tokens issued for another question bank
+    context = f"{questionnaire_version}:{n_questions}:{n_levels}:".encode("utf-8")
+    return zlib.crc32(context + body).to_bytes(4, "big")
+
+
+def encode_token(levels: Sequence[int], n_levels: int, questionnaire_version: str) -> str:
+    """
+    Pack a fully answered audit into a short URL-safe token.
+
+    The answers are read as one base-n_levels integer (25 five-level answers fit
+    in 8 bytes), prefixed with TOKEN_VERSION and followed by a CRC32 checksum, and
+    the bytes are base64url encoded without padding.
+
+    Args:
+        levels: Answer levels in questionnaire order, none missing
+        n_levels: Levels of every response scale
+        questionnaire_version: Question bank the levels refer to
+
+    Returns:
+        str: Token, 18 characters for the default questionnaire
+    """
+    value = 0
+    for level in levels:
+        if level is None or not 0 <= int(level) < n_levels:
+            raise ValueError("Answer tokens need a fully answered audit")
+        value = value * n_levels + int(level)
+    width = max(1, math.ceil(len(levels) * math.log2(n_levels) / 8))
+    body = bytes([TOKEN_VERSION]) + value.to_bytes(width, "big")
+    token = body + _token_checksum(body, questionnaire_version, len(levels), n_levels)
+    return base64.urlsafe_b64encode(token).decode("ascii").rstrip("=")
+
+
+def decode_token(token: str, n_questions: int, n_levels: int, questionnaire_version: str) -> List[int]:
+    """
+    Inverse of encode_token.
+
+    Raises:
+        ValueError: If the token is malformed, of another version or questionnaire, or fails its checksum
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (ValueError, TypeError):
+        raise ValueError("malformed answer token")
+    width = max(1, math.ceil(n_questions * math.log2(n_levels) / 8))
+    if len(raw) != 1 + width + 4:
+        raise ValueError("malformed answer token")
+    body, checksum = raw[:-4], raw[-4:]
+    if body[0] != TOKEN_VERSION:
+        raise ValueError(f"unsupported answer token version {body[0]}")
+    if checksum != _token_checksum(body, questionnaire_version, n_questions, n_levels):
+        raise ValueError("answer token checksum mismatch")
+    value = int.from_bytes(body[1:], "big")
+    if value >= n_levels ** n_questions:
+        raise ValueError("malformed answer token")
+    levels = []
+    for _ in range(n_questions):
+        value, level = divmod(value, n_levels)
+        levels.append(level)
+    return levels[::-1]
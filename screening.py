@@ -0,0 +1,324 @@
+import argparse
+import logging
+import os
+import time
+import zlib
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from audit_archive import AuditArchive
+from audit_data import load_static_data
+from scoring import MISSING_LEVEL, decode_answer_matrix, question_layout, score_levels, score_table
+
+logger = logging.getLogger(__name__)
+
+# Bits of an audit's quality_flags
+QUALITY_FLAGS = {
+    "invalid": 1,        # answer outside its scale, or nothing answered
+    "straight_line": 2,  # every answer on the same option
+    "duplicate": 4,      # same answers as an earlier audit of the same organization
+    "outlier": 8,        # overall score far from its organization's distribution
+}
+
+# Flagged audits are kept but left out of organization statistics
+SCREENED_OUT = QUALITY_FLAGS["invalid"] | QUALITY_FLAGS["straight_line"] | QUALITY_FLAGS["duplicate"]
+
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: spreads every input bit over the whole 64-bit word."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * _MIX_1
+    values = values ^ (values >> np.uint64(27))
+    values = values * _MIX_2
+    return values ^ (values >> np.uint64(31))
+
+
+def answer_fingerprints(levels: np.ndarray, organizations: Optional[Sequence[str]] = None) -> np.ndarray:
+    """
+    64-bit fingerprint of every row of answers (and its organization), stable across processes.
+
+    Returns:
+        np.ndarray: uint64 array of shape (audits,)
+    """
+    levels = np.asarray(levels, dtype=np.uint8)
+    with np.errstate(over="ignore"):
+        fingerprints = np.full(len(levels), np.uint64(len(levels[0]) if len(levels) else 0), dtype=np.uint64)
+        for q in range(levels.shape[1]):
+            fingerprints = _mix(fingerprints ^ (levels[:, q].astype(np.uint64) + np.uint64(q << 8)))
+        if organizations is not None:
+            codes, names = pd.factorize(pd.Series(organizations, dtype=object))
+            org_hashes = np.array([zlib.crc32(str(name).encode("utf-8")) for name in names], dtype=np.uint64)
+            fingerprints = _mix(fingerprints ^ (org_hashes[codes] << np.uint64(32)))
+    return fingerprints
+
+
+class FingerprintIndex:
+    """
+    Sorted array of answer fingerprints for duplicate detection across batches.
+
+    Lookups are binary searches over 8 bytes per audit, so the index of tens of
+    millions of audits stays in a few hundred megabytes.
+    """
+
+    def __init__(self):
+        self.fingerprints = np.empty(0, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def contains(self, fingerprints: np.ndarray) -> np.ndarray:
+        positions = np.searchsorted(self.fingerprints, fingerprints)
+        found = positions < len(self.fingerprints)
+        found[found] = self.fingerprints[positions[found]] == fingerprints[found]
+        return found
+
+    def add(self, fingerprints: np.ndarray) -> None:
+        new = np.unique(fingerprints)
+        new = new[~self.contains(new)]
+        self.fingerprints = np.insert(self.fingerprints, np.searchsorted(self.fingerprints, new), new)
+
+    @classmethod
+    def from_archive(cls, archive: AuditArchive, n_questions: int, chunk_size: int = 100000) -> "FingerprintIndex":
+        """Index every audit already archived with the given number of questions."""
+        index = cls()
+        for _, answers, keys in archive.iter_dimensions(("organization",), chunk_size=chunk_size):
+            organizations = [key[0] for key, a in zip(keys, answers) if len(a) == n_questions]
+            index.add(answer_fingerprints(decode_answer_matrix(answers, n_questions), organizations))
+        return index
+
+
+def organization_moments(
+    levels: np.ndarray,
+    organizations: Sequence[str],
+    questions: Dict,
+    response_options: Dict
+) -> pd.DataFrame:
+    """
+    Count, sum and sum of squares of the overall scores of audits per organization.
+
+    Returns:
+        pd.DataFrame: "count", "total" and "squares" indexed by organization
+    """
+    overall = score_levels(levels, questions, response_options)[1] if len(levels) else np.empty(0)
+    frame = pd.DataFrame({"organization": np.asarray(organizations, dtype=object), "overall": overall}).dropna()
+    frame["squares"] = frame["overall"] ** 2
+    return frame.groupby("organization").agg(count=("overall", "count"), total=("overall", "sum"), squares=("squares", "sum"))
+
+
+def add_moments(sums: Dict[str, np.ndarray], moments: pd.DataFrame) -> None:
+    """Fold organization_moments into running per-organization sums."""
+    for org, row in zip(moments.index, moments.to_numpy()):
+        sums[org] = sums.get(org, np.zeros(3)) + row
+
+
+def moments_reference(sums: Mapping[str, np.ndarray], min_group: int = 20) -> Dict[str, Tuple[float, float]]:
+    """Overall score (mean, std) per organization with at least min_group audits, for screen_levels."""
+    reference = {}
+    for org, (count, total, squares) in sums.items():
+        if count >= min_group:
+            mean = total / count
+            reference[org] = (mean, np.sqrt(max(squares - total * mean, 0) / (count - 1)))
+    return reference
+
+
+def screen_levels(
+    levels: np.ndarray,
+    questions: Dict,
+    response_options: Dict,
+    organizations: Optional[Sequence[str]] = None,
+    index: Optional[FingerprintIndex] = None,
+    reference: Optional[Mapping[str, Tuple[float, float]]] = None,
+    z_threshold: float = 3.0,
+    min_answers: int = 5,
+    min_group: int = 20
+) -> np.ndarray:
+    """
+    Quality flags for a batch of audits, computed column-wise over the whole batch.
+
+    Args:
+        levels: Answer levels of shape (audits, questions); MISSING_LEVEL marks unanswered
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        organizations: Organization of every audit; duplicates and outliers are per organization
+        index: Fingerprints of earlier audits; the batch's fingerprints are added to it
+        reference: Overall score (mean, std) per organization, e.g. from the archive;
+            organizations without an entry (all of them by default) are judged
+            against the batch's own audits that are not SCREENED_OUT
+        z_threshold: Outlier cut-off in standard deviations from the organization mean
+        min_answers: Straight-lining needs at least this many answers
+        min_group: Organizations with fewer reference audits get no outlier flags
+
+    Returns:
+        np.ndarray: uint8 QUALITY_FLAGS bitmask per audit
+    """
+    levels = np.asarray(levels, dtype=np.uint8)
+    n_levels = score_table(questions, response_options).shape[1]
+    if levels.ndim != 2 or levels.shape[1] != len(question_layout(questions)):
+        raise ValueError(f"Expected levels of shape (audits, {len(question_layout(questions))}), got {levels.shape}")
+    flags = np.zeros(len(levels), dtype=np.uint8)
+    if not len(levels):
+        return flags
+    organizations = np.asarray(organizations if organizations is not None else [""] * len(levels), dtype=object)
+
+    answered = levels != MISSING_LEVEL
+    n_answered = answered.sum(axis=1)
+    invalid = ((levels >= n_levels) & answered).any(axis=1) | (n_answered == 0)
+    flags[invalid] |= QUALITY_FLAGS["invalid"]
+
+    # Zero variance across the answered questions
+    highest = np.where(answered, levels, 0).max(axis=1)
+    lowest = np.where(answered, levels, MISSING_LEVEL).min(axis=1)
+    flags[(n_answered >= min_answers) & (highest == lowest)] |= QUALITY_FLAGS["straight_line"]
+
+    fingerprints = answer_fingerprints(levels, organizations)
+    duplicate = pd.Series(fingerprints).duplicated().to_numpy()
+    if index is not None:
+        duplicate |= index.contains(fingerprints)
+        index.add(fingerprints)
+    flags[duplicate] |= QUALITY_FLAGS["duplicate"]
+
+    valid = ~invalid
+    overall = np.full(len(levels), np.nan)
+    overall[valid] = score_levels(levels[valid], questions, response_options)[1]
+    reference = dict(reference or {})
+    if len(levels) >= min_group and not set(organizations) <= set(reference):
+        clean = pd.DataFrame({"organization": organizations, "overall": overall})[(flags & SCREENED_OUT) == 0]
+        stats = clean.groupby("organization")["overall"].agg(["count", "mean", "std"])
+        stats = stats[stats["count"] >= min_group]
+        reference = {**dict(zip(stats.index, zip(stats["mean"], stats["std"]))), **reference}
+    if reference:
+        codes, names = pd.factorize(pd.Series(organizations, dtype=object))
+        means = np.array([reference.get(name, (np.nan, np.nan))[0] for name in names], dtype=np.float64)[codes]
+        stds = np.array([reference.get(name, (np.nan, np.nan))[1] for name in names], dtype=np.float64)[codes]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z = np.abs(overall - means) / stds
+        flags[np.nan_to_num(z, nan=0.0, posinf=0.0) > z_threshold] |= QUALITY_FLAGS["outlier"]
+    return flags
+
+
+def flag_counts(flags: np.ndarray) -> Dict[str, int]:
+    """Number of audits carrying each flag, plus "flagged" (any flag) and "audits"."""
+    flags = np.asarray(flags, dtype=np.uint8)
+    counts = {name: int(((flags & bit) != 0).sum()) for name, bit in QUALITY_FLAGS.items()}
+    counts["flagged"] = int((flags != 0).sum())
+    counts["audits"] = len(flags)
+    return counts
+
+
+def flag_names(flags: int) -> List[str]:
+    return [name for name, bit in QUALITY_FLAGS.items() if flags & bit]
+
+
+def screen_records(
+    records: Iterable[Dict],
+    questions: Dict,
+    response_options: Dict,
+    index: Optional[FingerprintIndex] = None,
+    batch_size: int = 50000,
+    reference: Optional[Mapping[str, Tuple[float, float]]] = None
+) -> Iterable[Dict]:
+    """
+    Set "quality_flags" on archive records in batches, e.g. in front of AuditArchive.add_many.
+
+    Outliers are judged against reference, the organizations' archived
+    distribution (analytics.ArchiveScreening), and against each batch's own
+    distribution for organizations not in it.
+    """
+    n_questions = len(question_layout(questions))
+    batch: List[Dict] = []
+
+    def flush():
+        levels = decode_answer_matrix([record["answers"] for record in batch], n_questions)
+        if len(levels) != len(batch):
+            raise ValueError(f"Every answer string must have {n_questions} characters")
+        flags = screen_levels(
+            levels, questions, response_options, [record.get("organization", "") for record in batch], index, reference
+        )
+        for record, flag in zip(batch, flags):
+            record["quality_flags"] = int(flag)
+        logger.info("Screened %d audits: %s", len(batch), flag_counts(flags))
+        yield from batch
+        batch.clear()
+
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield from flush()
+    if batch:
+        yield from flush()
+
+
+def screen_archive(
+    archive: AuditArchive,
+    questions: Dict,
+    response_options: Dict,
+    chunk_size: int = 100000,
+    min_group: int = 20
+) -> Dict[str, int]:
+    """
+    Recompute the quality flags of every archived audit of this questionnaire.
+
+    The first pass flags invalid, straight-lined and duplicate audits and builds
+    each organization's overall score distribution from the rest; the second pass
+    flags outliers against it and stores the flags. Changed flags bump the
+    archive's revision, so aggregates already built in a running app rebuild on
+    their next refresh.
+
+    Returns:
+        Dict[str, int]: flag_counts of the whole archive, plus "seconds"
+    """
+    start = time.perf_counter()
+    n_questions = len(question_layout(questions))
+    dimensions = ("report_id", "organization")
+
+    def chunks():
+        for _, answers, keys in archive.iter_dimensions(dimensions, chunk_size=chunk_size):
+            keys = [key for key, a in zip(keys, answers) if len(a) == n_questions]
+            yield decode_answer_matrix(answers, n_questions), [key[0] for key in keys], [key[1] for key in keys]
+
+    # Pass 1: per-organization count, sum and sum of squares of clean overall scores
+    index = FingerprintIndex()
+    sums: Dict[str, np.ndarray] = {}
+    for levels, _, organizations in chunks():
+        # Only the SCREENED_OUT bits are used here; outliers are judged in pass 2
+        flags = screen_levels(levels, questions, response_options, organizations, index)
+        clean = (flags & SCREENED_OUT) == 0
+        add_moments(sums, organization_moments(levels[clean], np.asarray(organizations, dtype=object)[clean], questions, response_options))
+    reference = moments_reference(sums, min_group)
+
+    # Pass 2: final flags, duplicates judged against the audits before them
+    index = FingerprintIndex()
+    all_flags = []
+    for levels, report_ids, organizations in chunks():
+        flags = screen_levels(levels, questions, response_options, organizations, index, reference=reference)
+        archive.set_quality_flags(zip(report_ids, flags.tolist()))
+        all_flags.append(flags)
+    counts = flag_counts(np.concatenate(all_flags) if all_flags else np.empty(0, dtype=np.uint8))
+    counts["seconds"] = time.perf_counter() - start
+    logger.info("Screened %d archived audits in %.2fs", counts["audits"], counts["seconds"])
+    return counts
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Flag straight-lined, duplicate and outlier audits in the archive.")
+    parser.add_argument("--archive", default=os.getenv("AUDIT_ARCHIVE_PATH", "data/audits.db"))
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format='%(asctime)s - %(levelname)s - %(message)s')
+
+    questions, response_options = load_static_data()
+    counts = screen_archive(AuditArchive(args.archive), questions, response_options, args.chunk_size)
+    seconds = counts.pop("seconds")
+    print(f"{counts['audits']} audits screened in {seconds:.1f}s ({counts['audits'] / max(seconds, 1e-9):,.0f}/s)")
+    for name in QUALITY_FLAGS:
+        print(f"  {name}: {counts[name]}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+import re
+import unicodedata
+from typing import Dict, Iterable, List, NamedTuple, Sequence
+
+from scoring import question_layout
+
+# Shortest query prefix that is looked up; shorter tokens match too much to be useful
+MIN_PREFIX = 2
+
+# Fields of a question that are indexed, in result order
+QUESTION_FIELD = 0
+RECOMMENDATION_FIELD = 1
+
+_TOKEN = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """Case- and accent-insensitive form of text: "Capacitación" and "capacitacion" are equal."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(normalize(text))
+
+
+class SearchHit(NamedTuple):
+    position: int
+    category: str
+    q_idx: int
+    question_match: bool
+    recommendation_match: bool
+
+
+class QuestionIndex:
+    """
+    Inverted index over the question texts and recommendations of one question bank and language.
+
+    Every prefix (of at least MIN_PREFIX characters) of every normalized token
+    maps to a bitmask of documents, two per question: its text and its
+    recommendation. A query is then one dictionary lookup per query token and
+    a bitwise AND, so search time does not grow with the size of the bank;
+    the index itself takes roughly (distinct prefixes x documents / 8) bytes.
+
+    Args:
+        questions: Dictionary of questions by category and language
+        language: Language whose texts are indexed
+    """
+
+    def __init__(self, questions: Dict, language: str):
+        self.language = language
+        self.layout = [(cat, q_idx) for cat, q_idx, _ in question_layout(questions)]
+        self.postings: Dict[str, int] = {}
+        for position, (cat, q_idx) in enumerate(self.layout):
+            text, _, recommendation = questions[cat][language][q_idx]
+            for field, content in ((QUESTION_FIELD, text), (RECOMMENDATION_FIELD, recommendation)):
+                bit = 1 << (2 * position + field)
+                for token in set(tokenize(content)):
+                    for end in range(min(MIN_PREFIX, len(token)), len(token) + 1):
+                        prefix = token[:end]
+                        self.postings[prefix] = self.postings.get(prefix, 0) | bit
+
+    def match(self, query: str) -> int:
+        """Bitmask of the documents containing every query token as a word prefix; 0 for an empty query."""
+        tokens = [token for token in tokenize(query) if len(token) >= MIN_PREFIX]
+        if not tokens:
+            return 0
+        matched = -1
+        for token in tokens:
+            matched &= self.postings.get(token, 0)
+            if not matched:
+                break
+        return matched
+
+    def hits(self, matched: int, limit: int = 20) -> List[SearchHit]:
+        """Questions of a match bitmask in questionnaire order."""
+        results = []
+        while matched and len(results) < limit:
+            lowest = matched & -matched
+            position = (lowest.bit_length() - 1) // 2
+            pair = (matched >> (2 * position)) & 0b11
+            matched &= ~(0b11 << (2 * position))
+            cat, q_idx = self.layout[position]
+            results.append(SearchHit(position, cat, q_idx, bool(pair & 1), bool(pair & 2)))
+        return results
+
+    def search(self, query: str, limit: int = 20) -> List[SearchHit]:
+        return self.hits(self.match(query), limit)
+
+
+def search_any(indexes: Sequence[QuestionIndex], query: str, limit: int = 20) -> List[SearchHit]:
+    """
+    Search several indexes of the same question bank, e.g. one per language.
+
+    Question positions are shared across languages, so a term found in either
+    language leads to the same questions.
+    """
+    matched = 0
+    for index in indexes:
+        matched |= index.match(query)
+    return indexes[0].hits(matched, limit) if indexes else []
+
+
+def build_indexes(questions: Dict, languages: Iterable[str]) -> List[QuestionIndex]:
+    return [QuestionIndex(questions, language) for language in languages]
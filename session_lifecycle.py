@@ -0,0 +1,175 @@
+import logging
+import re
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Radio widget keys end with the report_id they were created for ({category}_{q_idx}_{report_id})
+REPORT_KEY_SUFFIX = re.compile(r"_([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$")
+
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """Approximate deep size in bytes of session state values and cached tenant assets: containers, frames, arrays and bytes."""
+    _seen = set() if _seen is None else _seen
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        # Views share their base's buffer but are counted in full
+        return sys.getsizeof(value) if value.base is None else int(value.nbytes)
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in value)
+    elif hasattr(value, "data") and isinstance(getattr(value, "data"), pd.DataFrame):
+        # Styled frames keep their data frame
+        size += estimate_size(value.data, _seen)
+    return size
+
+
+def stale_report_keys(keys: Iterable[str], report_id: str) -> List[str]:
+    """Widget keys created for another report_id, e.g. before a reset or language change."""
+    stale = []
+    for key in keys:
+        match = REPORT_KEY_SUFFIX.search(key) if isinstance(key, str) else None
+        if match and match.group(1) != report_id:
+            stale.append(key)
+    return stale
+
+
+class SessionLifecycle:
+    """
+    Per-session memory accounting and idle reclamation of derived artifacts.
+
+    Heavy artifacts that can be rebuilt (workbook bytes, figures) are held here
+    instead of in st.session_state, keyed by session and name. Every rerun calls
+    touch() with the size of the session's own state; sessions that have not
+    rerun for idle_seconds lose their artifacts, which get_or_create() rebuilds
+    on the session's next request. Sessions idle for forget_seconds are dropped
+    from the accounting altogether.
+
+    Args:
+        idle_seconds: Idle time after which a session's artifacts are dropped
+        forget_seconds: Idle time after which a session is no longer accounted
+        sweep_interval: Minimum seconds between idle sweeps
+    """
+
+    def __init__(self, idle_seconds: float = 900.0, forget_seconds: float = 86400.0, sweep_interval: float = 30.0):
+        self.idle_seconds = idle_seconds
+        self.forget_seconds = forget_seconds
+        self.sweep_interval = sweep_interval
+        self.reclaimed_bytes = 0
+        # session_id -> [last_seen, state_bytes, {name: (key, value, size)}]
+        self._sessions: Dict[str, list] = {}
+        self._last_sweep = 0.0
+        self._lock = threading.Lock()
+
+    def touch(self, session_id: str, state_bytes: int) -> None:
+        """Record a rerun of the session and the current size of its session state."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.setdefault(session_id, [now, 0, {}])
+            entry[0] = now
+            entry[1] = int(state_bytes)
+            sweep = now - self._last_sweep >= self.sweep_interval
+            if sweep:
+                self._last_sweep = now
+        if sweep:
+            self.reclaim_idle()
+        else:
+            self._publish()
+
+    def get_or_create(
+        self,
+        session_id: str,
+        name: str,
+        key: Hashable,
+        factory: Callable[[], Any],
+        sizeof: Callable[[Any], int] = estimate_size
+    ) -> Tuple[Any, bool]:
+        """
+        The session's artifact for key, built by factory when missing, reclaimed or built for another key.
+
+        Returns:
+            Tuple[Any, bool]: The artifact and whether it was already held
+        """
+        with self._lock:
+            entry = self._sessions.setdefault(session_id, [time.monotonic(), 0, {}])
+            held = entry[2].get(name)
+        if held is not None and held[0] == key:
+            return held[1], True
+        value = factory()
+        self.put(session_id, name, key, value, sizeof(value))
+        return value, False
+
+    def get(self, session_id: str, name: str, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            held = entry[2].get(name) if entry is not None else None
+        return held[1] if held is not None and held[0] == key else None
+
+    def put(self, session_id: str, name: str, key: Hashable, value: Any, size: Optional[int] = None) -> None:
+        with self._lock:
+            entry = self._sessions.setdefault(session_id, [time.monotonic(), 0, {}])
+            entry[2][name] = (key, value, estimate_size(value) if size is None else int(size))
+        self._publish()
+
+    def drop(self, session_id: str, name: Optional[str] = None) -> int:
+        """Release one artifact of a session, or all of them; returns the bytes released."""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return 0
+            names = [name] if name is not None else list(entry[2])
+            released = sum(entry[2].pop(n)[2] for n in names if n in entry[2])
+        self._publish()
+        return released
+
+    def reclaim_idle(self) -> int:
+        """Drop the artifacts of idle sessions and forget long-idle ones; returns the bytes released."""
+        now = time.monotonic()
+        released = 0
+        with self._lock:
+            for session_id in list(self._sessions):
+                last_seen, _, artifacts = self._sessions[session_id]
+                idle = now - last_seen
+                if idle >= self.idle_seconds and artifacts:
+                    released += sum(size for _, _, size in artifacts.values())
+                    artifacts.clear()
+                if idle >= self.forget_seconds:
+                    del self._sessions[session_id]
+            self.reclaimed_bytes += released
+        if released:
+            logger.info("Reclaimed %d bytes of artifacts from idle sessions", released)
+            metrics.SESSION_RECLAIMED_BYTES.inc(released)
+        self._publish()
+        return released
+
+    def stats(self) -> Dict[str, int]:
+        """Aggregate accounting: "sessions", "state_bytes", "artifact_bytes" and "reclaimed_bytes"."""
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "state_bytes": sum(entry[1] for entry in self._sessions.values()),
+                "artifact_bytes": sum(size for entry in self._sessions.values() for _, _, size in entry[2].values()),
+                "reclaimed_bytes": self.reclaimed_bytes,
+            }
+
+    def _publish(self) -> None:
+        stats = self.stats()
+        metrics.SESSIONS_TRACKED.set(stats["sessions"])
+        metrics.SESSION_STATE_BYTES.set(stats["state_bytes"])
+        metrics.SESSION_ARTIFACT_BYTES.set(stats["artifact_bytes"])
@@ -0,0 +1,304 @@
+import argparse
+import json
+import logging
+import os
+import time
+from statistics import NormalDist
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from audit_archive import AuditArchive
+from audit_data import load_static_data
+from scoring import MISSING_LEVEL, category_index, encode_level_matrix, score_levels, score_table
+
+logger = logging.getLogger(__name__)
+
+# (mean, standard deviation) of the category score, in percent
+DEFAULT_PROFILE = (65.0, 18.0)
+DEFAULT_ORGANIZATIONS = {
+    "Acme Manufacturing": {"Operations": 5, "Logistics": 3, "Quality": 2, "Human Resources": 1},
+    "Northwind Services": {"Customer Care": 4, "Finance": 2, "Human Resources": 1},
+    "Globex Health": {"Nursing": 6, "Administration": 2, "Facilities": 1},
+}
+DEFAULT_LANGUAGES = {"Español": 0.6, "English": 0.4}
+SOURCE = "synthetic"
+# Category scores are quantized to this grid before the per-question noise lookup
+LATENT_MIN, LATENT_STEP, LATENT_BINS = -50.0, 1.0, 201
+
+
+def _nearest_level(scores: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Level whose scale score is closest to each target score."""
+    order = np.argsort(scale, kind="stable")
+    sorted_scale = scale[order]
+    return order[np.searchsorted((sorted_scale[1:] + sorted_scale[:-1]) / 2, scores, side="right")].astype(np.uint8)
+
+
+def _level_lookup(table: np.ndarray, question_noise: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Precompute answer levels for every (scale, latent score bin, random byte).
+
+    Adding normal noise to 25 scores per audit and rounding them dominates the cost of
+    generation; instead the noise is drawn as one random byte per answer, standing for
+    the noise quantile, and looked up together with the quantized category score.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Flat uint8 lookup table and the offset of each
+        question's scale in it
+    """
+    quantiles = np.array([NormalDist().inv_cdf((r + 0.5) / 256) for r in range(256)], dtype=np.float32)
+    grid = np.arange(LATENT_BINS, dtype=np.float32) * LATENT_STEP + LATENT_MIN
+    scales, scale_of_question = np.unique(table, axis=0, return_inverse=True)
+    lookup = np.concatenate([
+        _nearest_level(grid[:, None] + question_noise * quantiles[None, :], scale).ravel() for scale in scales
+    ])
+    # 16-bit indices halve the memory traffic whenever the table is small enough
+    index_type = np.uint16 if lookup.size <= np.iinfo(np.uint16).max + 1 else np.uint32
+    return lookup, (scale_of_question.ravel() * LATENT_BINS * 256).astype(index_type)
+
+
+def generate_audits(
+    count: int,
+    questions: Dict,
+    response_options: Dict,
+    seed: int = 0,
+    category_profiles: Optional[Dict[str, Tuple[float, float]]] = None,
+    organizations: Optional[Dict[str, Dict[str, float]]] = None,
+    languages: Optional[Dict[str, float]] = None,
+    missing_rate: float = 0.0,
+    organization_spread: float = 8.0,
+    department_spread: float = 5.0,
+    question_noise: float = 12.0,
+    start_date: str = "2025-01-01",
+    period_days: int = 365,
+    chunk_size: int = 1_000_000
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Generate reproducible synthetic audits over a question bank, one chunk at a time.
+
+    Every audit draws a latent score per category from that category's profile,
+    shifted by a per-organization and per-department offset, and each question
+    adds independent noise before snapping to the nearest level of its response
+    scale. All draws are vectorized per chunk; the same seed and chunk_size
+    always produce the same audits.
+
+    Args:
+        count: Number of audits
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        seed: Random seed
+        category_profiles: (mean, standard deviation) of the score per category; DEFAULT_PROFILE otherwise
+        organizations: Department weights per organization; an organization's weight is the sum of its departments'
+        languages: Share of audits per language
+        missing_rate: Probability that any single answer is left blank (MISSING_LEVEL)
+        organization_spread: Standard deviation of the per-organization score offset
+        department_spread: Standard deviation of the per-department score offset
+        question_noise: Standard deviation of the per-question score noise
+        start_date: First submission date (YYYY-MM-DD)
+        period_days: Submissions are spread uniformly over this many days
+        chunk_size: Audits per yielded chunk
+
+    Yields:
+        Dict[str, np.ndarray]: "seed", "number" (audit position), "submitted_at"
+        (datetime64), "language", "organization", "department" (string arrays) and
+        "levels" (uint8 array of shape (chunk, questions)). Identifiers and timestamps
+        are only formatted by chunk_records and chunk_frame, when audits are written.
+    """
+    category_profiles = category_profiles or {}
+    organizations = organizations or DEFAULT_ORGANIZATIONS
+    languages = languages or DEFAULT_LANGUAGES
+    unknown = set(category_profiles) - set(questions)
+    if unknown:
+        raise ValueError(f"Unknown categories in profiles: {sorted(unknown)}")
+    if not 0 <= missing_rate <= 1:
+        raise ValueError("missing_rate must be between 0 and 1")
+
+    lookup, scale_offset = _level_lookup(score_table(questions, response_options), question_noise)
+    cat_idx = category_index(questions)
+    missing_cutoff = int(round(missing_rate * 65536))
+    profiles = np.array([category_profiles.get(cat, DEFAULT_PROFILE) for cat in questions], dtype=np.float32)
+
+    # Flatten the hierarchy so one draw picks both organization and department
+    units = [(org, dept, weight) for org, departments in organizations.items() for dept, weight in departments.items()]
+    unit_org = np.array([org for org, _, _ in units], dtype=object)
+    unit_dept = np.array([dept for _, dept, _ in units], dtype=object)
+    unit_weights = np.array([weight for _, _, weight in units], dtype=np.float64)
+    org_names = list(organizations)
+    language_names = np.array(list(languages), dtype=object)
+    language_weights = np.array(list(languages.values()), dtype=np.float64)
+
+    n_chunks = max(1, -(-count // chunk_size))
+    hierarchy_seed, *chunk_seeds = np.random.SeedSequence(seed).spawn(n_chunks + 1)
+    rng = np.random.default_rng(hierarchy_seed)
+    org_offset = rng.normal(0, organization_spread, len(org_names)).astype(np.float32)
+    unit_offset = (
+        org_offset[[org_names.index(org) for org, _, _ in units]]
+        + rng.normal(0, department_spread, len(units)).astype(np.float32)
+    )
+    start = np.datetime64(start_date, "s")
+    period_seconds = int(period_days) * 86400
+
+    for chunk_number, chunk_seed in enumerate(chunk_seeds):
+        first = chunk_number * chunk_size
+        size = min(chunk_size, count - first)
+        if size <= 0:
+            break
+        rng = np.random.default_rng(chunk_seed)
+        unit = rng.choice(len(units), size, p=unit_weights / unit_weights.sum())
+        language = rng.choice(len(language_names), size, p=language_weights / language_weights.sum())
+
+        latent = rng.standard_normal((size, len(profiles)), dtype=np.float32)
+        latent *= profiles[:, 1]
+        latent += profiles[:, 0]
+        latent += unit_offset[unit][:, None]
+        latent -= LATENT_MIN
+        latent /= LATENT_STEP
+        bins = np.clip(np.rint(latent), 0, LATENT_BINS - 1).astype(scale_offset.dtype)
+        bins *= 256
+        index = rng.integers(0, 256, (size, len(cat_idx)), dtype=np.uint8).astype(scale_offset.dtype)
+        index += np.take(bins, cat_idx, axis=1)
+        index += scale_offset
+        levels = lookup[index]
+        if missing_cutoff:
+            np.copyto(levels, MISSING_LEVEL, where=rng.integers(0, 65536, levels.shape, dtype=np.uint16) < missing_cutoff)
+
+        submitted = start + rng.integers(0, period_seconds, size).astype("timedelta64[s]")
+        yield {
+            "seed": seed,
+            "number": np.arange(first, first + size),
+            "submitted_at": submitted,
+            "language": language_names[language],
+            "organization": unit_org[unit],
+            "department": unit_dept[unit],
+            "levels": levels,
+        }
+
+
+def _chunk_metadata(chunk: Dict[str, np.ndarray]) -> pd.DataFrame:
+    numbers = pd.Series(chunk["number"]).astype(str).str.zfill(10)
+    return pd.DataFrame({
+        "report_id": f"synthetic-{chunk['seed']}-" + numbers,
+        "submitted_at": np.char.add(np.datetime_as_string(chunk["submitted_at"], unit="s"), "+00:00"),
+        "language": chunk["language"],
+        "organization": chunk["organization"],
+        "department": chunk["department"],
+    })
+
+
+def chunk_records(chunk: Dict[str, np.ndarray], questions: Dict, response_options: Dict) -> Iterator[Dict]:
+    """Archive records (see audit_archive.ARCHIVE_COLUMNS) for a generated chunk."""
+    _, overall = score_levels(chunk["levels"], questions, response_options)
+    answers = encode_level_matrix(chunk["levels"])
+    overall = np.where(np.isnan(overall), None, np.round(overall, 4)).tolist()
+    metadata = _chunk_metadata(chunk)
+    for report_id, submitted_at, language, organization, department, encoded, score in zip(
+        metadata["report_id"].tolist(), metadata["submitted_at"].tolist(), metadata["language"].tolist(),
+        metadata["organization"].tolist(), metadata["department"].tolist(), answers.tolist(), overall
+    ):
+        yield {
+            "report_id": report_id,
+            "submitted_at": submitted_at,
+            "source": SOURCE,
+            "language": language,
+            "organization": organization,
+            "department": department,
+            "answers": encoded,
+            "overall_score": score,
+        }
+
+
+def chunk_frame(chunk: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Export layout of a generated chunk: metadata columns followed by one column per
+    question number ("q1", "q2", ...) holding the answer level, blank when unanswered.
+    """
+    frame = _chunk_metadata(chunk)
+    levels = pd.DataFrame(chunk["levels"], columns=[f"q{i + 1}" for i in range(chunk["levels"].shape[1])], dtype="UInt8")
+    levels = levels.mask(levels == MISSING_LEVEL)
+    return pd.concat([frame, levels], axis=1)
+
+
+def write_outputs(
+    chunks: Iterable[Dict[str, np.ndarray]],
+    questions: Dict,
+    response_options: Dict,
+    archive: Optional[AuditArchive] = None,
+    csv_path: Optional[str] = None,
+    jsonl_path: Optional[str] = None
+) -> Dict:
+    """
+    Stream generated chunks to the archive and/or CSV and JSONL exports in one pass.
+
+    Returns:
+        Dict: Summary with "generated", "archived" and "seconds"
+    """
+    start = time.perf_counter()
+    generated = archived = 0
+    handles = {}
+    try:
+        for path, key in ((csv_path, "csv"), (jsonl_path, "jsonl")):
+            if path:
+                if os.path.dirname(path):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                handles[key] = open(path, "w", encoding="utf-8", newline="")
+        for chunk in chunks:
+            if archive is not None:
+                archived += archive.add_many(chunk_records(chunk, questions, response_options), batch_size=50000)
+            if handles:
+                frame = chunk_frame(chunk)
+                if "csv" in handles:
+                    frame.to_csv(handles["csv"], index=False, header=generated == 0)
+                if "jsonl" in handles:
+                    handles["jsonl"].write(frame.to_json(orient="records", lines=True, force_ascii=False))
+                    handles["jsonl"].write("\n")
+            generated += len(chunk["levels"])
+    finally:
+        for handle in handles.values():
+            handle.close()
+    seconds = time.perf_counter() - start
+    logger.info("Wrote %d synthetic audits in %.2fs", generated, seconds)
+    return {"generated": generated, "archived": archived, "seconds": seconds}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate reproducible synthetic audits for load and scale testing.")
+    parser.add_argument("--count", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--config", default=None, help="JSON file with category_profiles, organizations and languages")
+    parser.add_argument("--missing-rate", type=float, default=0.0)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    parser.add_argument("--archive", default=None, help="SQLite audit archive to load the audits into")
+    parser.add_argument("--csv", default=None)
+    parser.add_argument("--jsonl", default=None)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format='%(asctime)s - %(levelname)s - %(message)s')
+
+    options = {}
+    if args.config:
+        with open(args.config, encoding="utf-8") as f:
+            options = json.load(f)
+        if "category_profiles" in options:
+            options["category_profiles"] = {cat: tuple(profile) for cat, profile in options["category_profiles"].items()}
+    questions, response_options = load_static_data()
+    chunks = generate_audits(
+        args.count, questions, response_options, seed=args.seed,
+        missing_rate=args.missing_rate, chunk_size=args.chunk_size, **options
+    )
+    if not (args.archive or args.csv or args.jsonl):
+        # Generation only, e.g. to time the generator itself
+        start = time.perf_counter()
+        generated = sum(len(chunk["levels"]) for chunk in chunks)
+        print(f"Generated {generated} audits in {time.perf_counter() - start:.2f}s")
+        return 0
+    summary = write_outputs(
+        chunks, questions, response_options,
+        archive=AuditArchive(args.archive) if args.archive else None,
+        csv_path=args.csv, jsonl_path=args.jsonl
+    )
+    print(f"Generated {summary['generated']} audits ({summary['archived']} archived) in {summary['seconds']:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
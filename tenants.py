@@ -0,0 +1,198 @@
+import copy
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import metrics
+from audit_data import (
+    category_mapping as default_category_mapping, load_static_data, recommendation_effort as default_recommendation_effort
+)
+from session_lifecycle import estimate_size
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT_ID = "default"
+DEFAULT_QUESTIONNAIRE_VERSION = "1"
+DEFAULT_SCORE_THRESHOLDS = {
+    "CRITICAL": 50,
+    "NEEDS_IMPROVEMENT": 70,
+    "GOOD": 85,
+}
+DEFAULT_CONTACT = {
+    "email": os.getenv("CONTACT_EMAIL", "contacto@lean2institute.org"),
+    "website": os.getenv("CONTACT_WEBSITE", "https://lean2institute.mystrikingly.com/")
+}
+# Older question banks carried the question number in the text ("12. How many ...")
+QUESTION_NUMBER_PREFIX = re.compile(r"^\s*\d+\.\s+")
+
+
+class BoundedLRUCache:
+    """
+    Least-recently-used cache bounded by the total estimated size of its values.
+
+    Args:
+        max_bytes: Memory cap; values larger than the cap are returned but never stored
+        name: Cache name used for hit/miss metrics
+    """
+
+    def __init__(self, max_bytes: int, name: str = "tenant_assets"):
+        self.max_bytes = max_bytes
+        self.name = name
+        self.current_bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any], sizeof: Callable[[Any], int] = estimate_size) -> Any:
+        """
+        Return the cached value for key, building and storing it on a miss.
+
+        Args:
+            key: Cache key
+            factory: Builds the value on a miss
+            sizeof: Estimates the value's size in bytes
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        metrics.record_cache(self.name, entry is not None)
+        if entry is not None:
+            return entry[0]
+
+        value = factory()
+        size = sizeof(value)
+        if size > self.max_bytes:
+            logger.warning("Cache %s: %r (%d bytes) exceeds the %d byte cap; not cached", self.name, key, size, self.max_bytes)
+            return value
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                evicted, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                logger.debug("Cache %s evicted %r (%d bytes)", self.name, evicted, evicted_size)
+        return value
+
+
+def question_bank_key(tenant: Dict) -> Tuple[str, Optional[str]]:
+    """Identifies a tenant's question bank: its questionnaire version and optional questions file."""
+    return tenant.get("questionnaire_version", DEFAULT_QUESTIONNAIRE_VERSION), tenant.get("questions_file")
+
+
+def _load_question_bank_file(path: str) -> Dict:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    # Numbers are derived from the question order, so they are dropped from the text
+    questions = {
+        cat: {lang: [(QUESTION_NUMBER_PREFIX.sub("", text, count=1), q_type, rec) for text, q_type, rec in items] for lang, items in langs.items()}
+        for cat, langs in data["questions"].items()
+    }
+    response_options = data.get("response_options") or load_static_data()[1]
+    for cat in questions:
+        for lang in questions[cat]:
+            for _, q_type, _ in questions[cat][lang]:
+                if q_type not in response_options:
+                    raise ValueError(f"Invalid question type '{q_type}' in category {cat}, language {lang}")
+    return {
+        "questions": questions,
+        "response_options": response_options,
+        "category_mapping": data.get("category_mapping") or default_category_mapping,
+        # JSON object keys are strings; questions without an estimate use action_plan.DEFAULT_EFFORT
+        "recommendation_effort": {int(number): effort for number, effort in data.get("recommendation_effort", {}).items()},
+    }
+
+
+class TenantRegistry:
+    """
+    Per-request tenant configuration with shared, size-bounded compiled assets.
+
+    Tenants are declared in a JSON file mapping tenant id to overrides of the
+    default tenant: "contact", "logo", "thresholds", "effort_budget", "questionnaire_version"
+    and "questions_file" (a JSON question bank for non-default versions).
+    Question banks, Excel formats and logo bytes are only built when a tenant is
+    actually served, and live in one BoundedLRUCache per process.
+
+    Args:
+        default_tenant: Configuration of the default tenant
+        tenants_file: Optional JSON file with additional tenants
+        max_cache_bytes: Memory cap for compiled tenant assets
+    """
+
+    def __init__(self, default_tenant: Dict, tenants_file: Optional[str] = None, max_cache_bytes: int = 64 * 1024 * 1024):
+        self.default_tenant = {"id": DEFAULT_TENANT_ID, **default_tenant}
+        self.tenants: Dict[str, Dict] = {}
+        if tenants_file and os.path.exists(tenants_file):
+            with open(tenants_file, encoding="utf-8") as f:
+                self.tenants = json.load(f)
+            logger.info("Loaded %d tenants from %s", len(self.tenants), tenants_file)
+        self.cache = BoundedLRUCache(max_cache_bytes)
+
+    def resolve(self, tenant_id: Optional[str]) -> Dict:
+        """
+        Configuration for a tenant, falling back to the default tenant.
+
+        Returns:
+            Dict: Tenant configuration with "id", "contact", "logo", "thresholds", "effort_budget",
+            "questionnaire_version" and optional "questions_file" and "brand_color"
+        """
+        overrides = self.tenants.get(tenant_id) if tenant_id else None
+        if overrides is None:
+            if tenant_id and tenant_id != DEFAULT_TENANT_ID:
+                logger.warning("Unknown tenant %r; using default configuration", tenant_id)
+            return self.default_tenant
+        tenant = copy.deepcopy(self.default_tenant)
+        for key, value in overrides.items():
+            if isinstance(value, dict) and isinstance(tenant.get(key), dict):
+                tenant[key].update(value)
+            else:
+                tenant[key] = value
+        tenant["id"] = tenant_id
+        return tenant
+
+    def question_bank(self, tenant: Dict) -> Dict:
+        """Questions, response options, category mapping and recommendation effort for the tenant's questionnaire version."""
+        version, questions_file = question_bank_key(tenant)
+
+        def build():
+            if questions_file:
+                return _load_question_bank_file(questions_file)
+            if version != DEFAULT_QUESTIONNAIRE_VERSION:
+                raise ValueError(f"Questionnaire version {version} requires a questions_file")
+            questions, response_options = load_static_data()
+            return {
+                "questions": questions,
+                "response_options": response_options,
+                "category_mapping": default_category_mapping,
+                "recommendation_effort": default_recommendation_effort,
+            }
+
+        return self.cache.get_or_create(("question_bank", version, questions_file), build)
+
+    def logo_bytes(self, tenant: Dict) -> bytes:
+        path = tenant["logo"]
+
+        def build():
+            with open(path, "rb") as f:
+                return f.read()
+
+        return self.cache.get_or_create(("logo", path), build, sizeof=len)
+
+    def excel_formats(self, tenant: Dict) -> Dict[str, Dict]:
+        """xlsxwriter format properties branded with the tenant's color."""
+        color = tenant.get("brand_color", "#1E88E5")
+        return self.cache.get_or_create(("excel_formats", color), lambda: {
+            "bold": {'bold': True},
+            "percent": {'num_format': '0.0%'},
+            "wrap": {'text_wrap': True},
+            "border": {'border': 1},
+            "header": {'bold': True, 'bg_color': color, 'color': 'white', 'border': 1},
+        })
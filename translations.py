@@ -0,0 +1,263 @@
+# Translation dictionary
+TRANSLATIONS = {
+    "Español": {
+        "title": "Auditoría Ética de Lugar de Trabajo Lean",
+        "header": "¡Diagnostica y Optimiza tu Entorno Laboral!",
+        "score": "Puntuación",
+        "percent": "Porcentaje",
+        "priority": "Prioridad",
+        "category": "Categoría",
+        "question": "Pregunta",
+        "high_priority": "Alta",
+        "medium_priority": "Media",
+        "low_priority": "Baja",
+        "report_title": "Tu Informe de Bienestar Laboral",
+        "download_excel": "Descargar Informe Excel",
+        "report_filename_excel": "resultados_auditoria_lugar_trabajo_etico.xlsx",
+        "download_html": "Descargar Informe HTML",
+        "report_filename_html": "resultados_auditoria_lugar_trabajo_etico.html",
+        "unanswered_error": "No se pueden mostrar los resultados. Hay {} preguntas sin responder. Por favor, completa todas las preguntas.",
+        "missing_questions": "Preguntas faltantes:",
+        "all_answered": "¡Todas las preguntas han sido respondidas! Revisa los resultados abajo.",
+        "response_guide": "Selecciona la descripción que mejor represente la situación para cada pregunta. Las opciones describen el grado, frecuencia o cantidad aplicable.",
+        "language_change_warning": "Cambiar el idioma reiniciará tus respuestas. ¿Deseas continuar?",
+        "reset_audit": "Reiniciar Auditoría",
+        "reset_warning": "Reiniciar la auditoría eliminará todas las respuestas. ¿Deseas continuar?",
+        "contact_info": "Contáctanos en {} o {} para soporte adicional.",
+        "high_priority_categories": "Categorías con Alta Prioridad",
+        "average_score": "Puntuación Promedio",
+        "chart_title": "Fortalezas y Oportunidades del Lugar de Trabajo",
+        "score_percent": "Puntuación (%)",
+        "question_breakdown": "Análisis Detallado: Perspectivas a Nivel de Pregunta",
+        "select_category": "Seleccionar Categoría para Explorar",
+        "question_scores_for": "Puntuaciones de Preguntas para",
+        "actionable_insights": "Perspectivas Accionables",
+        "all_categories_above_70": "¡Todas las categorías obtuvieron más del 70%! Continúa manteniendo estas fortalezas.",
+        "summary": "Resumen",
+        "results": "Resultados",
+        "findings": "Hallazgos",
+        "overall_score": "Puntuación General",
+        "grade": "Calificación",
+        "findings_summary": "Resumen de Hallazgos",
+        "findings_summary_text": "{} categorías requieren acción urgente (<{}%), {} necesitan mejoras específicas ({}-{}%). La puntuación general es {}%.",
+        "action_required": "Acción {} requerida.",
+        "findings_and_suggestions": "Hallazgos y Sugerencias",
+        "contact": "Contacto",
+        "generating_excel": "Generando Excel...",
+        "excel_error": "No se pudo generar el archivo Excel: {}",
+        "grade_excellent_desc": "Tu lugar de trabajo demuestra prácticas sobresalientes. ¡Continúa fortaleciendo estas áreas!",
+        "grade_good_desc": "Tu lugar de trabajo tiene fortalezas, pero requiere mejoras específicas para alcanzar la excelencia.",
+        "grade_needs_improvement_desc": "Se identificaron debilidades moderadas. Prioriza acciones correctivas en áreas críticas.",
+        "grade_critical_desc": "Existen problemas significativos que requieren intervención urgente. Considera apoyo externo.",
+        "suggestion": "Sugerencia",
+        "actionable_charts": "Gráficos Accionables",
+        "marketing_message": "¡Transforme su lugar de trabajo con LEAN 2.0 Institute! Colaboramos con usted para implementar soluciones sostenibles que aborden los hallazgos de esta auditoría, promoviendo un entorno laboral ético, inclusivo y productivo. Contáctenos para comenzar hoy mismo.",
+        "submit_answers": "Enviar Respuestas",
+        "reference_lines": "**Líneas de Referencia:** Discontinua = {}%, Punteada = {}%, Discontinua-Punteada = {}%",
+        "show_low_scores": "Mostrar solo preguntas que necesitan mejora (<70%)",
+        "actionable": "Accionable",
+        "peer_percentile": "Percentil entre Pares",
+        "percentile_text": "Estás en el percentil {} entre {} auditorías comparables.",
+        "not_enough_peers": "Aún no hay suficientes auditorías comparables para calcular percentiles.",
+        "resume_link": "Enlace para continuar esta auditoría más tarde",
+        "draft_restored": "Se restauraron tus respuestas guardadas.",
+        "admin_title": "Panel de Administración",
+        "admin_disabled": "El panel de administración está desactivado. Define ADMIN_TOKEN para activarlo.",
+        "admin_token": "Token de administración",
+        "admin_invalid_token": "Token no válido.",
+        "admin_organization": "Organización",
+        "admin_all_organizations": "Todas",
+        "correlation_title": "Correlación entre Preguntas y Categorías",
+        "correlation_caption": "Basado en {} auditorías completas ({} incompletas excluidas).",
+        "drivers_title": "Preguntas que Impulsan las Puntuaciones",
+        "drivers_category_correlation": "Correlación con su Categoría",
+        "drivers_overall_correlation": "Correlación con el Total",
+        "mean_score": "Puntuación Media",
+        "not_enough_audits": "Aún no hay suficientes auditorías completas para este análisis.",
+        "improvement_ranking": "Mejoras de Mayor Impacto",
+        "improvement_ranking_caption": "Recomendaciones ordenadas por cuánto subiría la puntuación general al mejorar esa respuesta.",
+        "improvement_change": "Cambio de Respuesta",
+        "improvement_gain": "Ganancia (puntos)",
+        "improvement_threshold": "Umbral Alcanzado",
+        "improvement_grade_up": "Sube la calificación general",
+        "improvement_category_up": "Sube la prioridad de la categoría",
+        "improvement_none": "Todas las respuestas ya están en el nivel más alto.",
+        "action_plan": "Plan de Acción",
+        "effort_budget": "Presupuesto de esfuerzo (días-persona)",
+        "effort_days": "Esfuerzo (días-persona)",
+        "action_plan_summary": "Este plan usa {} de {} días-persona y elevaría la puntuación general de {:.1f}% a {:.1f}%.",
+        "action_plan_empty": "Ninguna recomendación cabe en este presupuesto.",
+        "distribution_title": "Distribución de Puntuaciones",
+        "distribution_kind": "Tipo de gráfico",
+        "distribution_histogram": "Histograma",
+        "distribution_box": "Caja",
+        "distribution_violin": "Violín",
+        "distribution_caption": "Puntuaciones de {} auditorías agrupadas en el servidor.",
+        "drilldown_title": "Desglose por Organización",
+        "drilldown_site": "Sede",
+        "drilldown_department": "Departamento",
+        "drilldown_role": "Rol",
+        "drilldown_group_by": "Desglosar por",
+        "drilldown_empty": "Ninguna auditoría coincide con esta selección.",
+        "audit_count": "Auditorías",
+        "std_dev": "Desv. estándar",
+        "quality_caption": "Control de calidad: {} auditorías excluidas de las estadísticas (respuestas idénticas: {}, duplicadas: {}, no válidas: {}); {} con puntuación atípica.",
+        "org_workbook_title": "Libro de la organización",
+        "org_workbook_caption": "Una fila por encuestado con el nivel de cada respuesta, las puntuaciones, la calificación y la prioridad, lista para filtros y tablas dinámicas.",
+        "org_workbook_build": "Generar libro Excel",
+        "org_workbook_download": "Descargar libro ({} encuestados)",
+        "org_workbook_filename": "auditoria_organizacion.xlsx",
+        "search_label": "Buscar preguntas y recomendaciones",
+        "search_placeholder": "p. ej. capacitación",
+        "search_no_results": "Ninguna pregunta o recomendación coincide.",
+        "campaigns_title": "Campañas",
+        "campaigns_caption": "Cada campaña tiene su propio enlace; las respuestas enviadas desde él se agregan en la página de resultados de la campaña.",
+        "campaign_name": "Nombre de la campaña",
+        "campaign_create": "Crear campaña",
+        "campaigns_empty": "Aún no hay campañas.",
+        "campaign_line": "**{}** · {} · {} respuestas — [Enlace para encuestados]({}) · [Resultados]({})",
+        "campaign_unknown": "La campaña no existe o pertenece a otra organización.",
+        "campaign_banner": "Estás respondiendo como parte de la campaña «{}».",
+        "campaign_caption": "Organización: {} · creada el {}",
+        "campaign_responses": "Respuestas",
+        "campaign_screened_out": "Excluidas por control de calidad",
+        "campaign_no_responses": "Esta campaña aún no tiene respuestas.",
+        "campaign_back": "← Volver al panel",
+        "session_memory_caption": "Memoria de este proceso: {} sesiones, {:.1f} MB de estado de sesión y {:.1f} MB de informes generados ({:.1f} MB liberados de sesiones inactivas).",
+        "results_link": "🔗 Enlace permanente a estos resultados",
+        "invalid_results_token": "El enlace de resultados no es válido o pertenece a otro cuestionario.",
+        "page_progress": "Categoría {} de {} · {} de {} preguntas respondidas",
+        "previous_page": "← Anterior",
+        "next_page": "Siguiente →"
+    },
+    "English": {
+        "title": "Ethical Lean Workplace Audit",
+        "header": "Assess and Enhance Your Workplace!",
+        "score": "Score",
+        "percent": "Percent",
+        "priority": "Priority",
+        "category": "Category",
+        "question": "Question",
+        "high_priority": "High",
+        "medium_priority": "Medium",
+        "low_priority": "Low",
+        "report_title": "Your Workplace Wellness Report",
+        "download_excel": "Download Excel Report",
+        "report_filename_excel": "ethical_workplace_audit_results.xlsx",
+        "download_html": "Download HTML Report",
+        "report_filename_html": "ethical_workplace_audit_results.html",
+        "unanswered_error": "Cannot display results. There are {} unanswered questions. Please complete all questions.",
+        "missing_questions": "Missing Questions:",
+        "all_answered": "All questions have been answered! Review results below.",
+        "response_guide": "Select the description that best represents the situation for each question. The options describe the degree, frequency, or quantity applicable.",
+        "language_change_warning": "Changing the language will reset your responses. Do you wish to continue?",
+        "reset_audit": "Reset Audit",
+        "reset_warning": "Resetting the audit will clear all responses. Do you wish to continue?",
+        "contact_info": "Contact us at {} or {} for additional support.",
+        "high_priority_categories": "High Priority Categories",
+        "average_score": "Average Score",
+        "chart_title": "Workplace Strengths and Opportunities",
+        "score_percent": "Score (%)",
+        "question_breakdown": "Drill Down: Question-Level Insights",
+        "select_category": "Select Category to Explore",
+        "question_scores_for": "Question Scores for",
+        "actionable_insights": "Actionable Insights",
+        "all_categories_above_70": "All categories scored above 70%! Continue maintaining these strengths.",
+        "summary": "Summary",
+        "results": "Results",
+        "findings": "Findings",
+        "overall_score": "Overall Score",
+        "grade": "Grade",
+        "findings_summary": "Findings Summary",
+        "findings_summary_text": "{} categories require urgent action (<{}%), {} need specific improvements ({}-{}%). Overall score is {}%.",
+        "action_required": "{} action required.",
+        "findings_and_suggestions": "Findings and Suggestions",
+        "contact": "Contact",
+        "generating_excel": "Generating Excel...",
+        "excel_error": "Failed to generate Excel file: {}",
+        "grade_excellent_desc": "Your workplace demonstrates outstanding practices. Continue strengthening these areas!",
+        "grade_good_desc": "Your workplace has strengths but requires specific improvements to achieve excellence.",
+        "grade_needs_improvement_desc": "Moderate weaknesses identified. Prioritize corrective actions in critical areas.",
+        "grade_critical_desc": "Significant issues exist requiring urgent intervention. Consider external support.",
+        "suggestion": "Suggestion",
+        "actionable_charts": "Actionable Charts",
+        "marketing_message": "Transform your workplace with LEAN 2.0 Institute! We partner with you to implement sustainable solutions that address the findings of this audit, fostering an ethical, inclusive, and productive work environment. Contact us to start today.",
+        "submit_answers": "Submit Answers",
+        "reference_lines": "**Reference Lines:** Dashed = {}%, Dotted = {}%, Dash-Dot = {}%",
+        "show_low_scores": "Show only questions needing improvement (<70%)",
+        "actionable": "Actionable",
+        "peer_percentile": "Peer Percentile",
+        "percentile_text": "You are at the {} percentile among {} comparable audits.",
+        "not_enough_peers": "Not enough comparable audits yet to compute percentiles.",
+        "resume_link": "Link to resume this audit later",
+        "draft_restored": "Your saved answers were restored.",
+        "admin_title": "Admin Dashboard",
+        "admin_disabled": "The admin dashboard is disabled. Set ADMIN_TOKEN to enable it.",
+        "admin_token": "Admin token",
+        "admin_invalid_token": "Invalid token.",
+        "admin_organization": "Organization",
+        "admin_all_organizations": "All",
+        "correlation_title": "Question and Category Correlation",
+        "correlation_caption": "Based on {} complete audits ({} incomplete excluded).",
+        "drivers_title": "Questions Driving the Scores",
+        "drivers_category_correlation": "Correlation with Own Category",
+        "drivers_overall_correlation": "Correlation with Overall",
+        "mean_score": "Mean Score",
+        "not_enough_audits": "There are not enough complete audits for this analysis yet.",
+        "improvement_ranking": "Highest-Impact Improvements",
+        "improvement_ranking_caption": "Recommendations ranked by how much improving that answer would raise the overall score.",
+        "improvement_change": "Answer Change",
+        "improvement_gain": "Gain (points)",
+        "improvement_threshold": "Threshold Reached",
+        "improvement_grade_up": "Raises the overall grade",
+        "improvement_category_up": "Raises the category priority",
+        "improvement_none": "Every answer is already at the highest level.",
+        "action_plan": "Action Plan",
+        "effort_budget": "Effort budget (person-days)",
+        "effort_days": "Effort (person-days)",
+        "action_plan_summary": "This plan uses {} of {} person-days and would raise the overall score from {:.1f}% to {:.1f}%.",
+        "action_plan_empty": "No recommendation fits within this budget.",
+        "distribution_title": "Score Distribution",
+        "distribution_kind": "Chart type",
+        "distribution_histogram": "Histogram",
+        "distribution_box": "Box",
+        "distribution_violin": "Violin",
+        "distribution_caption": "Scores of {} audits, binned on the server.",
+        "drilldown_title": "Organization Drill-down",
+        "drilldown_site": "Site",
+        "drilldown_department": "Department",
+        "drilldown_role": "Role",
+        "drilldown_group_by": "Break down by",
+        "drilldown_empty": "No audits match this slice.",
+        "audit_count": "Audits",
+        "std_dev": "Std. dev.",
+        "quality_caption": "Quality screening: {} audits excluded from these statistics (straight-lined: {}, duplicates: {}, invalid: {}); {} with an outlying score.",
+        "org_workbook_title": "Organization workbook",
+        "org_workbook_caption": "One row per respondent with every answer level, the scores, grade and priority, ready for filters and pivot tables.",
+        "org_workbook_build": "Build Excel workbook",
+        "org_workbook_download": "Download workbook ({} respondents)",
+        "org_workbook_filename": "organization_audit.xlsx",
+        "search_label": "Search questions and recommendations",
+        "search_placeholder": "e.g. training",
+        "search_no_results": "No question or recommendation matches.",
+        "campaigns_title": "Campaigns",
+        "campaigns_caption": "Every campaign has its own link; answers submitted through it are rolled up on the campaign's results page.",
+        "campaign_name": "Campaign name",
+        "campaign_create": "Create campaign",
+        "campaigns_empty": "No campaigns yet.",
+        "campaign_line": "**{}** · {} · {} responses — [Respondent link]({}) · [Results]({})",
+        "campaign_unknown": "The campaign does not exist or belongs to another organization.",
+        "campaign_banner": "You are responding as part of the “{}” campaign.",
+        "campaign_caption": "Organization: {} · created {}",
+        "campaign_responses": "Responses",
+        "campaign_screened_out": "Screened out by quality checks",
+        "campaign_no_responses": "This campaign has no responses yet.",
+        "campaign_back": "← Back to the dashboard",
+        "session_memory_caption": "Memory in this process: {} sessions, {:.1f} MB of session state and {:.1f} MB of generated reports ({:.1f} MB released from idle sessions).",
+        "results_link": "🔗 Permanent link to these results",
+        "invalid_results_token": "This results link is invalid or belongs to another questionnaire.",
+        "page_progress": "Category {} of {} · {} of {} questions answered",
+        "previous_page": "← Previous",
+        "next_page": "Next →"
+    }
+}
@@ -0,0 +1,123 @@
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from scoring import MISSING_LEVEL, category_index, question_layout, score_levels, score_table
+
+# Threshold keys in ascending order; a score's band is the number of thresholds it reaches
+BAND_THRESHOLDS = ("CRITICAL", "NEEDS_IMPROVEMENT", "GOOD")
+
+
+def score_bands(scores: np.ndarray, thresholds: Dict) -> np.ndarray:
+    """Band of every score: 0 critical, 1 needs improvement, 2 good, 3 excellent."""
+    return np.searchsorted(np.array([thresholds[key] for key in BAND_THRESHOLDS], dtype=np.float64), scores, side="right")
+
+
+def what_if(levels: Sequence[int], questions: Dict, response_options: Dict, thresholds: Dict) -> pd.DataFrame:
+    """
+    Score every single-answer improvement of a completed audit in one vectorized batch.
+
+    Each candidate raises one question from its current level to a higher level
+    (at most questions x (levels - 1) candidates) with every other answer unchanged.
+
+    Args:
+        levels: Answer levels in questionnaire order
+        questions: Dictionary of questions by category and language
+        response_options: Response scales by question type and language
+        thresholds: Score thresholds used for grades and priorities
+
+    Returns:
+        pd.DataFrame: One row per candidate with "question" (position in questionnaire
+        order), "category", "from_level", "to_level", "steps", "gain" (overall score
+        points), "overall", "category_score", "grade_up" and "category_up" (the overall
+        grade or the category's priority band improves)
+    """
+    base = np.asarray(levels, dtype=np.uint8)
+    if (base == MISSING_LEVEL).any():
+        raise ValueError("What-if analysis needs a fully answered audit")
+    table = score_table(questions, response_options)
+    n_questions, n_levels = table.shape
+    # Raising an answer only helps when the target level scores higher than the current one
+    current = table[np.arange(n_questions), base]
+    cand_q, cand_t = np.nonzero(table > current[:, None])
+
+    batch = np.repeat(base[None, :], len(cand_q) + 1, axis=0)
+    batch[np.arange(len(cand_q)), cand_q] = cand_t
+    cat_scores, overall = score_levels(batch, questions, response_options)
+    base_cat, base_overall = cat_scores[-1], overall[-1]
+    cat_scores, overall = cat_scores[:-1], overall[:-1]
+
+    cat_of_question = category_index(questions)[cand_q]
+    new_cat = cat_scores[np.arange(len(cand_q)), cat_of_question]
+    return pd.DataFrame({
+        "question": cand_q,
+        "category": [list(questions)[c] for c in cat_of_question],
+        "from_level": base[cand_q],
+        "to_level": cand_t,
+        "steps": cand_t.astype(int) - base[cand_q].astype(int),
+        "gain": overall - base_overall,
+        "overall": overall,
+        "category_score": new_cat,
+        "grade_up": score_bands(overall, thresholds) > score_bands(base_overall, thresholds),
+        "category_up": score_bands(new_cat, thresholds) > score_bands(base_cat[cat_of_question], thresholds),
+    })
+
+
+def rank_improvements(levels: Sequence[int], questions: Dict, response_options: Dict, thresholds: Dict) -> pd.DataFrame:
+    """
+    Rank the questions' recommendations by the impact of improving their answer.
+
+    For every question the smallest raise that lifts the overall grade or the
+    category's priority band is chosen, falling back to a one-level raise. Questions
+    are ordered by grade changes first, then category band changes, then overall
+    score gain per level raised.
+
+    Returns:
+        pd.DataFrame: what_if columns for one chosen candidate per question, ranked
+    """
+    candidates = what_if(levels, questions, response_options, thresholds)
+    if candidates.empty:
+        return candidates
+    candidates["crosses"] = candidates["grade_up"] | candidates["category_up"]
+    candidates["gain_per_step"] = candidates["gain"] / candidates["steps"]
+    # Per question: the first threshold-crossing raise if any, else the smallest raise
+    chosen = candidates.sort_values(["question", "crosses", "to_level"], ascending=[True, False, True])
+    chosen = chosen.drop_duplicates("question")
+    ranked = chosen.sort_values(
+        ["grade_up", "category_up", "gain_per_step", "question"],
+        ascending=[False, False, False, True]
+    )
+    return ranked.drop(columns="crosses").reset_index(drop=True)
+
+
+def improvement_frame(
+    ranking: pd.DataFrame,
+    questions: Dict,
+    response_options: Dict,
+    language: str,
+    labels: Dict,
+    category_mapping: Dict
+) -> pd.DataFrame:
+    """Localized view of rank_improvements with the recommendation text and answer descriptions."""
+    layout = question_layout(questions)
+    display_names = {v: k for k, v in category_mapping[language].items()}
+    rows = []
+    for item in ranking.itertuples(index=False):
+        cat, q_idx, q_type = layout[item.question]
+        _, _, recommendation = questions[cat][language][q_idx]
+        descriptions = response_options[q_type][language]["descriptions"]
+        rows.append({
+            labels["suggestion"]: recommendation,
+            labels["category"]: display_names[cat],
+            labels["question"]: item.question + 1,
+            labels["improvement_change"]: f"{descriptions[item.from_level]} → {descriptions[item.to_level]}",
+            labels["improvement_gain"]: round(float(item.gain), 1),
+            labels["overall_score"]: round(float(item.overall), 1),
+            labels["improvement_threshold"]: (
+                labels["improvement_grade_up"] if item.grade_up
+                else labels["improvement_category_up"] if item.category_up
+                else ""
+            ),
+        })
+    return pd.DataFrame(rows)